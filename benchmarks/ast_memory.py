@@ -0,0 +1,59 @@
+"""Measure the memory used by the AST nodes of a large generated program.
+
+Usage: python benchmarks/ast_memory.py
+"""
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.append(os.getcwd())
+
+from benchmarks.programs import generate_program
+from cool.parsing import OffsetLexer, PositionParser
+from cool.semantics.utils import astnodes as ast
+
+
+def walk(node):
+    """Yield every AST node reachable from the given one"""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, ast.Node):
+            yield current
+            names = [name for cls in type(current).__mro__ for name in getattr(cls, '__slots__', ())]
+            values = [getattr(current, name, None) for name in names] if not hasattr(current, '__dict__') else list(
+                vars(current).values())
+            stack.extend(values)
+        elif isinstance(current, (list, tuple)):
+            stack.extend(current)
+
+
+def node_size(node) -> int:
+    size = sys.getsizeof(node)
+    if hasattr(node, '__dict__'):
+        size += sys.getsizeof(node.__dict__)
+    return size
+
+
+def main():
+    text = generate_program(classes=200, methods=10, statements=10)
+    tokens = OffsetLexer()(text)
+
+    gc.collect()
+    tracemalloc.start()
+    program = PositionParser()(tokens)
+    del tokens
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    nodes = list(walk(program))
+    total = sum(node_size(node) for node in nodes)
+    print(f'Nodes : {len(nodes)}')
+    print(f'Node objects : {total / len(nodes):.1f} bytes per node')
+    print(f'Whole AST (lists, lexemes and positions included) : {retained / len(nodes):.1f} bytes per node')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""Measure the execution of the programs of tests/execution as jobs, starting a `python -m cool run` for each one and
+sending them to a pool of warm workers.
+
+Usage: python benchmarks/batch_jobs.py [repetitions] [workers]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from glob import glob
+
+sys.path.append(os.getcwd())
+
+from cool.service import SUCCESS, WorkerPool
+
+INPUT = '7\nfoo\n3\n4\n5\n'
+
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    paths = sorted(glob(os.path.join('tests', 'execution', '*.cl'))) * repetitions
+    jobs = []
+    for i, path in enumerate(paths):
+        with open(path) as file:
+            jobs.append({'id': i, 'source': file.read(), 'stdin': INPUT})
+
+    t = time.perf_counter()
+    for path in paths:
+        with tempfile.TemporaryFile() as sink:
+            subprocess.run([sys.executable, '-m', 'cool', 'run', path], input=INPUT.encode(), stdout=sink,
+                           stderr=subprocess.DEVNULL, check=True)
+    print(f'{"processes":>10} : {time.perf_counter() - t:8.3f} s  {len(paths)} jobs')
+
+    t = time.perf_counter()
+    with WorkerPool(workers) as pool:
+        started = time.perf_counter() - t
+        results = [pool.run(job) for job in jobs]
+    print(f'{"pool":>10} : {time.perf_counter() - t:8.3f} s  {len(paths)} jobs, {started:.3f} s starting the workers, '
+          f'{sum(result["status"] == SUCCESS for result in results)} succeeded')
+
+
+if __name__ == '__main__':
+    main()
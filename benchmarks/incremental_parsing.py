@@ -0,0 +1,38 @@
+"""Compare a full parse of a large program against the incremental reparse of a single method edit. Each edit is
+followed by a read of the location of a node after the edited method, as an editor that reports positions does.
+
+Usage: python benchmarks/incremental_parsing.py
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.getcwd())
+
+from benchmarks.programs import generate_program
+from cool.parsing import IncrementalParser
+
+
+def main():
+    text = generate_program(classes=100, methods=10, statements=6)
+    print('Lines :', text.count('\n') + 1)
+
+    parser = IncrementalParser()
+    t = time.perf_counter()
+    parser.parse(text)
+    print(f'Full parse : {(time.perf_counter() - t) * 1000:.3f} ms')
+
+    offset = text.index('y <- y + 3', len(text) // 2) + len('y <- y + ')
+    repetitions = 1000
+    size = len(parser.positions)
+    t = time.perf_counter()
+    for i in range(repetitions):
+        program = parser.edit(offset, offset + 1, str(i % 10))
+        parser.positions.location(program.declarations[-1].features[-1].body)
+    elapsed = (time.perf_counter() - t) / repetitions
+    print(f'Single method edit : {elapsed * 1000:.3f} ms (full parses: {parser.full_parses})')
+    print(f'Position table : {size} nodes before the edits, {len(parser.positions)} after')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Measure the semantic analysis of a large generated program where the declared types are AUTO_TYPE without cache,
+with an empty cache and with the cache of the same program after changing the body of one method. The methods of each
+class get their own names, so the features of different classes do not share types. The times include grouping and
+fingerprinting the features, and the warm run must be faster than the run without cache.
+
+Usage: python benchmarks/inference_cache.py [classes] [methods] [statements]
+"""
+import os
+import re
+import sys
+import tempfile
+import time
+
+sys.path.append(os.getcwd())
+
+from benchmarks.programs import generate_program
+from cool import check_semantics
+from cool.parsing import OffsetLexer, PositionParser
+from cool.semantics.inference_cache import InferenceCache
+from cool.semantics.utils.positions import PositionTable
+from cool.semantics.utils.scope import Context, Scope
+
+
+def independent_program(classes: int, methods: int, statements: int) -> str:
+    text = generate_program(classes, methods, statements).replace(': Int', ': AUTO_TYPE')
+    main, *declarations = text.split('\nclass ')
+    declarations = [re.sub(r'method(\d+)', f'method\\1_{i}', declaration) for i, declaration in enumerate(declarations)]
+    return '\nclass '.join([main.replace('method0', 'method0_0')] + declarations)
+
+
+def measure(name: str, text: str, cache=None) -> float:
+    program = PositionParser()(OffsetLexer()(text), PositionTable(text))
+    stats = {}
+    t = time.perf_counter()
+    _, _, _, errors = check_semantics(program, Scope(), Context(), [], stats, cache=cache)
+    elapsed = time.perf_counter() - t
+    print(f'{name:>10} : {elapsed:8.3f} s  solved: {stats["solved"]}, cached groups: {stats.get("cached_groups", 0)}')
+    assert not errors, errors[:10]
+    return elapsed
+
+
+def main():
+    classes, methods, statements = (int(arg) for arg in (sys.argv[1:] + ['200', '10', '10'][len(sys.argv) - 1:]))
+    text = independent_program(classes, methods, statements)
+    changed = text[:text.rindex('y <- y + 0')] + 'y <- y + 7' + text[text.rindex('y <- y + 0') + len('y <- y + 0'):]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'inference.json')
+        uncached = measure('no cache', text)
+        measure('cold', text, InferenceCache(path))
+        warm = measure('warm', changed, InferenceCache(path))
+
+    assert warm < uncached, f'the warm run ({warm:.3f} s) is not faster than the run without cache ({uncached:.3f} s)'
+
+
+if __name__ == '__main__':
+    main()
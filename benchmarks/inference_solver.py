@@ -0,0 +1,58 @@
+"""Measure the type inference of large generated programs where the declared types are AUTO_TYPE: the usual generated
+program and a program whose attributes are assigned in a long cycle and receive types of a deep hierarchy, with both
+inference engines.
+
+Usage: python benchmarks/inference_solver.py [classes] [methods] [statements]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.getcwd())
+
+from benchmarks.programs import generate_program
+from cool.parsing import OffsetLexer, PositionParser
+from cool.semantics import OverriddenMethodChecker, TypeBuilder, TypeCollector, topological_sorting
+from cool.semantics.type_inference import INFERENCE_ENGINES, InferenceChecker
+from cool.semantics.utils.scope import Context, Scope
+
+
+def cyclic_program(attributes: int, depth: int) -> str:
+    lines = ['class Main {']
+    lines += [f'    a{i}: AUTO_TYPE;' for i in range(attributes)]
+    lines.append('    main(): Object {{')
+    lines += [f'        a{i} <- a{(i + 1) % attributes};' for i in range(attributes)]
+    lines += [f'        a{(i * 7919) % attributes} <- new T{i};' for i in range(depth)]
+    lines += ['        0;', '    }};', '};']
+    lines += [f'class T{i}{f" inherits T{i - 1}" if i else ""} {{}};' for i in range(depth)]
+    return '\n'.join(lines)
+
+
+def measure(name: str, text: str, engine: str):
+    program = PositionParser()(OffsetLexer()(text))
+    context, errors = Context(), []
+
+    TypeCollector(context, errors).visit(program)
+    TypeBuilder(context, errors).visit(program)
+    topological_sorting(program, context, errors)
+    OverriddenMethodChecker(context, errors).visit(program)
+
+    checker = InferenceChecker(context, errors, engine)
+    t = time.perf_counter()
+    checker.visit(program, Scope())
+    elapsed = time.perf_counter() - t
+    print(f'{name:>10} {engine:>12} : {elapsed:8.3f} s  {checker.graph.stats}')
+    assert not errors, errors[:10]
+
+
+def main():
+    classes, methods, statements = (int(arg) for arg in (sys.argv[1:] + ['200', '10', '10'][len(sys.argv) - 1:]))
+    generated = generate_program(classes, methods, statements).replace(': Int', ': AUTO_TYPE')
+    cyclic = cyclic_program(classes * 10, 30)
+    for engine in INFERENCE_ENGINES:
+        measure('generated', generated, engine)
+        measure('cyclic', cyclic, engine)
+
+
+if __name__ == '__main__':
+    main()
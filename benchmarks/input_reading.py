@@ -0,0 +1,77 @@
+"""Measure a program that reads and adds many integers, reading the input from a pipe-like stream in chunks and
+from a file mapped in memory, and the reader alone against a call to input() per line.
+
+Usage: python benchmarks/input_reading.py [values]
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.getcwd())
+
+from cool import check_semantics
+from cool.parsing import OffsetLexer, PositionParser
+from cool.semantics.execution import Executor, Input, Output
+from cool.semantics.utils.scope import Context, Scope
+
+PROGRAM = '''class Main inherits IO {
+    main(): Object {
+        let i: Int <- 0, sum: Int <- 0 in {
+            while i < %d loop {
+                sum <- sum + in_int();
+                i <- i + 1;
+            } pool;
+            out_int(sum);
+        }
+    };
+}
+'''
+
+
+def measure(name: str, fn):
+    t = time.perf_counter()
+    result = fn()
+    print(f'{name:>16} : {time.perf_counter() - t:8.3f} s  {result}')
+
+
+def main():
+    values = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    data = ''.join(f'{i}\n' for i in range(values)).encode()
+
+    program = PositionParser()(OffsetLexer()(PROGRAM % values))
+    _, _, context, errors = check_semantics(program, Scope(), Context(), [])
+    assert not errors, errors
+
+    def execute(reader: Input):
+        sink = io.BytesIO()
+        Executor(context, Output(sink), reader).visit(program, Scope())
+        return sink.getvalue().decode()
+
+    def read_all(readline):
+        count = 0
+        while readline() is not None:
+            count += 1
+        return count
+
+    def read_input():
+        stdin, sys.stdin = sys.stdin, io.TextIOWrapper(io.BytesIO(data))
+        try:
+            for _ in range(values):
+                input()
+            return values
+        finally:
+            sys.stdin = stdin
+
+    with tempfile.NamedTemporaryFile(suffix='.txt') as file:
+        file.write(data)
+        file.flush()
+        measure('input()', read_input)
+        measure('reader', lambda: read_all(Input(io.BufferedReader(io.BytesIO(data))).readline))
+        measure('program stream', lambda: execute(Input(io.BufferedReader(io.BytesIO(data)))))
+        measure('program mmap', lambda: execute(Input.from_file(file.name)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Measure how the parsing time of long sequences (statements of a block and classes of a program) scales with
+their length.
+
+Usage: python benchmarks/list_productions.py [max_statements] [max_classes]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.getcwd())
+
+from cool.parsing import OffsetLexer, PositionParser
+
+
+def block_program(statements: int) -> str:
+    body = '\n'.join('        x <- x + 1;' for _ in range(statements))
+    return f'class Main {{\n    x: Int;\n    main(): Int {{{{\n{body}\n    }}}};\n}}\n'
+
+
+def classes_program(classes: int) -> str:
+    return '\n'.join(f'class Class{i} {{\n    x: Int <- {i};\n}}' for i in range(classes))
+
+
+def measure(name: str, text: str):
+    tokens = OffsetLexer()(text)
+    t = time.perf_counter()
+    PositionParser()(tokens)
+    elapsed = time.perf_counter() - t
+    print(f'{name:>24} : {elapsed:8.3f} s  ({elapsed / len(tokens) * 1e6:.2f} us per token)')
+
+
+def main():
+    max_statements = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    max_classes = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+
+    for n in (max_statements // 4, max_statements // 2, max_statements):
+        measure(f'{n} statements block', block_program(n))
+
+    for n in (max_classes // 4, max_classes // 2, max_classes):
+        measure(f'{n} classes', classes_program(n))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Measure a program that writes many small values to a file, writing every value and with the default buffer.
+
+Usage: python benchmarks/output_buffering.py [values]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.getcwd())
+
+from cool import check_semantics
+from cool.parsing import OffsetLexer, PositionParser
+from cool.semantics.execution import Executor, Output
+from cool.semantics.utils.scope import Context, Scope
+
+PROGRAM = '''class Main inherits IO {
+    main(): Object {
+        let i: Int <- 0 in
+            while i < %d loop {
+                out_int(i);
+                out_string(" ");
+                i <- i + 1;
+            } pool
+    };
+}
+'''
+
+
+def measure(name: str, values: int, buffer_size: int):
+    program = PositionParser()(OffsetLexer()(PROGRAM % values))
+    _, _, context, errors = check_semantics(program, Scope(), Context(), [])
+    assert not errors, errors
+
+    with tempfile.TemporaryFile() as sink:
+        t = time.perf_counter()
+        Executor(context, Output(sink, buffer_size)).visit(program, Scope())
+        print(f'{name:>10} : {time.perf_counter() - t:8.3f} s  {sink.tell()} bytes')
+
+
+def main():
+    values = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    measure('unbuffered', values, 0)
+    measure('buffered', values, 1 << 16)
+
+
+if __name__ == '__main__':
+    main()
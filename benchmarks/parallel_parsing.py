@@ -0,0 +1,35 @@
+"""Compare the sequential parse of a program with thousands of classes against `parse_parallel`.
+
+Usage: python benchmarks/parallel_parsing.py [classes] [jobs]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.getcwd())
+
+from benchmarks.programs import generate_program
+from cool.parsing import parse_parallel
+
+
+def measure(name: str, text: str, jobs: int):
+    t = time.perf_counter()
+    program, errors = parse_parallel(text, jobs)
+    elapsed = time.perf_counter() - t
+    assert program is not None and not errors
+    print(f'{name:>16} : {elapsed:8.3f} s')
+
+
+def main():
+    classes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    jobs = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    text = generate_program(classes, 5, 3)
+    print(f'{classes} classes, {text.count(chr(10))} lines, {os.cpu_count()} cpus')
+
+    measure('sequential', text, 1)
+    for n in sorted({2, jobs}):
+        measure(f'{n} jobs', text, n)
+
+
+if __name__ == '__main__':
+    main()
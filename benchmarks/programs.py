@@ -0,0 +1,21 @@
+"""Generators of large synthetic Cool programs used by the benchmarks"""
+
+
+def generate_program(classes: int = 100, methods: int = 10, statements: int = 5) -> str:
+    """Return a valid Cool program with the given number of classes, methods per class and statements per method"""
+    lines = ['class Main inherits IO {', '    main(): Object {', '        out_int((new Class0).method0(1))', '    };', '}', '']
+    for i in range(classes):
+        parent = f' inherits Class{i - 1}' if i else ''
+        lines.append(f'class Class{i}{parent} {{')
+        lines.append(f'    attribute{i}: Int <- {i};')
+        for j in range(methods):
+            lines.append(f'    method{j}(x: Int): Int {{')
+            lines.append('        let y: Int <- x in {')
+            for k in range(statements):
+                lines.append(f'            y <- y + {k} * attribute{i};')
+            lines.append('            y;')
+            lines.append('        }')
+            lines.append('    };')
+        lines.append('}')
+        lines.append('')
+    return '\n'.join(lines)
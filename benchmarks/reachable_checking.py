@@ -0,0 +1,39 @@
+"""Measure the semantic analysis of a large generated program checking all its features and only the features that
+are reachable from Main.main, as `cool run` does.
+
+Usage: python benchmarks/reachable_checking.py [classes] [methods] [statements]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.getcwd())
+
+from benchmarks.programs import generate_program
+from cool import check_semantics
+from cool.parsing import OffsetLexer, PositionParser
+from cool.semantics.reachability import reachable_features
+from cool.semantics.utils.scope import Context, Scope
+
+
+def measure(name: str, text: str, reachable_only: bool):
+    program = PositionParser()(OffsetLexer()(text))
+    t = time.perf_counter()
+    _, _, _, errors = check_semantics(program, Scope(), Context(), [], reachable_only=reachable_only)
+    print(f'{name:>10} : {time.perf_counter() - t:8.3f} s')
+    assert not errors, errors[:10]
+
+
+def main():
+    classes, methods, statements = (int(arg) for arg in (sys.argv[1:] + ['200', '10', '10'][len(sys.argv) - 1:]))
+    text = generate_program(classes, methods, statements)
+
+    program = PositionParser()(OffsetLexer()(text))
+    features = sum(len(klass.features) for klass in program.declarations)
+    print(f'reachable features: {len(reachable_features(program))} of {features}')
+    measure('all', text, False)
+    measure('reachable', text, True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Measure the execution of the programs of tests/execution and of a recursive program that runs for a while without
+profiling, with the sampler and with the instrumenting profiler. Each program runs several times and the best time is
+kept.
+
+Usage: python benchmarks/sampling_overhead.py [repetitions] [interval]
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+from glob import glob
+
+sys.path.append(os.getcwd())
+
+from cool import check_semantics
+from cool.parsing import OffsetLexer, PositionParser
+from cool.semantics.execution import ExecutionError, Executor, Input, Output
+from cool.semantics.profiler import Profiler, Sampler
+from cool.semantics.utils.positions import PositionTable
+from cool.semantics.utils.scope import Context, Scope
+
+INPUT = b'7\nfoo\n3\n4\n5\n' * 100
+
+FIBONACCI = '''class Main inherits IO {
+    fib(n: Int): Int {
+        if n < 2 then n else fib(n - 1) + fib(n - 2) fi
+    };
+
+    main(): Object {
+        out_int(fib(20))
+    };
+}
+'''
+
+
+def execute(program, context, sampler=None, profiler=None) -> float:
+    with tempfile.TemporaryFile() as sink:
+        executor = Executor(context, Output(sink), Input(io.BytesIO(INPUT)), profiler=profiler)
+        t = time.perf_counter()
+        if sampler is not None:
+            sampler.start(executor.frames)
+        try:
+            executor.visit(program, Scope())
+        except ExecutionError:
+            pass
+        finally:
+            if sampler is not None:
+                sampler.stop()
+        return time.perf_counter() - t
+
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    interval = float(sys.argv[2]) if len(sys.argv) > 2 else 0.005
+
+    totals = {'plain': 0.0, 'sampled': 0.0, 'profiled': 0.0}
+    samples = 0
+    sources = []
+    for path in sorted(glob(os.path.join('tests', 'execution', '*.cl'))):
+        with open(path) as file:
+            sources.append((os.path.basename(path), file.read()))
+    sources.append(('fibonacci', FIBONACCI))
+
+    for name, text in sources:
+        program = PositionParser()(OffsetLexer()(text), PositionTable(text))
+        _, _, context, errors = check_semantics(program, Scope(), Context(), [])
+        if errors:
+            continue
+
+        plain = min(execute(program, context) for _ in range(repetitions))
+        samplers = [Sampler(interval, program.positions) for _ in range(repetitions)]
+        sampled = min(execute(program, context, sampler) for sampler in samplers)
+        profiled = min(execute(program, context, profiler=Profiler()) for _ in range(repetitions))
+        samples += sum(sum(sampler.samples.values()) for sampler in samplers)
+
+        totals['plain'] += plain
+        totals['sampled'] += sampled
+        totals['profiled'] += profiled
+        print(f'{name:>16} : {plain:8.4f} s  sampled {sampled:8.4f} s  profiled {profiled:8.4f} s')
+
+    for name, total in totals.items():
+        print(f'{name:>16} : {total:8.4f} s  {100 * (total / totals["plain"] - 1):+6.1f} %')
+    print(f'{"samples":>16} : {samples}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Measure the time of each semantic pass over a large generated program.
+
+Usage: python benchmarks/semantic_passes.py [classes] [methods] [statements]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.getcwd())
+
+from benchmarks.programs import generate_program
+from cool.parsing import OffsetLexer, PositionParser
+from cool.semantics import (CodeBuilder, OverriddenMethodChecker, TypeBuilder, TypeChecker, TypeCollector,
+                            topological_sorting)
+from cool.semantics.type_inference import InferenceChecker
+from cool.semantics.utils.scope import Context, Scope
+
+
+def measure(name: str, fn, *args):
+    t = time.perf_counter()
+    fn(*args)
+    print(f'{name:>24} : {time.perf_counter() - t:8.3f} s')
+
+
+def main():
+    classes, methods, statements = (int(arg) for arg in (sys.argv[1:] + ['200', '10', '10'][len(sys.argv) - 1:]))
+    text = generate_program(classes, methods, statements)
+    program = PositionParser()(OffsetLexer()(text))
+    context, scope, errors = Context(), Scope(), []
+
+    measure('TypeCollector', TypeCollector(context, errors).visit, program)
+    measure('TypeBuilder', TypeBuilder(context, errors).visit, program)
+    measure('topological_sorting', topological_sorting, program, context, errors)
+    measure('OverriddenMethodChecker', OverriddenMethodChecker(context, errors).visit, program)
+    measure('InferenceChecker', InferenceChecker(context, errors).visit, program, scope)
+    measure('TypeChecker', TypeChecker(context, errors).visit, program, scope)
+    measure('CodeBuilder', CodeBuilder().visit, program, 0)
+    assert not errors, errors
+
+
+if __name__ == '__main__':
+    main()
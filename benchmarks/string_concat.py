@@ -0,0 +1,63 @@
+"""Measure a program that builds a string of `megabytes` MB concatenating a 100 characters literal in a loop, with the
+rope representation of the strings and with a flat concatenation of Python strings (only up to 1 MB, it is quadratic).
+
+Usage: python benchmarks/string_concat.py [megabytes]
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.append(os.getcwd())
+
+from cool import check_semantics
+from cool.parsing import OffsetLexer, PositionParser
+from cool.semantics import execution
+from cool.semantics.execution import Executor, Instance, Output
+from cool.semantics.utils.scope import Context, Scope
+
+PROGRAM = '''class Main inherits IO {
+    main(): Object {
+        let i: Int <- 0, s: String <- "" in {
+            while i < %d loop {
+                s <- s.concat("%s");
+                i <- i + 1;
+            } pool;
+            out_int(s.length());
+            out_string(s.substr(0, 1));
+        }
+    };
+}
+'''
+
+
+def flat_concat(obj, s, executor):
+    return Instance(executor.context.get_type('String'), str(obj.value) + str(s.value))
+
+
+def measure(name: str, megabytes: float):
+    program = PositionParser()(OffsetLexer()(PROGRAM % (int(megabytes * 10000), 'x' * 100)))
+    _, _, context, errors = check_semantics(program, Scope(), Context(), [])
+    assert not errors, errors
+
+    sink = io.BytesIO()
+    t = time.perf_counter()
+    Executor(context, Output(sink)).visit(program, Scope())
+    print(f'{name:>6} {megabytes:5} MB : {time.perf_counter() - t:8.3f} s  {sink.getvalue().decode()}')
+
+
+def main():
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    measure('rope', 1)
+    measure('rope', megabytes)
+
+    rope_concat = execution.defaults['String', 'concat']
+    execution.defaults['String', 'concat'] = flat_concat
+    try:
+        measure('flat', 1)
+    finally:
+        execution.defaults['String', 'concat'] = rope_concat
+
+
+if __name__ == '__main__':
+    main()
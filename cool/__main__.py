@@ -1,7 +1,10 @@
+import json
 import os
+import signal
 import sys
+from enum import Enum
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
 import typer
 
@@ -10,16 +13,33 @@ sys.path.append(os.getcwd())
 from cool.grammar import serialize_parser_and_lexer
 from cool.lexertab import CoolLexer
 from cool.parsertab import CoolParser
+from cool.parsing import OffsetLexer, PositionParser, parse_parallel
 from cool.semantics import TypeCollector, TypeBuilder, OverriddenMethodChecker, TypeChecker, topological_sorting
-from cool.semantics.execution import Executor, ExecutionError
+from cool.semantics.execution import Executor, ExecutionError, Input, LimitError, Limits, Output
 from cool.semantics.formatter import CodeBuilder
+from cool.semantics.coverage import Coverage
+from cool.semantics.profiler import Profiler, Sampler
+from cool.semantics.inference_cache import InferenceCache
+from cool.semantics.reachability import reachable_features
 from cool.semantics.type_inference import InferenceChecker
+from cool.semantics.utils.positions import PositionTable
 from cool.semantics.utils.scope import Context, Scope
 
 app = typer.Typer()
 
 
-def check_semantics(ast, scope: Scope, context: Context, errors: List[str]):
+class Engine(str, Enum):
+    graph = 'graph'
+    unification = 'unification'
+
+
+def check_semantics(ast, scope: Scope, context: Context, errors: List[str], stats: Optional[Dict[str, int]] = None,
+                    engine: str = 'graph', cache: Optional[InferenceCache] = None, dump_graph: Optional[Path] = None,
+                    reachable_only: bool = False):
+    """Check the program, with `reachable_only` only the features reachable from `Main.main` are type checked. All the
+    features are inferred, since a call in dead code also constrains the types inferred for the reachable one"""
+    if cache is not None:
+        cache.apply(ast)
     TypeCollector(context, errors).visit(ast)
     TypeBuilder(context, errors).visit(ast)
     declarations = ast.declarations
@@ -27,18 +47,36 @@ def check_semantics(ast, scope: Scope, context: Context, errors: List[str]):
     ast.declarations = declarations
     if not errors:
         OverriddenMethodChecker(context, errors).visit(ast)
-        InferenceChecker(context, errors).visit(ast, scope)
-        TypeChecker(context, errors).visit(ast, scope)
+        reachable = reachable_features(ast) if reachable_only else None
+        inference = InferenceChecker(context, errors, engine, cache.cached if cache is not None else None)
+        inference.visit(ast, scope)
+        if stats is not None:
+            stats.update(inference.graph.stats)
+        if dump_graph is not None:
+            if dump_graph.suffix == '.dot':
+                dump_graph.write_text(inference.graph.to_dot(inference.timings))
+            else:
+                dump_graph.write_text(json.dumps(inference.graph.to_dict(inference.timings), indent=2))
+        TypeChecker(context, errors, reachable).visit(ast, scope)
+        if cache is not None:
+            if not errors:
+                cache.store()
+            if stats is not None:
+                stats.update(cache.stats)
     return ast, scope, context, errors
 
 
-def tokenize(file: str, verbose: bool = False):
+def read(file: str) -> str:
     path = Path.cwd() / file
     if not path.exists():
         typer.echo(f'File {file} does not exist.')
         exit()
-    s = path.open('r').read()
-    lexer = CoolLexer()
+    return path.open('r').read()
+
+
+def tokenize(file: str, verbose: bool = False, positions: bool = False):
+    s = read(file)
+    lexer = OffsetLexer() if positions else CoolLexer()
     tokens = lexer(s)
 
     if lexer.contain_errors:
@@ -52,52 +90,180 @@ def tokenize(file: str, verbose: bool = False):
     return tokens, lexer
 
 
-def parse(file: str, verbose: bool = False):
-    tokens, lexer = tokenize(file, verbose)
+def parse(file: str, verbose: bool = False, jobs: int = 1, positions: bool = False):
+    """Parse the file and return the AST and the syntactic errors, with more than one job the classes are parsed
+    in parallel. Recording the `positions` of the nodes makes the parse slower, so it is only done for the options
+    that need them"""
+    if jobs > 1 and not verbose:
+        ast, errors = parse_parallel(read(file), jobs, positions)
+        for e in errors:
+            typer.echo(e, err=True)
+        return ast, errors
+
+    tokens, lexer = tokenize(file, verbose, positions)
 
     if lexer.contain_errors:
-        return None, None
+        return None, lexer.errors
 
-    parser = CoolParser(verbose)
-    ast = parser(tokens)
+    if positions:
+        parser = PositionParser(verbose)
+        ast = parser(tokens, PositionTable(lexer.text))
+    else:
+        parser = CoolParser(verbose)
+        ast = parser(tokens)
 
     if parser.contains_errors:
         for e in parser.errors:
             typer.echo(e, err=True)
 
-    return ast, parser
+    return ast, parser.errors
 
 
 @app.command()
-def infer(file: str, verbose: bool = False):
-    ast, _ = parse(file, verbose)
+def infer(file: str, verbose: bool = False, jobs: int = typer.Option(1, help='Number of processes used to parse'),
+          stats: bool = typer.Option(False, help='Report the size of the inference graph and the solver iterations'),
+          engine: Engine = typer.Option(Engine.graph, help='Algorithm used to solve the AUTO_TYPE declarations'),
+          cache: Optional[Path] = typer.Option(None, help='JSON file that keeps the inferred types between runs, so '
+                                                          'only the changed methods are inferred again'),
+          dump_graph: Optional[Path] = typer.Option(None, help='Write the solved inference graph and the time of each '
+                                                               'phase to a .dot or .json file')):
+    if dump_graph is not None and dump_graph.suffix not in ('.dot', '.json'):
+        typer.echo(f'Unknown graph format "{dump_graph.suffix}", use a .dot or .json file.', err=True)
+        raise typer.Exit(1)
+
+    ast, _ = parse(file, verbose, jobs, positions=cache is not None)
 
     if ast is not None:
-        ast, _, _, errors = check_semantics(ast, Scope(), Context(), [])
+        inference_stats = {}
+        inference_cache = InferenceCache(cache) if cache is not None else None
+        ast, _, _, errors = check_semantics(ast, Scope(), Context(), [], inference_stats, engine.value,
+                                            inference_cache, dump_graph)
         if errors:
             for e in errors:
                 typer.echo(e, err=True)
         typer.echo(CodeBuilder().visit(ast, 0))
 
+        if stats:
+            typer.echo(', '.join(f'{key}: {value}' for key, value in inference_stats.items()), err=True)
+
 
 @app.command()
-def run(file: str, verbose: bool = False):
-    ast, parser = parse(file, verbose)
+def run(file: str, verbose: bool = False, jobs: int = typer.Option(1, help='Number of processes used to parse'),
+        prune: bool = typer.Option(True, help='Only type check the methods that are reachable from Main.main'),
+        output: Optional[Path] = typer.Option(None, help='Write the output of the program to this file'),
+        buffer_size: int = typer.Option(1 << 16, help='Bytes of output buffered before writing them, 0 writes '
+                                                      'every value'),
+        stdin_file: Optional[Path] = typer.Option(None, exists=True, dir_okay=False,
+                                                  help='Read the input of the program from this file instead of the '
+                                                       'standard input'),
+        profile: bool = typer.Option(False, help='Report the calls, time and allocations of each method'),
+        profile_stacks: Optional[Path] = typer.Option(None, help='Write the time of each call stack to this file in '
+                                                                 'the collapsed format of the flame graph tools'),
+        sample: Optional[Path] = typer.Option(None, help='Sample the call stack periodically and write the samples of '
+                                                         'each stack to this file in the collapsed format of the flame '
+                                                         'graph tools'),
+        sample_interval: float = typer.Option(0.005, help='Seconds between two samples of the call stack'),
+        coverage: Optional[Path] = typer.Option(None, help='Write the source annotated with the evaluations of each '
+                                                           'line to this file'),
+        coverage_json: Optional[Path] = typer.Option(None, help='Write the evaluations of each line and expression '
+                                                                'to this JSON file'),
+        max_steps: Optional[int] = typer.Option(None, help='Stop the program after this number of method calls and '
+                                                           'loop iterations'),
+        max_objects: Optional[int] = typer.Option(None, help='Stop the program after creating this number of objects'),
+        max_heap: Optional[int] = typer.Option(None, help='Stop the program after creating this estimated number of '
+                                                          'bytes of objects and strings'),
+        timeout: Optional[float] = typer.Option(None, help='Stop the program after this number of seconds')):
+    ast, syntax_errors = parse(file, verbose, jobs, sample is not None or coverage is not None or
+                               coverage_json is not None)
 
     if ast is not None:
-        ast, _, context, errors = check_semantics(ast, Scope(), Context(), [])
+        ast, _, context, errors = check_semantics(ast, Scope(), Context(), [], reachable_only=prune)
 
-        if not errors and not parser.contains_errors:
+        if not errors and not syntax_errors:
+            sink = output.open('wb') if output is not None else None
+            profiler = Profiler() if profile or profile_stacks is not None else None
+            sampler = Sampler(sample_interval, ast.positions) if sample is not None else None
+            counter = Coverage(ast) if coverage is not None or coverage_json is not None else None
             try:
-                Executor(context).visit(ast, Scope())
+                reader = Input.from_file(stdin_file) if stdin_file is not None else Input()
+                limits = Limits(max_steps, max_objects, max_heap, timeout)
+                executor = Executor(context, Output(sink, buffer_size), reader, profiler=profiler, coverage=counter,
+                                    limits=limits)
+                if sampler is not None:
+                    sampler.start(executor.frames)
+                executor.visit(ast, Scope())
                 typer.echo('Program finished...')
+            except LimitError as e:
+                typer.echo(e.text, err=True)
+                typer.echo(', '.join(f'{key}: {value:.3f} s' if key == 'time' else f'{key}: {value}'
+                                     for key, value in e.stats.items()), err=True)
             except ExecutionError as e:
                 typer.echo(e.text, err=True)
+            finally:
+                if sink is not None:
+                    sink.close()
+                if profile:
+                    typer.echo(profiler.report(), err=True)
+                if profile_stacks is not None:
+                    profile_stacks.write_text(profiler.collapsed_stacks())
+                if sampler is not None:
+                    sampler.stop()
+                    sample.write_text(sampler.collapsed_stacks())
+                if coverage is not None:
+                    coverage.write_text(counter.listing())
+                if coverage_json is not None:
+                    coverage_json.write_text(json.dumps(counter.to_dict(), indent=2))
 
         for error in errors:
             typer.echo(error, err=True)
 
 
+@app.command()
+def batch(jobs: Path, output: Optional[Path] = typer.Option(None, help='Write the results to this JSONL file instead of '
+                                                                      'the standard output'),
+          workers: int = typer.Option(os.cpu_count() or 1, help='Number of worker processes'),
+          max_steps: Optional[int] = typer.Option(None, help='Default limit of method calls and loop iterations'),
+          max_objects: Optional[int] = typer.Option(None, help='Default limit of created objects'),
+          max_heap: Optional[int] = typer.Option(None, help='Default limit of estimated bytes of objects and strings'),
+          timeout: Optional[float] = typer.Option(None, help='Default limit of seconds of execution'),
+          kill_timeout: Optional[float] = typer.Option(None, help='Kill the worker of a job that takes more seconds')):
+    """Run the jobs of a JSONL file, each one a JSON object with the source and the stdin of a program"""
+    # cool.service uses check_semantics, so it is imported after this module
+    from cool.service import WorkerPool, batch as run_batch
+
+    limits = {'max_steps': max_steps, 'max_objects': max_objects, 'max_heap': max_heap, 'timeout': timeout}
+    with WorkerPool(workers, limits, kill_timeout) as pool, jobs.open() as lines:
+        if output is None:
+            run_batch(pool, lines, sys.stdout)
+        else:
+            with output.open('w') as results:
+                run_batch(pool, lines, results)
+
+
+@app.command()
+def serve(host: str = typer.Option('127.0.0.1', help='Address of the TCP socket'),
+          port: int = typer.Option(8765, help='Port of the TCP socket'),
+          socket: Optional[str] = typer.Option(None, help='Listen in this Unix socket instead of the TCP socket'),
+          workers: int = typer.Option(os.cpu_count() or 1, help='Number of worker processes'),
+          max_steps: Optional[int] = typer.Option(None, help='Default limit of method calls and loop iterations'),
+          max_objects: Optional[int] = typer.Option(None, help='Default limit of created objects'),
+          max_heap: Optional[int] = typer.Option(None, help='Default limit of estimated bytes of objects and strings'),
+          timeout: Optional[float] = typer.Option(None, help='Default limit of seconds of execution'),
+          kill_timeout: Optional[float] = typer.Option(None, help='Kill the worker of a job that takes more seconds')):
+    """Run the jobs sent to a socket, one JSON object per line, answering each one with its result"""
+    from cool.service import WorkerPool, serve as serve_jobs
+
+    limits = {'max_steps': max_steps, 'max_objects': max_objects, 'max_heap': max_heap, 'timeout': timeout}
+    with WorkerPool(workers, limits, kill_timeout) as pool:
+        typer.echo(f'Serving {workers} workers at {socket if socket is not None else f"{host}:{port}"}', err=True)
+        # A service manager stops the server with SIGTERM, it ends as an interrupt so the socket is removed
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        try:
+            serve_jobs(pool, socket if socket is not None else (host, port))
+        except KeyboardInterrupt:
+            pass
+
+
 @app.command()
 def serialize():
     serialize_parser_and_lexer()
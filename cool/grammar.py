@@ -220,17 +220,27 @@ def lexical_error(lexer):
 ###############
 # Productions #
 ###############
+def append(items: list, item) -> list:
+    """Add the item to the end of the list in place, the list productions extend the list of the inner production
+    instead of copying it, so a sequence of n elements is built in O(n)"""
+    items.append(item)
+    return items
+
+
 program %= 'class-list', lambda s: ast.ProgramNode(s[1])
 
 class_list %= 'class-def', lambda s: [s[1]]
-class_list %= 'class-def class-list', lambda s: [s[1]] + s[2]
+class_list %= 'class-list class-def', lambda s: append(s[1], s[2])
 
-class_def %= 'class type { feature-list }', lambda s: ast.ClassDeclarationNode(s[2], s[4])
-class_def %= 'class type inherits type { feature-list }', lambda s: ast.ClassDeclarationNode(s[2], s[6], s[4])
+# The feature list is built in reverse order (see below)
+class_def %= 'class type { feature-list }', lambda s: ast.ClassDeclarationNode(s[2], s[4][::-1])
+class_def %= 'class type inherits type { feature-list }', lambda s: ast.ClassDeclarationNode(s[2], s[6][::-1], s[4])
 
+# The feature list keeps the right recursion because its error productions report the missing ";" when the list is
+# reduced, so appending each feature to the list of the following ones builds it in reverse order in O(n)
 feature_list %= '', lambda s: []
-feature_list %= 'attribute ; feature-list', lambda s: [s[1]] + s[3]
-feature_list %= 'method ; feature-list', lambda s: [s[1]] + s[3]
+feature_list %= 'attribute ; feature-list', lambda s: append(s[3], s[1])
+feature_list %= 'method ; feature-list', lambda s: append(s[3], s[1])
 
 attribute %= 'id : type', lambda s: ast.AttrDeclarationNode(s[1], s[3])
 attribute %= 'id : type <- expr', lambda s: ast.AttrDeclarationNode(s[1], s[3], s[5])
@@ -239,7 +249,7 @@ method %= 'id ( ) : type { expr }', lambda s: ast.MethodDeclarationNode(s[1], []
 method %= 'id ( param-list ) : type { expr }', lambda s: ast.MethodDeclarationNode(s[1], s[3], s[6], s[8])
 
 param_list %= 'id : type', lambda s: [(s[1], s[3])]
-param_list %= 'id : type , param-list', lambda s: [(s[1], s[3])] + s[5]
+param_list %= 'param-list , id : type', lambda s: append(s[1], (s[3], s[5]))
 
 expr %= 'id <- expr', lambda s: ast.AssignNode(s[1], s[3])
 expr %= '{ block }', lambda s: ast.BlockNode(s[2])
@@ -250,17 +260,17 @@ expr %= 'case expr of case-list esac', lambda s: ast.SwitchCaseNode(s[2], s[4])
 expr %= 'not expr', lambda s: ast.NegationNode(s[2])
 expr %= 'comp', lambda s: s[1]
 
-comp %= 'arith < arith', lambda s: ast.LessThanNode(s[1], s[2], s[3])
-comp %= 'arith <= arith', lambda s: ast.LessEqualNode(s[1], s[2], s[3])
-comp %= 'arith = arith', lambda s: ast.EqualNode(s[1], s[2], s[3])
+comp %= 'arith < arith', lambda s: ast.LessThanNode(s[1], s[3])
+comp %= 'arith <= arith', lambda s: ast.LessEqualNode(s[1], s[3])
+comp %= 'arith = arith', lambda s: ast.EqualNode(s[1], s[3])
 comp %= 'arith', lambda s: s[1]
 
-arith %= 'arith + term', lambda s: ast.PlusNode(s[1], s[2], s[3])
-arith %= 'arith - term', lambda s: ast.MinusNode(s[1], s[2], s[3])
+arith %= 'arith + term', lambda s: ast.PlusNode(s[1], s[3])
+arith %= 'arith - term', lambda s: ast.MinusNode(s[1], s[3])
 arith %= 'term', lambda s: s[1]
 
-term %= 'term * factor', lambda s: ast.StarNode(s[1], s[2], s[3])
-term %= 'term / factor', lambda s: ast.DivNode(s[1], s[2], s[3])
+term %= 'term * factor', lambda s: ast.StarNode(s[1], s[3])
+term %= 'term / factor', lambda s: ast.DivNode(s[1], s[3])
 term %= 'factor', lambda s: s[1]
 
 factor %= 'isvoid factor', lambda s: ast.IsVoidNode(s[2])
@@ -277,15 +287,15 @@ atom %= 'new type', lambda s: ast.InstantiateNode(s[2])
 atom %= '( expr )', lambda s: s[2]
 
 block %= 'expr ;', lambda s: [s[1]]
-block %= 'expr ; block', lambda s: [s[1]] + s[3]
+block %= 'block expr ;', lambda s: append(s[1], s[2])
 
 declaration_list %= 'id : type', lambda s: [(s[1], s[3], None)]
 declaration_list %= 'id : type <- expr', lambda s: [(s[1], s[3], s[5])]
-declaration_list %= 'id : type , declaration-list', lambda s: [(s[1], s[3], None)] + s[5]
-declaration_list %= 'id : type <- expr , declaration-list', lambda s: [(s[1], s[3], s[5])] + s[7]
+declaration_list %= 'declaration-list , id : type', lambda s: append(s[1], (s[3], s[5], None))
+declaration_list %= 'declaration-list , id : type <- expr', lambda s: append(s[1], (s[3], s[5], s[7]))
 
 case_list %= 'id : type => expr ;', lambda s: [(s[1], s[3], s[5])]
-case_list %= 'id : type => expr ; case-list', lambda s: [(s[1], s[3], s[5])] + s[7]
+case_list %= 'case-list id : type => expr ;', lambda s: append(s[1], (s[2], s[4], s[6]))
 
 function_call %= 'id ( expr-list )', lambda s: ast.MethodCallNode(s[1], s[3])
 function_call %= 'atom . id ( expr-list )', lambda s: ast.MethodCallNode(s[3], s[5], s[1])
@@ -294,7 +304,7 @@ function_call %= 'atom @ type . id ( expr-list )', lambda s: ast.MethodCallNode(
 expr_list %= '', lambda s: []
 expr_list %= 'not-empty-expr-list', lambda s: s[1]
 not_empty_expr_list %= 'expr', lambda s: [s[1]]
-not_empty_expr_list %= 'expr , not-empty-expr-list', lambda s: [s[1]] + s[3]
+not_empty_expr_list %= 'not-empty-expr-list , expr', lambda s: append(s[1], s[3])
 
 #####################
 # Error Productions #
@@ -305,13 +315,13 @@ G.add_terminal_error()
 @G.production("feature-list -> attribute error feature-list")
 def feature_attribute_error(s):
     s.add_error(2, f"{s[2].line, s[2].column} - SyntacticError: Expected ';' instead of '{s[2].lex}'.")
-    return [s[1]] + s[3]
+    return append(s[3], s[1])
 
 
 @G.production("feature-list -> method error feature-list")
 def feature_method_error(s):
     s.add_error(2, f"{s[2].line, s[2].column} - SyntacticError: Expected ';' instead of '{s[2].lex}'.")
-    return [s[1]] + s[3]
+    return append(s[3], s[1])
 
 
 @G.production("case-list -> id : type => expr error")
@@ -320,10 +330,10 @@ def case_list_error(s):
     return [(s[1], s[3], s[5])]
 
 
-@G.production("case-list -> id : type => expr error case-list")
+@G.production("case-list -> case-list id : type => expr error")
 def case_list_error(s):
-    s.add_error(6, f"{s[6].line, s[6].column} - SyntacticError: Expected ';' instead of '{s[6].lex}'.")
-    return [(s[1], s[3], s[5])] + s[7]
+    s.add_error(7, f"{s[7].line, s[7].column} - SyntacticError: Expected ';' instead of '{s[7].lex}'.")
+    return append(s[1], (s[2], s[4], s[6]))
 
 
 @G.production("block -> expr error")
@@ -332,10 +342,10 @@ def block_single_error(s):
     return [s[1]]
 
 
-@G.production("block -> expr error block")
+@G.production("block -> block expr error")
 def block_single_error(s):
-    s.add_error(2, f"{s[2].line, s[2].column} - SyntacticError: Expected ';' instead of '{s[2].lex}'.")
-    return [s[1]] + s[3]
+    s.add_error(3, f"{s[3].line, s[3].column} - SyntacticError: Expected ';' instead of '{s[3].lex}'.")
+    return append(s[1], s[2])
 
 
 #################
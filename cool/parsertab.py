@@ -16,1354 +16,1450 @@ class CoolParser(ShiftReduceParser, ABC):
         return {
             (0, G["class"]): ("SHIFT", 1),
             (1, G["type"]): ("SHIFT", 2),
-            (2, G["inherits"]): ("SHIFT", 145),
             (2, G["{"]): ("SHIFT", 3),
+            (2, G["inherits"]): ("SHIFT", 155),
             (3, G["id"]): ("SHIFT", 4),
             (3, G["}"]): ("REDUCE", G["feature-list -> e"]),
-            (4, G[":"]): ("SHIFT", 129),
+            (4, G[":"]): ("SHIFT", 139),
             (4, G["("]): ("SHIFT", 5),
-            (5, G["id"]): ("SHIFT", 117),
+            (5, G["id"]): ("SHIFT", 125),
             (5, G[")"]): ("SHIFT", 6),
             (6, G[":"]): ("SHIFT", 7),
             (7, G["type"]): ("SHIFT", 8),
             (8, G["{"]): ("SHIFT", 9),
-            (9, G["not"]): ("SHIFT", 30),
-            (9, G["if"]): ("SHIFT", 12),
-            (9, G["("]): ("SHIFT", 11),
-            (9, G["id"]): ("SHIFT", 31),
-            (9, G["case"]): ("SHIFT", 21),
+            (9, G["isvoid"]): ("SHIFT", 22),
+            (9, G["~"]): ("SHIFT", 25),
+            (9, G["true"]): ("SHIFT", 23),
             (9, G["let"]): ("SHIFT", 14),
-            (9, G["int"]): ("SHIFT", 33),
-            (9, G["isvoid"]): ("SHIFT", 24),
-            (9, G["{"]): ("SHIFT", 10),
-            (9, G["true"]): ("SHIFT", 25),
-            (9, G["new"]): ("SHIFT", 22),
-            (9, G["~"]): ("SHIFT", 27),
-            (9, G["string"]): ("SHIFT", 34),
+            (9, G["false"]): ("SHIFT", 24),
             (9, G["while"]): ("SHIFT", 13),
-            (9, G["false"]): ("SHIFT", 26),
-            (10, G["id"]): ("SHIFT", 31),
-            (10, G["~"]): ("SHIFT", 27),
-            (10, G["int"]): ("SHIFT", 33),
-            (10, G["case"]): ("SHIFT", 21),
-            (10, G["let"]): ("SHIFT", 14),
-            (10, G["true"]): ("SHIFT", 25),
+            (9, G["string"]): ("SHIFT", 32),
+            (9, G["("]): ("SHIFT", 11),
+            (9, G["{"]): ("SHIFT", 10),
+            (9, G["id"]): ("SHIFT", 29),
+            (9, G["new"]): ("SHIFT", 20),
+            (9, G["case"]): ("SHIFT", 19),
+            (9, G["not"]): ("SHIFT", 28),
+            (9, G["int"]): ("SHIFT", 31),
+            (9, G["if"]): ("SHIFT", 12),
             (10, G["{"]): ("SHIFT", 10),
-            (10, G["new"]): ("SHIFT", 22),
-            (10, G["string"]): ("SHIFT", 34),
-            (10, G["false"]): ("SHIFT", 26),
-            (10, G["while"]): ("SHIFT", 13),
-            (10, G["isvoid"]): ("SHIFT", 24),
-            (10, G["not"]): ("SHIFT", 30),
-            (10, G["if"]): ("SHIFT", 12),
+            (10, G["string"]): ("SHIFT", 32),
+            (10, G["false"]): ("SHIFT", 24),
             (10, G["("]): ("SHIFT", 11),
+            (10, G["case"]): ("SHIFT", 19),
+            (10, G["id"]): ("SHIFT", 29),
+            (10, G["if"]): ("SHIFT", 12),
+            (10, G["not"]): ("SHIFT", 28),
+            (10, G["isvoid"]): ("SHIFT", 22),
+            (10, G["new"]): ("SHIFT", 20),
+            (10, G["int"]): ("SHIFT", 31),
+            (10, G["~"]): ("SHIFT", 25),
+            (10, G["let"]): ("SHIFT", 14),
+            (10, G["while"]): ("SHIFT", 13),
+            (10, G["true"]): ("SHIFT", 23),
+            (11, G["int"]): ("SHIFT", 31),
+            (11, G["id"]): ("SHIFT", 29),
+            (11, G["case"]): ("SHIFT", 19),
+            (11, G["not"]): ("SHIFT", 28),
             (11, G["if"]): ("SHIFT", 12),
-            (11, G["id"]): ("SHIFT", 31),
-            (11, G["new"]): ("SHIFT", 22),
+            (11, G["isvoid"]): ("SHIFT", 22),
+            (11, G["true"]): ("SHIFT", 23),
+            (11, G["false"]): ("SHIFT", 24),
+            (11, G["string"]): ("SHIFT", 32),
             (11, G["let"]): ("SHIFT", 14),
-            (11, G["true"]): ("SHIFT", 25),
-            (11, G["case"]): ("SHIFT", 21),
+            (11, G["("]): ("SHIFT", 11),
             (11, G["{"]): ("SHIFT", 10),
-            (11, G["isvoid"]): ("SHIFT", 24),
-            (11, G["string"]): ("SHIFT", 34),
-            (11, G["false"]): ("SHIFT", 26),
-            (11, G["~"]): ("SHIFT", 27),
             (11, G["while"]): ("SHIFT", 13),
-            (11, G["("]): ("SHIFT", 11),
-            (11, G["int"]): ("SHIFT", 33),
-            (11, G["not"]): ("SHIFT", 30),
-            (12, G["not"]): ("SHIFT", 30),
-            (12, G["false"]): ("SHIFT", 26),
-            (12, G["if"]): ("SHIFT", 12),
-            (12, G["let"]): ("SHIFT", 14),
-            (12, G["case"]): ("SHIFT", 21),
-            (12, G["id"]): ("SHIFT", 31),
+            (11, G["~"]): ("SHIFT", 25),
+            (11, G["new"]): ("SHIFT", 20),
+            (12, G["false"]): ("SHIFT", 24),
+            (12, G["string"]): ("SHIFT", 32),
+            (12, G["~"]): ("SHIFT", 25),
             (12, G["("]): ("SHIFT", 11),
-            (12, G["{"]): ("SHIFT", 10),
-            (12, G["int"]): ("SHIFT", 33),
-            (12, G["isvoid"]): ("SHIFT", 24),
-            (12, G["true"]): ("SHIFT", 25),
-            (12, G["new"]): ("SHIFT", 22),
-            (12, G["~"]): ("SHIFT", 27),
+            (12, G["id"]): ("SHIFT", 29),
+            (12, G["new"]): ("SHIFT", 20),
+            (12, G["int"]): ("SHIFT", 31),
+            (12, G["let"]): ("SHIFT", 14),
             (12, G["while"]): ("SHIFT", 13),
-            (12, G["string"]): ("SHIFT", 34),
+            (12, G["{"]): ("SHIFT", 10),
+            (12, G["isvoid"]): ("SHIFT", 22),
+            (12, G["case"]): ("SHIFT", 19),
+            (12, G["if"]): ("SHIFT", 12),
+            (12, G["not"]): ("SHIFT", 28),
+            (12, G["true"]): ("SHIFT", 23),
+            (13, G["~"]): ("SHIFT", 25),
             (13, G["let"]): ("SHIFT", 14),
-            (13, G["case"]): ("SHIFT", 21),
-            (13, G["id"]): ("SHIFT", 31),
-            (13, G["{"]): ("SHIFT", 10),
-            (13, G["string"]): ("SHIFT", 34),
-            (13, G["false"]): ("SHIFT", 26),
+            (13, G["true"]): ("SHIFT", 23),
+            (13, G["false"]): ("SHIFT", 24),
             (13, G["while"]): ("SHIFT", 13),
+            (13, G["string"]): ("SHIFT", 32),
             (13, G["("]): ("SHIFT", 11),
-            (13, G["isvoid"]): ("SHIFT", 24),
-            (13, G["int"]): ("SHIFT", 33),
-            (13, G["new"]): ("SHIFT", 22),
-            (13, G["not"]): ("SHIFT", 30),
+            (13, G["{"]): ("SHIFT", 10),
+            (13, G["id"]): ("SHIFT", 29),
+            (13, G["case"]): ("SHIFT", 19),
+            (13, G["not"]): ("SHIFT", 28),
+            (13, G["new"]): ("SHIFT", 20),
             (13, G["if"]): ("SHIFT", 12),
-            (13, G["~"]): ("SHIFT", 27),
-            (13, G["true"]): ("SHIFT", 25),
+            (13, G["int"]): ("SHIFT", 31),
+            (13, G["isvoid"]): ("SHIFT", 22),
             (14, G["id"]): ("SHIFT", 15),
             (15, G[":"]): ("SHIFT", 16),
             (16, G["type"]): ("SHIFT", 17),
-            (17, G["<-"]): ("SHIFT", 20),
+            (17, G["<-"]): ("SHIFT", 18),
             (17, G["in"]): ("REDUCE", G["declaration-list -> id : type"]),
-            (17, G[","]): ("SHIFT", 18),
-            (18, G["id"]): ("SHIFT", 15),
-            (19, G["in"]): ("REDUCE", G["declaration-list -> id : type , declaration-list"]),
-            (20, G["string"]): ("SHIFT", 34),
-            (20, G["while"]): ("SHIFT", 13),
-            (20, G["isvoid"]): ("SHIFT", 24),
-            (20, G["not"]): ("SHIFT", 30),
-            (20, G["false"]): ("SHIFT", 26),
-            (20, G["if"]): ("SHIFT", 12),
-            (20, G["~"]): ("SHIFT", 27),
-            (20, G["let"]): ("SHIFT", 14),
-            (20, G["case"]): ("SHIFT", 21),
-            (20, G["("]): ("SHIFT", 11),
-            (20, G["id"]): ("SHIFT", 31),
-            (20, G["{"]): ("SHIFT", 10),
-            (20, G["int"]): ("SHIFT", 33),
-            (20, G["new"]): ("SHIFT", 22),
-            (20, G["true"]): ("SHIFT", 25),
-            (21, G["if"]): ("SHIFT", 12),
-            (21, G["~"]): ("SHIFT", 27),
-            (21, G["case"]): ("SHIFT", 21),
-            (21, G["let"]): ("SHIFT", 14),
-            (21, G["string"]): ("SHIFT", 34),
-            (21, G["id"]): ("SHIFT", 31),
-            (21, G["{"]): ("SHIFT", 10),
-            (21, G["false"]): ("SHIFT", 26),
-            (21, G["("]): ("SHIFT", 11),
-            (21, G["int"]): ("SHIFT", 33),
-            (21, G["while"]): ("SHIFT", 13),
-            (21, G["isvoid"]): ("SHIFT", 24),
-            (21, G["not"]): ("SHIFT", 30),
-            (21, G["true"]): ("SHIFT", 25),
-            (21, G["new"]): ("SHIFT", 22),
-            (22, G["type"]): ("SHIFT", 23),
-            (23, G[")"]): ("REDUCE", G["atom -> new type"]),
-            (23, G["-"]): ("REDUCE", G["atom -> new type"]),
-            (23, G["in"]): ("REDUCE", G["atom -> new type"]),
-            (23, G["*"]): ("REDUCE", G["atom -> new type"]),
-            (23, G["}"]): ("REDUCE", G["atom -> new type"]),
-            (23, G["/"]): ("REDUCE", G["atom -> new type"]),
-            (23, G["of"]): ("REDUCE", G["atom -> new type"]),
-            (23, G["<"]): ("REDUCE", G["atom -> new type"]),
-            (23, G["fi"]): ("REDUCE", G["atom -> new type"]),
-            (23, G["<="]): ("REDUCE", G["atom -> new type"]),
-            (23, G["@"]): ("REDUCE", G["atom -> new type"]),
-            (23, G["="]): ("REDUCE", G["atom -> new type"]),
-            (23, G[";"]): ("REDUCE", G["atom -> new type"]),
-            (23, G["else"]): ("REDUCE", G["atom -> new type"]),
-            (23, G["then"]): ("REDUCE", G["atom -> new type"]),
-            (23, G["loop"]): ("REDUCE", G["atom -> new type"]),
-            (23, G["error"]): ("REDUCE", G["atom -> new type"]),
-            (23, G[","]): ("REDUCE", G["atom -> new type"]),
-            (23, G["pool"]): ("REDUCE", G["atom -> new type"]),
-            (23, G["+"]): ("REDUCE", G["atom -> new type"]),
-            (23, G["."]): ("REDUCE", G["atom -> new type"]),
-            (24, G["false"]): ("SHIFT", 26),
-            (24, G["new"]): ("SHIFT", 22),
-            (24, G["string"]): ("SHIFT", 34),
-            (24, G["id"]): ("SHIFT", 28),
-            (24, G["true"]): ("SHIFT", 25),
-            (24, G["isvoid"]): ("SHIFT", 24),
-            (24, G["int"]): ("SHIFT", 33),
-            (24, G["~"]): ("SHIFT", 27),
-            (24, G["("]): ("SHIFT", 11),
-            (25, G[")"]): ("REDUCE", G["atom -> true"]),
-            (25, G["-"]): ("REDUCE", G["atom -> true"]),
-            (25, G["in"]): ("REDUCE", G["atom -> true"]),
-            (25, G["*"]): ("REDUCE", G["atom -> true"]),
-            (25, G["}"]): ("REDUCE", G["atom -> true"]),
-            (25, G["/"]): ("REDUCE", G["atom -> true"]),
-            (25, G["of"]): ("REDUCE", G["atom -> true"]),
-            (25, G["<"]): ("REDUCE", G["atom -> true"]),
-            (25, G["fi"]): ("REDUCE", G["atom -> true"]),
-            (25, G["<="]): ("REDUCE", G["atom -> true"]),
-            (25, G["@"]): ("REDUCE", G["atom -> true"]),
-            (25, G["="]): ("REDUCE", G["atom -> true"]),
-            (25, G[";"]): ("REDUCE", G["atom -> true"]),
-            (25, G["else"]): ("REDUCE", G["atom -> true"]),
-            (25, G["then"]): ("REDUCE", G["atom -> true"]),
-            (25, G["loop"]): ("REDUCE", G["atom -> true"]),
-            (25, G["error"]): ("REDUCE", G["atom -> true"]),
-            (25, G[","]): ("REDUCE", G["atom -> true"]),
-            (25, G["pool"]): ("REDUCE", G["atom -> true"]),
-            (25, G["+"]): ("REDUCE", G["atom -> true"]),
-            (25, G["."]): ("REDUCE", G["atom -> true"]),
-            (26, G[")"]): ("REDUCE", G["atom -> false"]),
-            (26, G["-"]): ("REDUCE", G["atom -> false"]),
-            (26, G["in"]): ("REDUCE", G["atom -> false"]),
-            (26, G["*"]): ("REDUCE", G["atom -> false"]),
-            (26, G["}"]): ("REDUCE", G["atom -> false"]),
-            (26, G["/"]): ("REDUCE", G["atom -> false"]),
-            (26, G["of"]): ("REDUCE", G["atom -> false"]),
-            (26, G["<"]): ("REDUCE", G["atom -> false"]),
-            (26, G["fi"]): ("REDUCE", G["atom -> false"]),
-            (26, G["<="]): ("REDUCE", G["atom -> false"]),
-            (26, G["@"]): ("REDUCE", G["atom -> false"]),
-            (26, G["="]): ("REDUCE", G["atom -> false"]),
-            (26, G[";"]): ("REDUCE", G["atom -> false"]),
-            (26, G["else"]): ("REDUCE", G["atom -> false"]),
-            (26, G["then"]): ("REDUCE", G["atom -> false"]),
-            (26, G["loop"]): ("REDUCE", G["atom -> false"]),
-            (26, G["error"]): ("REDUCE", G["atom -> false"]),
-            (26, G[","]): ("REDUCE", G["atom -> false"]),
-            (26, G["pool"]): ("REDUCE", G["atom -> false"]),
-            (26, G["+"]): ("REDUCE", G["atom -> false"]),
-            (26, G["."]): ("REDUCE", G["atom -> false"]),
-            (27, G["false"]): ("SHIFT", 26),
-            (27, G["new"]): ("SHIFT", 22),
-            (27, G["string"]): ("SHIFT", 34),
-            (27, G["id"]): ("SHIFT", 28),
-            (27, G["true"]): ("SHIFT", 25),
-            (27, G["isvoid"]): ("SHIFT", 24),
-            (27, G["int"]): ("SHIFT", 33),
-            (27, G["~"]): ("SHIFT", 27),
+            (17, G[","]): ("REDUCE", G["declaration-list -> id : type"]),
+            (18, G["isvoid"]): ("SHIFT", 22),
+            (18, G["true"]): ("SHIFT", 23),
+            (18, G["let"]): ("SHIFT", 14),
+            (18, G["~"]): ("SHIFT", 25),
+            (18, G["false"]): ("SHIFT", 24),
+            (18, G["while"]): ("SHIFT", 13),
+            (18, G["string"]): ("SHIFT", 32),
+            (18, G["("]): ("SHIFT", 11),
+            (18, G["{"]): ("SHIFT", 10),
+            (18, G["id"]): ("SHIFT", 29),
+            (18, G["case"]): ("SHIFT", 19),
+            (18, G["new"]): ("SHIFT", 20),
+            (18, G["int"]): ("SHIFT", 31),
+            (18, G["if"]): ("SHIFT", 12),
+            (18, G["not"]): ("SHIFT", 28),
+            (19, G["false"]): ("SHIFT", 24),
+            (19, G["string"]): ("SHIFT", 32),
+            (19, G["~"]): ("SHIFT", 25),
+            (19, G["("]): ("SHIFT", 11),
+            (19, G["let"]): ("SHIFT", 14),
+            (19, G["id"]): ("SHIFT", 29),
+            (19, G["while"]): ("SHIFT", 13),
+            (19, G["new"]): ("SHIFT", 20),
+            (19, G["int"]): ("SHIFT", 31),
+            (19, G["{"]): ("SHIFT", 10),
+            (19, G["case"]): ("SHIFT", 19),
+            (19, G["if"]): ("SHIFT", 12),
+            (19, G["not"]): ("SHIFT", 28),
+            (19, G["isvoid"]): ("SHIFT", 22),
+            (19, G["true"]): ("SHIFT", 23),
+            (20, G["type"]): ("SHIFT", 21),
+            (21, G["pool"]): ("REDUCE", G["atom -> new type"]),
+            (21, G["<="]): ("REDUCE", G["atom -> new type"]),
+            (21, G[")"]): ("REDUCE", G["atom -> new type"]),
+            (21, G["then"]): ("REDUCE", G["atom -> new type"]),
+            (21, G["="]): ("REDUCE", G["atom -> new type"]),
+            (21, G["+"]): ("REDUCE", G["atom -> new type"]),
+            (21, G["."]): ("REDUCE", G["atom -> new type"]),
+            (21, G["else"]): ("REDUCE", G["atom -> new type"]),
+            (21, G["-"]): ("REDUCE", G["atom -> new type"]),
+            (21, G["in"]): ("REDUCE", G["atom -> new type"]),
+            (21, G[","]): ("REDUCE", G["atom -> new type"]),
+            (21, G["fi"]): ("REDUCE", G["atom -> new type"]),
+            (21, G["*"]): ("REDUCE", G["atom -> new type"]),
+            (21, G["/"]): ("REDUCE", G["atom -> new type"]),
+            (21, G[";"]): ("REDUCE", G["atom -> new type"]),
+            (21, G["}"]): ("REDUCE", G["atom -> new type"]),
+            (21, G["@"]): ("REDUCE", G["atom -> new type"]),
+            (21, G["<"]): ("REDUCE", G["atom -> new type"]),
+            (21, G["of"]): ("REDUCE", G["atom -> new type"]),
+            (21, G["error"]): ("REDUCE", G["atom -> new type"]),
+            (21, G["loop"]): ("REDUCE", G["atom -> new type"]),
+            (22, G["string"]): ("SHIFT", 32),
+            (22, G["~"]): ("SHIFT", 25),
+            (22, G["new"]): ("SHIFT", 20),
+            (22, G["("]): ("SHIFT", 11),
+            (22, G["true"]): ("SHIFT", 23),
+            (22, G["int"]): ("SHIFT", 31),
+            (22, G["isvoid"]): ("SHIFT", 22),
+            (22, G["id"]): ("SHIFT", 26),
+            (22, G["false"]): ("SHIFT", 24),
+            (23, G["pool"]): ("REDUCE", G["atom -> true"]),
+            (23, G["<="]): ("REDUCE", G["atom -> true"]),
+            (23, G[")"]): ("REDUCE", G["atom -> true"]),
+            (23, G["then"]): ("REDUCE", G["atom -> true"]),
+            (23, G["="]): ("REDUCE", G["atom -> true"]),
+            (23, G["+"]): ("REDUCE", G["atom -> true"]),
+            (23, G["."]): ("REDUCE", G["atom -> true"]),
+            (23, G["else"]): ("REDUCE", G["atom -> true"]),
+            (23, G["in"]): ("REDUCE", G["atom -> true"]),
+            (23, G["-"]): ("REDUCE", G["atom -> true"]),
+            (23, G[","]): ("REDUCE", G["atom -> true"]),
+            (23, G["fi"]): ("REDUCE", G["atom -> true"]),
+            (23, G["*"]): ("REDUCE", G["atom -> true"]),
+            (23, G["/"]): ("REDUCE", G["atom -> true"]),
+            (23, G[";"]): ("REDUCE", G["atom -> true"]),
+            (23, G["}"]): ("REDUCE", G["atom -> true"]),
+            (23, G["@"]): ("REDUCE", G["atom -> true"]),
+            (23, G["<"]): ("REDUCE", G["atom -> true"]),
+            (23, G["of"]): ("REDUCE", G["atom -> true"]),
+            (23, G["error"]): ("REDUCE", G["atom -> true"]),
+            (23, G["loop"]): ("REDUCE", G["atom -> true"]),
+            (24, G["pool"]): ("REDUCE", G["atom -> false"]),
+            (24, G["<="]): ("REDUCE", G["atom -> false"]),
+            (24, G[")"]): ("REDUCE", G["atom -> false"]),
+            (24, G["then"]): ("REDUCE", G["atom -> false"]),
+            (24, G["="]): ("REDUCE", G["atom -> false"]),
+            (24, G["+"]): ("REDUCE", G["atom -> false"]),
+            (24, G["."]): ("REDUCE", G["atom -> false"]),
+            (24, G["else"]): ("REDUCE", G["atom -> false"]),
+            (24, G["in"]): ("REDUCE", G["atom -> false"]),
+            (24, G["-"]): ("REDUCE", G["atom -> false"]),
+            (24, G[","]): ("REDUCE", G["atom -> false"]),
+            (24, G["fi"]): ("REDUCE", G["atom -> false"]),
+            (24, G["*"]): ("REDUCE", G["atom -> false"]),
+            (24, G["/"]): ("REDUCE", G["atom -> false"]),
+            (24, G[";"]): ("REDUCE", G["atom -> false"]),
+            (24, G["}"]): ("REDUCE", G["atom -> false"]),
+            (24, G["<"]): ("REDUCE", G["atom -> false"]),
+            (24, G["@"]): ("REDUCE", G["atom -> false"]),
+            (24, G["of"]): ("REDUCE", G["atom -> false"]),
+            (24, G["error"]): ("REDUCE", G["atom -> false"]),
+            (24, G["loop"]): ("REDUCE", G["atom -> false"]),
+            (25, G["string"]): ("SHIFT", 32),
+            (25, G["~"]): ("SHIFT", 25),
+            (25, G["new"]): ("SHIFT", 20),
+            (25, G["("]): ("SHIFT", 11),
+            (25, G["true"]): ("SHIFT", 23),
+            (25, G["int"]): ("SHIFT", 31),
+            (25, G["isvoid"]): ("SHIFT", 22),
+            (25, G["id"]): ("SHIFT", 26),
+            (25, G["false"]): ("SHIFT", 24),
+            (26, G["pool"]): ("REDUCE", G["atom -> id"]),
+            (26, G["<="]): ("REDUCE", G["atom -> id"]),
+            (26, G[")"]): ("REDUCE", G["atom -> id"]),
+            (26, G["="]): ("REDUCE", G["atom -> id"]),
+            (26, G["then"]): ("REDUCE", G["atom -> id"]),
+            (26, G["+"]): ("REDUCE", G["atom -> id"]),
+            (26, G["."]): ("REDUCE", G["atom -> id"]),
+            (26, G["else"]): ("REDUCE", G["atom -> id"]),
+            (26, G["-"]): ("REDUCE", G["atom -> id"]),
+            (26, G["in"]): ("REDUCE", G["atom -> id"]),
+            (26, G[","]): ("REDUCE", G["atom -> id"]),
+            (26, G["fi"]): ("REDUCE", G["atom -> id"]),
+            (26, G["*"]): ("REDUCE", G["atom -> id"]),
+            (26, G["/"]): ("REDUCE", G["atom -> id"]),
+            (26, G[";"]): ("REDUCE", G["atom -> id"]),
+            (26, G["}"]): ("REDUCE", G["atom -> id"]),
+            (26, G["@"]): ("REDUCE", G["atom -> id"]),
+            (26, G["<"]): ("REDUCE", G["atom -> id"]),
+            (26, G["of"]): ("REDUCE", G["atom -> id"]),
+            (26, G["error"]): ("REDUCE", G["atom -> id"]),
+            (26, G["loop"]): ("REDUCE", G["atom -> id"]),
+            (26, G["("]): ("SHIFT", 27),
+            (27, G["isvoid"]): ("SHIFT", 22),
+            (27, G["while"]): ("SHIFT", 13),
+            (27, G["{"]): ("SHIFT", 10),
+            (27, G["case"]): ("SHIFT", 19),
+            (27, G["if"]): ("SHIFT", 12),
+            (27, G["id"]): ("SHIFT", 29),
+            (27, G["not"]): ("SHIFT", 28),
+            (27, G["~"]): ("SHIFT", 25),
+            (27, G["true"]): ("SHIFT", 23),
+            (27, G[")"]): ("REDUCE", G["expr-list -> e"]),
+            (27, G["false"]): ("SHIFT", 24),
+            (27, G["string"]): ("SHIFT", 32),
             (27, G["("]): ("SHIFT", 11),
-            (28, G[")"]): ("REDUCE", G["atom -> id"]),
-            (28, G["-"]): ("REDUCE", G["atom -> id"]),
-            (28, G["in"]): ("REDUCE", G["atom -> id"]),
-            (28, G["*"]): ("REDUCE", G["atom -> id"]),
-            (28, G["}"]): ("REDUCE", G["atom -> id"]),
-            (28, G["/"]): ("REDUCE", G["atom -> id"]),
-            (28, G["of"]): ("REDUCE", G["atom -> id"]),
-            (28, G["<"]): ("REDUCE", G["atom -> id"]),
-            (28, G["fi"]): ("REDUCE", G["atom -> id"]),
-            (28, G["<="]): ("REDUCE", G["atom -> id"]),
-            (28, G["@"]): ("REDUCE", G["atom -> id"]),
-            (28, G["="]): ("REDUCE", G["atom -> id"]),
-            (28, G[";"]): ("REDUCE", G["atom -> id"]),
-            (28, G["else"]): ("REDUCE", G["atom -> id"]),
-            (28, G["then"]): ("REDUCE", G["atom -> id"]),
-            (28, G["loop"]): ("REDUCE", G["atom -> id"]),
-            (28, G["error"]): ("REDUCE", G["atom -> id"]),
-            (28, G[","]): ("REDUCE", G["atom -> id"]),
-            (28, G["pool"]): ("REDUCE", G["atom -> id"]),
-            (28, G["+"]): ("REDUCE", G["atom -> id"]),
-            (28, G["."]): ("REDUCE", G["atom -> id"]),
-            (28, G["("]): ("SHIFT", 29),
-            (29, G["new"]): ("SHIFT", 22),
-            (29, G["true"]): ("SHIFT", 25),
-            (29, G["isvoid"]): ("SHIFT", 24),
-            (29, G["string"]): ("SHIFT", 34),
-            (29, G["while"]): ("SHIFT", 13),
-            (29, G["false"]): ("SHIFT", 26),
-            (29, G["~"]): ("SHIFT", 27),
-            (29, G["not"]): ("SHIFT", 30),
-            (29, G["if"]): ("SHIFT", 12),
-            (29, G["("]): ("SHIFT", 11),
-            (29, G[")"]): ("REDUCE", G["expr-list -> e"]),
-            (29, G["let"]): ("SHIFT", 14),
-            (29, G["case"]): ("SHIFT", 21),
-            (29, G["id"]): ("SHIFT", 31),
-            (29, G["int"]): ("SHIFT", 33),
-            (29, G["{"]): ("SHIFT", 10),
-            (30, G["new"]): ("SHIFT", 22),
-            (30, G["true"]): ("SHIFT", 25),
-            (30, G["isvoid"]): ("SHIFT", 24),
+            (27, G["new"]): ("SHIFT", 20),
+            (27, G["int"]): ("SHIFT", 31),
+            (27, G["let"]): ("SHIFT", 14),
+            (28, G["string"]): ("SHIFT", 32),
+            (28, G["while"]): ("SHIFT", 13),
+            (28, G["("]): ("SHIFT", 11),
+            (28, G["{"]): ("SHIFT", 10),
+            (28, G["id"]): ("SHIFT", 29),
+            (28, G["~"]): ("SHIFT", 25),
+            (28, G["new"]): ("SHIFT", 20),
+            (28, G["case"]): ("SHIFT", 19),
+            (28, G["not"]): ("SHIFT", 28),
+            (28, G["int"]): ("SHIFT", 31),
+            (28, G["if"]): ("SHIFT", 12),
+            (28, G["true"]): ("SHIFT", 23),
+            (28, G["isvoid"]): ("SHIFT", 22),
+            (28, G["let"]): ("SHIFT", 14),
+            (28, G["false"]): ("SHIFT", 24),
+            (29, G["pool"]): ("REDUCE", G["atom -> id"]),
+            (29, G["<="]): ("REDUCE", G["atom -> id"]),
+            (29, G[")"]): ("REDUCE", G["atom -> id"]),
+            (29, G["then"]): ("REDUCE", G["atom -> id"]),
+            (29, G["="]): ("REDUCE", G["atom -> id"]),
+            (29, G["+"]): ("REDUCE", G["atom -> id"]),
+            (29, G["."]): ("REDUCE", G["atom -> id"]),
+            (29, G["else"]): ("REDUCE", G["atom -> id"]),
+            (29, G["in"]): ("REDUCE", G["atom -> id"]),
+            (29, G["-"]): ("REDUCE", G["atom -> id"]),
+            (29, G[","]): ("REDUCE", G["atom -> id"]),
+            (29, G["fi"]): ("REDUCE", G["atom -> id"]),
+            (29, G["*"]): ("REDUCE", G["atom -> id"]),
+            (29, G["/"]): ("REDUCE", G["atom -> id"]),
+            (29, G[";"]): ("REDUCE", G["atom -> id"]),
+            (29, G["}"]): ("REDUCE", G["atom -> id"]),
+            (29, G["@"]): ("REDUCE", G["atom -> id"]),
+            (29, G["<"]): ("REDUCE", G["atom -> id"]),
+            (29, G["of"]): ("REDUCE", G["atom -> id"]),
+            (29, G["error"]): ("REDUCE", G["atom -> id"]),
+            (29, G["loop"]): ("REDUCE", G["atom -> id"]),
+            (29, G["("]): ("SHIFT", 27),
+            (29, G["<-"]): ("SHIFT", 30),
+            (30, G["string"]): ("SHIFT", 32),
             (30, G["while"]): ("SHIFT", 13),
-            (30, G["string"]): ("SHIFT", 34),
-            (30, G["~"]): ("SHIFT", 27),
-            (30, G["not"]): ("SHIFT", 30),
+            (30, G["("]): ("SHIFT", 11),
+            (30, G["{"]): ("SHIFT", 10),
+            (30, G["id"]): ("SHIFT", 29),
+            (30, G["~"]): ("SHIFT", 25),
+            (30, G["new"]): ("SHIFT", 20),
+            (30, G["case"]): ("SHIFT", 19),
+            (30, G["not"]): ("SHIFT", 28),
+            (30, G["int"]): ("SHIFT", 31),
             (30, G["if"]): ("SHIFT", 12),
-            (30, G["false"]): ("SHIFT", 26),
+            (30, G["true"]): ("SHIFT", 23),
+            (30, G["isvoid"]): ("SHIFT", 22),
             (30, G["let"]): ("SHIFT", 14),
-            (30, G["case"]): ("SHIFT", 21),
-            (30, G["{"]): ("SHIFT", 10),
-            (30, G["id"]): ("SHIFT", 31),
-            (30, G["("]): ("SHIFT", 11),
-            (30, G["int"]): ("SHIFT", 33),
-            (31, G[")"]): ("REDUCE", G["atom -> id"]),
-            (31, G["-"]): ("REDUCE", G["atom -> id"]),
-            (31, G["in"]): ("REDUCE", G["atom -> id"]),
-            (31, G["*"]): ("REDUCE", G["atom -> id"]),
-            (31, G["}"]): ("REDUCE", G["atom -> id"]),
-            (31, G["/"]): ("REDUCE", G["atom -> id"]),
-            (31, G["of"]): ("REDUCE", G["atom -> id"]),
-            (31, G["<"]): ("REDUCE", G["atom -> id"]),
-            (31, G["fi"]): ("REDUCE", G["atom -> id"]),
-            (31, G["<="]): ("REDUCE", G["atom -> id"]),
-            (31, G["@"]): ("REDUCE", G["atom -> id"]),
-            (31, G["="]): ("REDUCE", G["atom -> id"]),
-            (31, G[";"]): ("REDUCE", G["atom -> id"]),
-            (31, G["else"]): ("REDUCE", G["atom -> id"]),
-            (31, G["then"]): ("REDUCE", G["atom -> id"]),
-            (31, G["loop"]): ("REDUCE", G["atom -> id"]),
-            (31, G["error"]): ("REDUCE", G["atom -> id"]),
-            (31, G[","]): ("REDUCE", G["atom -> id"]),
-            (31, G["pool"]): ("REDUCE", G["atom -> id"]),
-            (31, G["+"]): ("REDUCE", G["atom -> id"]),
-            (31, G["."]): ("REDUCE", G["atom -> id"]),
-            (31, G["<-"]): ("SHIFT", 32),
-            (31, G["("]): ("SHIFT", 29),
-            (32, G["new"]): ("SHIFT", 22),
-            (32, G["true"]): ("SHIFT", 25),
-            (32, G["isvoid"]): ("SHIFT", 24),
-            (32, G["while"]): ("SHIFT", 13),
-            (32, G["string"]): ("SHIFT", 34),
-            (32, G["~"]): ("SHIFT", 27),
-            (32, G["not"]): ("SHIFT", 30),
-            (32, G["if"]): ("SHIFT", 12),
-            (32, G["false"]): ("SHIFT", 26),
-            (32, G["let"]): ("SHIFT", 14),
-            (32, G["case"]): ("SHIFT", 21),
-            (32, G["{"]): ("SHIFT", 10),
-            (32, G["id"]): ("SHIFT", 31),
-            (32, G["("]): ("SHIFT", 11),
-            (32, G["int"]): ("SHIFT", 33),
-            (33, G[")"]): ("REDUCE", G["atom -> int"]),
-            (33, G["-"]): ("REDUCE", G["atom -> int"]),
-            (33, G["in"]): ("REDUCE", G["atom -> int"]),
-            (33, G["*"]): ("REDUCE", G["atom -> int"]),
-            (33, G["}"]): ("REDUCE", G["atom -> int"]),
-            (33, G["/"]): ("REDUCE", G["atom -> int"]),
-            (33, G["of"]): ("REDUCE", G["atom -> int"]),
-            (33, G["<"]): ("REDUCE", G["atom -> int"]),
-            (33, G["fi"]): ("REDUCE", G["atom -> int"]),
-            (33, G["<="]): ("REDUCE", G["atom -> int"]),
-            (33, G["@"]): ("REDUCE", G["atom -> int"]),
-            (33, G["="]): ("REDUCE", G["atom -> int"]),
-            (33, G[";"]): ("REDUCE", G["atom -> int"]),
-            (33, G["else"]): ("REDUCE", G["atom -> int"]),
-            (33, G["then"]): ("REDUCE", G["atom -> int"]),
-            (33, G["loop"]): ("REDUCE", G["atom -> int"]),
-            (33, G["error"]): ("REDUCE", G["atom -> int"]),
-            (33, G[","]): ("REDUCE", G["atom -> int"]),
-            (33, G["pool"]): ("REDUCE", G["atom -> int"]),
-            (33, G["+"]): ("REDUCE", G["atom -> int"]),
-            (33, G["."]): ("REDUCE", G["atom -> int"]),
-            (34, G[")"]): ("REDUCE", G["atom -> string"]),
-            (34, G["-"]): ("REDUCE", G["atom -> string"]),
-            (34, G["in"]): ("REDUCE", G["atom -> string"]),
-            (34, G["*"]): ("REDUCE", G["atom -> string"]),
-            (34, G["}"]): ("REDUCE", G["atom -> string"]),
-            (34, G["/"]): ("REDUCE", G["atom -> string"]),
-            (34, G["of"]): ("REDUCE", G["atom -> string"]),
-            (34, G["<"]): ("REDUCE", G["atom -> string"]),
-            (34, G["fi"]): ("REDUCE", G["atom -> string"]),
-            (34, G["<="]): ("REDUCE", G["atom -> string"]),
-            (34, G["@"]): ("REDUCE", G["atom -> string"]),
-            (34, G["="]): ("REDUCE", G["atom -> string"]),
-            (34, G[";"]): ("REDUCE", G["atom -> string"]),
-            (34, G["else"]): ("REDUCE", G["atom -> string"]),
-            (34, G["then"]): ("REDUCE", G["atom -> string"]),
-            (34, G["loop"]): ("REDUCE", G["atom -> string"]),
-            (34, G["error"]): ("REDUCE", G["atom -> string"]),
-            (34, G[","]): ("REDUCE", G["atom -> string"]),
-            (34, G["pool"]): ("REDUCE", G["atom -> string"]),
-            (34, G["+"]): ("REDUCE", G["atom -> string"]),
-            (34, G["."]): ("REDUCE", G["atom -> string"]),
-            (35, G[")"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["-"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["in"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["*"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["}"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["/"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["of"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["<"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["fi"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["<="]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["@"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["="]): ("REDUCE", G["atom -> function-call"]),
-            (35, G[";"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["else"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["then"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["loop"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["error"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G[","]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["pool"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["+"]): ("REDUCE", G["atom -> function-call"]),
-            (35, G["."]): ("REDUCE", G["atom -> function-call"]),
-            (36, G[";"]): ("REDUCE", G["expr -> id <- expr"]),
-            (36, G[")"]): ("REDUCE", G["expr -> id <- expr"]),
-            (36, G["in"]): ("REDUCE", G["expr -> id <- expr"]),
-            (36, G["else"]): ("REDUCE", G["expr -> id <- expr"]),
-            (36, G["then"]): ("REDUCE", G["expr -> id <- expr"]),
-            (36, G["}"]): ("REDUCE", G["expr -> id <- expr"]),
-            (36, G["of"]): ("REDUCE", G["expr -> id <- expr"]),
-            (36, G["loop"]): ("REDUCE", G["expr -> id <- expr"]),
-            (36, G["error"]): ("REDUCE", G["expr -> id <- expr"]),
-            (36, G["fi"]): ("REDUCE", G["expr -> id <- expr"]),
-            (36, G[","]): ("REDUCE", G["expr -> id <- expr"]),
-            (36, G["pool"]): ("REDUCE", G["expr -> id <- expr"]),
-            (37, G[";"]): ("REDUCE", G["expr -> comp"]),
-            (37, G[")"]): ("REDUCE", G["expr -> comp"]),
-            (37, G["in"]): ("REDUCE", G["expr -> comp"]),
-            (37, G["else"]): ("REDUCE", G["expr -> comp"]),
-            (37, G["then"]): ("REDUCE", G["expr -> comp"]),
-            (37, G["}"]): ("REDUCE", G["expr -> comp"]),
-            (37, G["of"]): ("REDUCE", G["expr -> comp"]),
-            (37, G["loop"]): ("REDUCE", G["expr -> comp"]),
-            (37, G["error"]): ("REDUCE", G["expr -> comp"]),
-            (37, G["fi"]): ("REDUCE", G["expr -> comp"]),
-            (37, G[","]): ("REDUCE", G["expr -> comp"]),
-            (37, G["pool"]): ("REDUCE", G["expr -> comp"]),
-            (38, G[";"]): ("REDUCE", G["comp -> arith"]),
-            (38, G[")"]): ("REDUCE", G["comp -> arith"]),
-            (38, G["in"]): ("REDUCE", G["comp -> arith"]),
-            (38, G["else"]): ("REDUCE", G["comp -> arith"]),
-            (38, G["then"]): ("REDUCE", G["comp -> arith"]),
-            (38, G["}"]): ("REDUCE", G["comp -> arith"]),
-            (38, G["of"]): ("REDUCE", G["comp -> arith"]),
-            (38, G["loop"]): ("REDUCE", G["comp -> arith"]),
-            (38, G["error"]): ("REDUCE", G["comp -> arith"]),
-            (38, G["fi"]): ("REDUCE", G["comp -> arith"]),
-            (38, G[","]): ("REDUCE", G["comp -> arith"]),
-            (38, G["pool"]): ("REDUCE", G["comp -> arith"]),
-            (38, G["="]): ("SHIFT", 70),
-            (38, G["-"]): ("SHIFT", 64),
-            (38, G["<="]): ("SHIFT", 68),
-            (38, G["<"]): ("SHIFT", 66),
-            (38, G["+"]): ("SHIFT", 39),
-            (39, G["false"]): ("SHIFT", 26),
-            (39, G["new"]): ("SHIFT", 22),
-            (39, G["true"]): ("SHIFT", 25),
-            (39, G["isvoid"]): ("SHIFT", 24),
+            (30, G["false"]): ("SHIFT", 24),
+            (31, G["pool"]): ("REDUCE", G["atom -> int"]),
+            (31, G["<="]): ("REDUCE", G["atom -> int"]),
+            (31, G[")"]): ("REDUCE", G["atom -> int"]),
+            (31, G["then"]): ("REDUCE", G["atom -> int"]),
+            (31, G["="]): ("REDUCE", G["atom -> int"]),
+            (31, G["+"]): ("REDUCE", G["atom -> int"]),
+            (31, G["."]): ("REDUCE", G["atom -> int"]),
+            (31, G["else"]): ("REDUCE", G["atom -> int"]),
+            (31, G["in"]): ("REDUCE", G["atom -> int"]),
+            (31, G["-"]): ("REDUCE", G["atom -> int"]),
+            (31, G[","]): ("REDUCE", G["atom -> int"]),
+            (31, G["fi"]): ("REDUCE", G["atom -> int"]),
+            (31, G["*"]): ("REDUCE", G["atom -> int"]),
+            (31, G["/"]): ("REDUCE", G["atom -> int"]),
+            (31, G[";"]): ("REDUCE", G["atom -> int"]),
+            (31, G["}"]): ("REDUCE", G["atom -> int"]),
+            (31, G["<"]): ("REDUCE", G["atom -> int"]),
+            (31, G["@"]): ("REDUCE", G["atom -> int"]),
+            (31, G["of"]): ("REDUCE", G["atom -> int"]),
+            (31, G["error"]): ("REDUCE", G["atom -> int"]),
+            (31, G["loop"]): ("REDUCE", G["atom -> int"]),
+            (32, G["pool"]): ("REDUCE", G["atom -> string"]),
+            (32, G["<="]): ("REDUCE", G["atom -> string"]),
+            (32, G[")"]): ("REDUCE", G["atom -> string"]),
+            (32, G["then"]): ("REDUCE", G["atom -> string"]),
+            (32, G["="]): ("REDUCE", G["atom -> string"]),
+            (32, G["+"]): ("REDUCE", G["atom -> string"]),
+            (32, G["."]): ("REDUCE", G["atom -> string"]),
+            (32, G["else"]): ("REDUCE", G["atom -> string"]),
+            (32, G["in"]): ("REDUCE", G["atom -> string"]),
+            (32, G["-"]): ("REDUCE", G["atom -> string"]),
+            (32, G[","]): ("REDUCE", G["atom -> string"]),
+            (32, G["fi"]): ("REDUCE", G["atom -> string"]),
+            (32, G["*"]): ("REDUCE", G["atom -> string"]),
+            (32, G["/"]): ("REDUCE", G["atom -> string"]),
+            (32, G[";"]): ("REDUCE", G["atom -> string"]),
+            (32, G["}"]): ("REDUCE", G["atom -> string"]),
+            (32, G["@"]): ("REDUCE", G["atom -> string"]),
+            (32, G["<"]): ("REDUCE", G["atom -> string"]),
+            (32, G["of"]): ("REDUCE", G["atom -> string"]),
+            (32, G["error"]): ("REDUCE", G["atom -> string"]),
+            (32, G["loop"]): ("REDUCE", G["atom -> string"]),
+            (33, G["pool"]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["<="]): ("REDUCE", G["atom -> function-call"]),
+            (33, G[")"]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["then"]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["="]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["+"]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["."]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["else"]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["in"]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["-"]): ("REDUCE", G["atom -> function-call"]),
+            (33, G[","]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["fi"]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["*"]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["/"]): ("REDUCE", G["atom -> function-call"]),
+            (33, G[";"]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["}"]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["<"]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["@"]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["of"]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["error"]): ("REDUCE", G["atom -> function-call"]),
+            (33, G["loop"]): ("REDUCE", G["atom -> function-call"]),
+            (34, G["pool"]): ("REDUCE", G["expr -> id <- expr"]),
+            (34, G["then"]): ("REDUCE", G["expr -> id <- expr"]),
+            (34, G[")"]): ("REDUCE", G["expr -> id <- expr"]),
+            (34, G[";"]): ("REDUCE", G["expr -> id <- expr"]),
+            (34, G["}"]): ("REDUCE", G["expr -> id <- expr"]),
+            (34, G["of"]): ("REDUCE", G["expr -> id <- expr"]),
+            (34, G["else"]): ("REDUCE", G["expr -> id <- expr"]),
+            (34, G["error"]): ("REDUCE", G["expr -> id <- expr"]),
+            (34, G["loop"]): ("REDUCE", G["expr -> id <- expr"]),
+            (34, G["in"]): ("REDUCE", G["expr -> id <- expr"]),
+            (34, G["fi"]): ("REDUCE", G["expr -> id <- expr"]),
+            (34, G[","]): ("REDUCE", G["expr -> id <- expr"]),
+            (35, G["pool"]): ("REDUCE", G["expr -> comp"]),
+            (35, G["then"]): ("REDUCE", G["expr -> comp"]),
+            (35, G[")"]): ("REDUCE", G["expr -> comp"]),
+            (35, G[";"]): ("REDUCE", G["expr -> comp"]),
+            (35, G["}"]): ("REDUCE", G["expr -> comp"]),
+            (35, G["of"]): ("REDUCE", G["expr -> comp"]),
+            (35, G["else"]): ("REDUCE", G["expr -> comp"]),
+            (35, G["error"]): ("REDUCE", G["expr -> comp"]),
+            (35, G["loop"]): ("REDUCE", G["expr -> comp"]),
+            (35, G["in"]): ("REDUCE", G["expr -> comp"]),
+            (35, G["fi"]): ("REDUCE", G["expr -> comp"]),
+            (35, G[","]): ("REDUCE", G["expr -> comp"]),
+            (36, G["<"]): ("SHIFT", 64),
+            (36, G["-"]): ("SHIFT", 62),
+            (36, G["<="]): ("SHIFT", 66),
+            (36, G["pool"]): ("REDUCE", G["comp -> arith"]),
+            (36, G["then"]): ("REDUCE", G["comp -> arith"]),
+            (36, G[")"]): ("REDUCE", G["comp -> arith"]),
+            (36, G[";"]): ("REDUCE", G["comp -> arith"]),
+            (36, G["}"]): ("REDUCE", G["comp -> arith"]),
+            (36, G["of"]): ("REDUCE", G["comp -> arith"]),
+            (36, G["else"]): ("REDUCE", G["comp -> arith"]),
+            (36, G["error"]): ("REDUCE", G["comp -> arith"]),
+            (36, G["loop"]): ("REDUCE", G["comp -> arith"]),
+            (36, G["in"]): ("REDUCE", G["comp -> arith"]),
+            (36, G["fi"]): ("REDUCE", G["comp -> arith"]),
+            (36, G[","]): ("REDUCE", G["comp -> arith"]),
+            (36, G["+"]): ("SHIFT", 37),
+            (36, G["="]): ("SHIFT", 68),
+            (37, G["string"]): ("SHIFT", 32),
+            (37, G["("]): ("SHIFT", 11),
+            (37, G["id"]): ("SHIFT", 26),
+            (37, G["~"]): ("SHIFT", 25),
+            (37, G["new"]): ("SHIFT", 20),
+            (37, G["true"]): ("SHIFT", 23),
+            (37, G["int"]): ("SHIFT", 31),
+            (37, G["isvoid"]): ("SHIFT", 22),
+            (37, G["false"]): ("SHIFT", 24),
+            (38, G["*"]): ("SHIFT", 39),
+            (38, G["<="]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G["pool"]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G["then"]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G["="]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G[")"]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G["+"]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G["else"]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G["in"]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G["-"]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G["fi"]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G[","]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G[";"]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G["}"]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G["<"]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G["of"]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G["error"]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G["loop"]): ("REDUCE", G["arith -> arith + term"]),
+            (38, G["/"]): ("SHIFT", 51),
+            (39, G["string"]): ("SHIFT", 32),
+            (39, G["~"]): ("SHIFT", 25),
+            (39, G["new"]): ("SHIFT", 20),
             (39, G["("]): ("SHIFT", 11),
-            (39, G["string"]): ("SHIFT", 34),
-            (39, G["id"]): ("SHIFT", 28),
-            (39, G["int"]): ("SHIFT", 33),
-            (39, G["~"]): ("SHIFT", 27),
-            (40, G["/"]): ("SHIFT", 54),
-            (40, G[")"]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G["in"]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G["-"]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G["}"]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G["of"]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G["<"]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G["fi"]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G["<="]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G["="]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G[";"]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G["else"]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G["then"]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G["loop"]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G["error"]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G[","]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G["pool"]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G["+"]): ("REDUCE", G["arith -> arith + term"]),
-            (40, G["*"]): ("SHIFT", 41),
-            (41, G["false"]): ("SHIFT", 26),
-            (41, G["new"]): ("SHIFT", 22),
-            (41, G["string"]): ("SHIFT", 34),
-            (41, G["id"]): ("SHIFT", 28),
-            (41, G["true"]): ("SHIFT", 25),
-            (41, G["isvoid"]): ("SHIFT", 24),
-            (41, G["int"]): ("SHIFT", 33),
-            (41, G["~"]): ("SHIFT", 27),
-            (41, G["("]): ("SHIFT", 11),
-            (42, G[")"]): ("REDUCE", G["term -> term * factor"]),
-            (42, G["-"]): ("REDUCE", G["term -> term * factor"]),
-            (42, G["in"]): ("REDUCE", G["term -> term * factor"]),
-            (42, G["*"]): ("REDUCE", G["term -> term * factor"]),
-            (42, G["}"]): ("REDUCE", G["term -> term * factor"]),
-            (42, G["/"]): ("REDUCE", G["term -> term * factor"]),
-            (42, G["of"]): ("REDUCE", G["term -> term * factor"]),
-            (42, G["<"]): ("REDUCE", G["term -> term * factor"]),
-            (42, G["fi"]): ("REDUCE", G["term -> term * factor"]),
-            (42, G["<="]): ("REDUCE", G["term -> term * factor"]),
-            (42, G["="]): ("REDUCE", G["term -> term * factor"]),
-            (42, G[";"]): ("REDUCE", G["term -> term * factor"]),
-            (42, G["else"]): ("REDUCE", G["term -> term * factor"]),
-            (42, G["then"]): ("REDUCE", G["term -> term * factor"]),
-            (42, G["loop"]): ("REDUCE", G["term -> term * factor"]),
-            (42, G["error"]): ("REDUCE", G["term -> term * factor"]),
-            (42, G[","]): ("REDUCE", G["term -> term * factor"]),
-            (42, G["pool"]): ("REDUCE", G["term -> term * factor"]),
-            (42, G["+"]): ("REDUCE", G["term -> term * factor"]),
-            (43, G[")"]): ("REDUCE", G["factor -> atom"]),
-            (43, G["-"]): ("REDUCE", G["factor -> atom"]),
-            (43, G["in"]): ("REDUCE", G["factor -> atom"]),
-            (43, G["*"]): ("REDUCE", G["factor -> atom"]),
-            (43, G["}"]): ("REDUCE", G["factor -> atom"]),
-            (43, G["/"]): ("REDUCE", G["factor -> atom"]),
-            (43, G["of"]): ("REDUCE", G["factor -> atom"]),
-            (43, G["<"]): ("REDUCE", G["factor -> atom"]),
-            (43, G["fi"]): ("REDUCE", G["factor -> atom"]),
-            (43, G["<="]): ("REDUCE", G["factor -> atom"]),
-            (43, G["="]): ("REDUCE", G["factor -> atom"]),
-            (43, G[";"]): ("REDUCE", G["factor -> atom"]),
-            (43, G["else"]): ("REDUCE", G["factor -> atom"]),
-            (43, G["then"]): ("REDUCE", G["factor -> atom"]),
-            (43, G["loop"]): ("REDUCE", G["factor -> atom"]),
-            (43, G["error"]): ("REDUCE", G["factor -> atom"]),
-            (43, G[","]): ("REDUCE", G["factor -> atom"]),
-            (43, G["pool"]): ("REDUCE", G["factor -> atom"]),
-            (43, G["+"]): ("REDUCE", G["factor -> atom"]),
-            (43, G["@"]): ("SHIFT", 57),
-            (43, G["."]): ("SHIFT", 44),
-            (44, G["id"]): ("SHIFT", 45),
-            (45, G["("]): ("SHIFT", 46),
-            (46, G["new"]): ("SHIFT", 22),
-            (46, G["true"]): ("SHIFT", 25),
-            (46, G["isvoid"]): ("SHIFT", 24),
-            (46, G["string"]): ("SHIFT", 34),
-            (46, G["while"]): ("SHIFT", 13),
-            (46, G["false"]): ("SHIFT", 26),
-            (46, G["~"]): ("SHIFT", 27),
-            (46, G["not"]): ("SHIFT", 30),
-            (46, G["if"]): ("SHIFT", 12),
-            (46, G["("]): ("SHIFT", 11),
-            (46, G[")"]): ("REDUCE", G["expr-list -> e"]),
-            (46, G["let"]): ("SHIFT", 14),
-            (46, G["case"]): ("SHIFT", 21),
-            (46, G["id"]): ("SHIFT", 31),
-            (46, G["int"]): ("SHIFT", 33),
-            (46, G["{"]): ("SHIFT", 10),
-            (47, G[")"]): ("SHIFT", 48),
-            (48, G[")"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["-"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["in"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["*"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["}"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["/"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["of"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["<"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["fi"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["<="]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["@"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["="]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G[";"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["else"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["then"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["loop"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["error"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G[","]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["pool"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["+"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (48, G["."]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
-            (49, G[")"]): ("REDUCE", G["expr-list -> not-empty-expr-list"]),
-            (50, G[","]): ("SHIFT", 51),
-            (50, G[")"]): ("REDUCE", G["not-empty-expr-list -> expr"]),
-            (51, G["new"]): ("SHIFT", 22),
-            (51, G["true"]): ("SHIFT", 25),
-            (51, G["isvoid"]): ("SHIFT", 24),
-            (51, G["string"]): ("SHIFT", 34),
-            (51, G["while"]): ("SHIFT", 13),
-            (51, G["false"]): ("SHIFT", 26),
-            (51, G["~"]): ("SHIFT", 27),
-            (51, G["not"]): ("SHIFT", 30),
-            (51, G["if"]): ("SHIFT", 12),
+            (39, G["true"]): ("SHIFT", 23),
+            (39, G["int"]): ("SHIFT", 31),
+            (39, G["isvoid"]): ("SHIFT", 22),
+            (39, G["id"]): ("SHIFT", 26),
+            (39, G["false"]): ("SHIFT", 24),
+            (40, G["pool"]): ("REDUCE", G["term -> term * factor"]),
+            (40, G["<="]): ("REDUCE", G["term -> term * factor"]),
+            (40, G[")"]): ("REDUCE", G["term -> term * factor"]),
+            (40, G["then"]): ("REDUCE", G["term -> term * factor"]),
+            (40, G["="]): ("REDUCE", G["term -> term * factor"]),
+            (40, G["+"]): ("REDUCE", G["term -> term * factor"]),
+            (40, G["else"]): ("REDUCE", G["term -> term * factor"]),
+            (40, G["-"]): ("REDUCE", G["term -> term * factor"]),
+            (40, G["in"]): ("REDUCE", G["term -> term * factor"]),
+            (40, G[","]): ("REDUCE", G["term -> term * factor"]),
+            (40, G["fi"]): ("REDUCE", G["term -> term * factor"]),
+            (40, G["*"]): ("REDUCE", G["term -> term * factor"]),
+            (40, G["/"]): ("REDUCE", G["term -> term * factor"]),
+            (40, G[";"]): ("REDUCE", G["term -> term * factor"]),
+            (40, G["}"]): ("REDUCE", G["term -> term * factor"]),
+            (40, G["<"]): ("REDUCE", G["term -> term * factor"]),
+            (40, G["of"]): ("REDUCE", G["term -> term * factor"]),
+            (40, G["error"]): ("REDUCE", G["term -> term * factor"]),
+            (40, G["loop"]): ("REDUCE", G["term -> term * factor"]),
+            (41, G["pool"]): ("REDUCE", G["factor -> atom"]),
+            (41, G["<="]): ("REDUCE", G["factor -> atom"]),
+            (41, G[")"]): ("REDUCE", G["factor -> atom"]),
+            (41, G["then"]): ("REDUCE", G["factor -> atom"]),
+            (41, G["="]): ("REDUCE", G["factor -> atom"]),
+            (41, G["+"]): ("REDUCE", G["factor -> atom"]),
+            (41, G["else"]): ("REDUCE", G["factor -> atom"]),
+            (41, G["in"]): ("REDUCE", G["factor -> atom"]),
+            (41, G["-"]): ("REDUCE", G["factor -> atom"]),
+            (41, G[","]): ("REDUCE", G["factor -> atom"]),
+            (41, G["fi"]): ("REDUCE", G["factor -> atom"]),
+            (41, G["*"]): ("REDUCE", G["factor -> atom"]),
+            (41, G["/"]): ("REDUCE", G["factor -> atom"]),
+            (41, G[";"]): ("REDUCE", G["factor -> atom"]),
+            (41, G["}"]): ("REDUCE", G["factor -> atom"]),
+            (41, G["<"]): ("REDUCE", G["factor -> atom"]),
+            (41, G["of"]): ("REDUCE", G["factor -> atom"]),
+            (41, G["error"]): ("REDUCE", G["factor -> atom"]),
+            (41, G["loop"]): ("REDUCE", G["factor -> atom"]),
+            (41, G["@"]): ("SHIFT", 55),
+            (41, G["."]): ("SHIFT", 42),
+            (42, G["id"]): ("SHIFT", 43),
+            (43, G["("]): ("SHIFT", 44),
+            (44, G["isvoid"]): ("SHIFT", 22),
+            (44, G["while"]): ("SHIFT", 13),
+            (44, G["{"]): ("SHIFT", 10),
+            (44, G["case"]): ("SHIFT", 19),
+            (44, G["if"]): ("SHIFT", 12),
+            (44, G["id"]): ("SHIFT", 29),
+            (44, G["not"]): ("SHIFT", 28),
+            (44, G["~"]): ("SHIFT", 25),
+            (44, G["true"]): ("SHIFT", 23),
+            (44, G[")"]): ("REDUCE", G["expr-list -> e"]),
+            (44, G["false"]): ("SHIFT", 24),
+            (44, G["string"]): ("SHIFT", 32),
+            (44, G["("]): ("SHIFT", 11),
+            (44, G["new"]): ("SHIFT", 20),
+            (44, G["int"]): ("SHIFT", 31),
+            (44, G["let"]): ("SHIFT", 14),
+            (45, G[")"]): ("SHIFT", 46),
+            (46, G["pool"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["<="]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G[")"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["then"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["="]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["+"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["."]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["else"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["-"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["in"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G[","]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["fi"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["*"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["/"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G[";"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["}"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["@"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["<"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["of"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["error"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (46, G["loop"]): ("REDUCE", G["function-call -> atom . id ( expr-list )"]),
+            (47, G[")"]): ("REDUCE", G["expr-list -> not-empty-expr-list"]),
+            (47, G[","]): ("SHIFT", 48),
+            (48, G["isvoid"]): ("SHIFT", 22),
+            (48, G["while"]): ("SHIFT", 13),
+            (48, G["{"]): ("SHIFT", 10),
+            (48, G["case"]): ("SHIFT", 19),
+            (48, G["if"]): ("SHIFT", 12),
+            (48, G["id"]): ("SHIFT", 29),
+            (48, G["not"]): ("SHIFT", 28),
+            (48, G["true"]): ("SHIFT", 23),
+            (48, G["~"]): ("SHIFT", 25),
+            (48, G["false"]): ("SHIFT", 24),
+            (48, G["string"]): ("SHIFT", 32),
+            (48, G["("]): ("SHIFT", 11),
+            (48, G["new"]): ("SHIFT", 20),
+            (48, G["int"]): ("SHIFT", 31),
+            (48, G["let"]): ("SHIFT", 14),
+            (49, G[")"]): ("REDUCE", G["not-empty-expr-list -> not-empty-expr-list , expr"]),
+            (49, G[","]): ("REDUCE", G["not-empty-expr-list -> not-empty-expr-list , expr"]),
+            (50, G["*"]): ("SHIFT", 39),
+            (50, G["/"]): ("SHIFT", 51),
+            (50, G["<="]): ("REDUCE", G["arith -> term"]),
+            (50, G["pool"]): ("REDUCE", G["arith -> term"]),
+            (50, G["then"]): ("REDUCE", G["arith -> term"]),
+            (50, G["="]): ("REDUCE", G["arith -> term"]),
+            (50, G[")"]): ("REDUCE", G["arith -> term"]),
+            (50, G["+"]): ("REDUCE", G["arith -> term"]),
+            (50, G["else"]): ("REDUCE", G["arith -> term"]),
+            (50, G["in"]): ("REDUCE", G["arith -> term"]),
+            (50, G["-"]): ("REDUCE", G["arith -> term"]),
+            (50, G["fi"]): ("REDUCE", G["arith -> term"]),
+            (50, G[","]): ("REDUCE", G["arith -> term"]),
+            (50, G[";"]): ("REDUCE", G["arith -> term"]),
+            (50, G["}"]): ("REDUCE", G["arith -> term"]),
+            (50, G["<"]): ("REDUCE", G["arith -> term"]),
+            (50, G["of"]): ("REDUCE", G["arith -> term"]),
+            (50, G["error"]): ("REDUCE", G["arith -> term"]),
+            (50, G["loop"]): ("REDUCE", G["arith -> term"]),
+            (51, G["string"]): ("SHIFT", 32),
+            (51, G["~"]): ("SHIFT", 25),
+            (51, G["new"]): ("SHIFT", 20),
             (51, G["("]): ("SHIFT", 11),
-            (51, G["let"]): ("SHIFT", 14),
-            (51, G["case"]): ("SHIFT", 21),
-            (51, G["id"]): ("SHIFT", 31),
-            (51, G["int"]): ("SHIFT", 33),
-            (51, G["{"]): ("SHIFT", 10),
-            (52, G[")"]): ("REDUCE", G["not-empty-expr-list -> expr , not-empty-expr-list"]),
-            (53, G["/"]): ("SHIFT", 54),
-            (53, G[")"]): ("REDUCE", G["arith -> term"]),
-            (53, G["in"]): ("REDUCE", G["arith -> term"]),
-            (53, G["-"]): ("REDUCE", G["arith -> term"]),
-            (53, G["}"]): ("REDUCE", G["arith -> term"]),
-            (53, G["of"]): ("REDUCE", G["arith -> term"]),
-            (53, G["<"]): ("REDUCE", G["arith -> term"]),
-            (53, G["fi"]): ("REDUCE", G["arith -> term"]),
-            (53, G["<="]): ("REDUCE", G["arith -> term"]),
-            (53, G["="]): ("REDUCE", G["arith -> term"]),
-            (53, G[";"]): ("REDUCE", G["arith -> term"]),
-            (53, G["else"]): ("REDUCE", G["arith -> term"]),
-            (53, G["then"]): ("REDUCE", G["arith -> term"]),
-            (53, G["loop"]): ("REDUCE", G["arith -> term"]),
-            (53, G["error"]): ("REDUCE", G["arith -> term"]),
-            (53, G[","]): ("REDUCE", G["arith -> term"]),
-            (53, G["pool"]): ("REDUCE", G["arith -> term"]),
-            (53, G["+"]): ("REDUCE", G["arith -> term"]),
-            (53, G["*"]): ("SHIFT", 41),
-            (54, G["false"]): ("SHIFT", 26),
-            (54, G["new"]): ("SHIFT", 22),
-            (54, G["string"]): ("SHIFT", 34),
-            (54, G["id"]): ("SHIFT", 28),
-            (54, G["true"]): ("SHIFT", 25),
-            (54, G["isvoid"]): ("SHIFT", 24),
-            (54, G["int"]): ("SHIFT", 33),
-            (54, G["~"]): ("SHIFT", 27),
-            (54, G["("]): ("SHIFT", 11),
-            (55, G[")"]): ("REDUCE", G["term -> term / factor"]),
-            (55, G["-"]): ("REDUCE", G["term -> term / factor"]),
-            (55, G["in"]): ("REDUCE", G["term -> term / factor"]),
-            (55, G["*"]): ("REDUCE", G["term -> term / factor"]),
-            (55, G["}"]): ("REDUCE", G["term -> term / factor"]),
-            (55, G["/"]): ("REDUCE", G["term -> term / factor"]),
-            (55, G["of"]): ("REDUCE", G["term -> term / factor"]),
-            (55, G["<"]): ("REDUCE", G["term -> term / factor"]),
-            (55, G["fi"]): ("REDUCE", G["term -> term / factor"]),
-            (55, G["<="]): ("REDUCE", G["term -> term / factor"]),
-            (55, G["="]): ("REDUCE", G["term -> term / factor"]),
-            (55, G[";"]): ("REDUCE", G["term -> term / factor"]),
-            (55, G["else"]): ("REDUCE", G["term -> term / factor"]),
-            (55, G["then"]): ("REDUCE", G["term -> term / factor"]),
-            (55, G["loop"]): ("REDUCE", G["term -> term / factor"]),
-            (55, G["error"]): ("REDUCE", G["term -> term / factor"]),
-            (55, G[","]): ("REDUCE", G["term -> term / factor"]),
-            (55, G["pool"]): ("REDUCE", G["term -> term / factor"]),
-            (55, G["+"]): ("REDUCE", G["term -> term / factor"]),
-            (56, G[")"]): ("REDUCE", G["term -> factor"]),
-            (56, G["-"]): ("REDUCE", G["term -> factor"]),
-            (56, G["in"]): ("REDUCE", G["term -> factor"]),
-            (56, G["*"]): ("REDUCE", G["term -> factor"]),
-            (56, G["}"]): ("REDUCE", G["term -> factor"]),
-            (56, G["/"]): ("REDUCE", G["term -> factor"]),
-            (56, G["of"]): ("REDUCE", G["term -> factor"]),
-            (56, G["<"]): ("REDUCE", G["term -> factor"]),
-            (56, G["fi"]): ("REDUCE", G["term -> factor"]),
-            (56, G["<="]): ("REDUCE", G["term -> factor"]),
-            (56, G["="]): ("REDUCE", G["term -> factor"]),
-            (56, G[";"]): ("REDUCE", G["term -> factor"]),
-            (56, G["else"]): ("REDUCE", G["term -> factor"]),
-            (56, G["then"]): ("REDUCE", G["term -> factor"]),
-            (56, G["loop"]): ("REDUCE", G["term -> factor"]),
-            (56, G["error"]): ("REDUCE", G["term -> factor"]),
-            (56, G[","]): ("REDUCE", G["term -> factor"]),
-            (56, G["pool"]): ("REDUCE", G["term -> factor"]),
-            (56, G["+"]): ("REDUCE", G["term -> factor"]),
-            (57, G["type"]): ("SHIFT", 58),
-            (58, G["."]): ("SHIFT", 59),
-            (59, G["id"]): ("SHIFT", 60),
-            (60, G["("]): ("SHIFT", 61),
-            (61, G["new"]): ("SHIFT", 22),
-            (61, G["true"]): ("SHIFT", 25),
-            (61, G["isvoid"]): ("SHIFT", 24),
-            (61, G["string"]): ("SHIFT", 34),
-            (61, G["while"]): ("SHIFT", 13),
-            (61, G["false"]): ("SHIFT", 26),
-            (61, G["~"]): ("SHIFT", 27),
-            (61, G["not"]): ("SHIFT", 30),
-            (61, G["if"]): ("SHIFT", 12),
-            (61, G["("]): ("SHIFT", 11),
-            (61, G[")"]): ("REDUCE", G["expr-list -> e"]),
-            (61, G["let"]): ("SHIFT", 14),
-            (61, G["case"]): ("SHIFT", 21),
-            (61, G["id"]): ("SHIFT", 31),
-            (61, G["int"]): ("SHIFT", 33),
-            (61, G["{"]): ("SHIFT", 10),
-            (62, G[")"]): ("SHIFT", 63),
-            (63, G[")"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["-"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["in"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["*"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["}"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["/"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["of"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["<"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["fi"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["<="]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["@"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["="]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G[";"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["else"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["then"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["loop"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["error"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G[","]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["pool"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["+"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (63, G["."]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
-            (64, G["false"]): ("SHIFT", 26),
-            (64, G["new"]): ("SHIFT", 22),
-            (64, G["true"]): ("SHIFT", 25),
-            (64, G["isvoid"]): ("SHIFT", 24),
+            (51, G["true"]): ("SHIFT", 23),
+            (51, G["int"]): ("SHIFT", 31),
+            (51, G["isvoid"]): ("SHIFT", 22),
+            (51, G["id"]): ("SHIFT", 26),
+            (51, G["false"]): ("SHIFT", 24),
+            (52, G["pool"]): ("REDUCE", G["term -> term / factor"]),
+            (52, G["<="]): ("REDUCE", G["term -> term / factor"]),
+            (52, G[")"]): ("REDUCE", G["term -> term / factor"]),
+            (52, G["then"]): ("REDUCE", G["term -> term / factor"]),
+            (52, G["="]): ("REDUCE", G["term -> term / factor"]),
+            (52, G["+"]): ("REDUCE", G["term -> term / factor"]),
+            (52, G["else"]): ("REDUCE", G["term -> term / factor"]),
+            (52, G["-"]): ("REDUCE", G["term -> term / factor"]),
+            (52, G["in"]): ("REDUCE", G["term -> term / factor"]),
+            (52, G[","]): ("REDUCE", G["term -> term / factor"]),
+            (52, G["fi"]): ("REDUCE", G["term -> term / factor"]),
+            (52, G["*"]): ("REDUCE", G["term -> term / factor"]),
+            (52, G["/"]): ("REDUCE", G["term -> term / factor"]),
+            (52, G[";"]): ("REDUCE", G["term -> term / factor"]),
+            (52, G["}"]): ("REDUCE", G["term -> term / factor"]),
+            (52, G["<"]): ("REDUCE", G["term -> term / factor"]),
+            (52, G["of"]): ("REDUCE", G["term -> term / factor"]),
+            (52, G["error"]): ("REDUCE", G["term -> term / factor"]),
+            (52, G["loop"]): ("REDUCE", G["term -> term / factor"]),
+            (53, G["pool"]): ("REDUCE", G["term -> factor"]),
+            (53, G["<="]): ("REDUCE", G["term -> factor"]),
+            (53, G[")"]): ("REDUCE", G["term -> factor"]),
+            (53, G["then"]): ("REDUCE", G["term -> factor"]),
+            (53, G["="]): ("REDUCE", G["term -> factor"]),
+            (53, G["+"]): ("REDUCE", G["term -> factor"]),
+            (53, G["else"]): ("REDUCE", G["term -> factor"]),
+            (53, G["in"]): ("REDUCE", G["term -> factor"]),
+            (53, G["-"]): ("REDUCE", G["term -> factor"]),
+            (53, G[","]): ("REDUCE", G["term -> factor"]),
+            (53, G["fi"]): ("REDUCE", G["term -> factor"]),
+            (53, G["*"]): ("REDUCE", G["term -> factor"]),
+            (53, G["/"]): ("REDUCE", G["term -> factor"]),
+            (53, G[";"]): ("REDUCE", G["term -> factor"]),
+            (53, G["}"]): ("REDUCE", G["term -> factor"]),
+            (53, G["<"]): ("REDUCE", G["term -> factor"]),
+            (53, G["of"]): ("REDUCE", G["term -> factor"]),
+            (53, G["error"]): ("REDUCE", G["term -> factor"]),
+            (53, G["loop"]): ("REDUCE", G["term -> factor"]),
+            (54, G[")"]): ("REDUCE", G["not-empty-expr-list -> expr"]),
+            (54, G[","]): ("REDUCE", G["not-empty-expr-list -> expr"]),
+            (55, G["type"]): ("SHIFT", 56),
+            (56, G["."]): ("SHIFT", 57),
+            (57, G["id"]): ("SHIFT", 58),
+            (58, G["("]): ("SHIFT", 59),
+            (59, G["isvoid"]): ("SHIFT", 22),
+            (59, G["while"]): ("SHIFT", 13),
+            (59, G["{"]): ("SHIFT", 10),
+            (59, G["case"]): ("SHIFT", 19),
+            (59, G["if"]): ("SHIFT", 12),
+            (59, G["id"]): ("SHIFT", 29),
+            (59, G["not"]): ("SHIFT", 28),
+            (59, G["~"]): ("SHIFT", 25),
+            (59, G["true"]): ("SHIFT", 23),
+            (59, G[")"]): ("REDUCE", G["expr-list -> e"]),
+            (59, G["false"]): ("SHIFT", 24),
+            (59, G["string"]): ("SHIFT", 32),
+            (59, G["("]): ("SHIFT", 11),
+            (59, G["new"]): ("SHIFT", 20),
+            (59, G["int"]): ("SHIFT", 31),
+            (59, G["let"]): ("SHIFT", 14),
+            (60, G[")"]): ("SHIFT", 61),
+            (61, G["pool"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["<="]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G[")"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["then"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["="]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["+"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["."]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["else"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["-"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["in"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G[","]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["fi"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["*"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["/"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G[";"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["}"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["@"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["<"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["of"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["error"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (61, G["loop"]): ("REDUCE", G["function-call -> atom @ type . id ( expr-list )"]),
+            (62, G["string"]): ("SHIFT", 32),
+            (62, G["("]): ("SHIFT", 11),
+            (62, G["id"]): ("SHIFT", 26),
+            (62, G["~"]): ("SHIFT", 25),
+            (62, G["new"]): ("SHIFT", 20),
+            (62, G["true"]): ("SHIFT", 23),
+            (62, G["int"]): ("SHIFT", 31),
+            (62, G["isvoid"]): ("SHIFT", 22),
+            (62, G["false"]): ("SHIFT", 24),
+            (63, G["<="]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G["pool"]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G["then"]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G["="]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G[")"]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G["+"]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G["else"]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G["in"]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G["-"]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G["fi"]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G[","]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G[";"]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G["}"]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G["<"]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G["of"]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G["error"]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G["loop"]): ("REDUCE", G["arith -> arith - term"]),
+            (63, G["*"]): ("SHIFT", 39),
+            (63, G["/"]): ("SHIFT", 51),
+            (64, G["isvoid"]): ("SHIFT", 22),
+            (64, G["id"]): ("SHIFT", 26),
+            (64, G["new"]): ("SHIFT", 20),
+            (64, G["true"]): ("SHIFT", 23),
+            (64, G["int"]): ("SHIFT", 31),
+            (64, G["false"]): ("SHIFT", 24),
+            (64, G["~"]): ("SHIFT", 25),
+            (64, G["string"]): ("SHIFT", 32),
             (64, G["("]): ("SHIFT", 11),
-            (64, G["string"]): ("SHIFT", 34),
-            (64, G["id"]): ("SHIFT", 28),
-            (64, G["int"]): ("SHIFT", 33),
-            (64, G["~"]): ("SHIFT", 27),
-            (65, G["/"]): ("SHIFT", 54),
-            (65, G[")"]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G["in"]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G["-"]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G["}"]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G["of"]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G["<"]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G["fi"]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G["<="]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G["="]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G[";"]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G["else"]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G["then"]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G["loop"]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G["error"]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G[","]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G["pool"]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G["+"]): ("REDUCE", G["arith -> arith - term"]),
-            (65, G["*"]): ("SHIFT", 41),
+            (65, G["+"]): ("SHIFT", 37),
+            (65, G["pool"]): ("REDUCE", G["comp -> arith < arith"]),
+            (65, G["then"]): ("REDUCE", G["comp -> arith < arith"]),
+            (65, G[")"]): ("REDUCE", G["comp -> arith < arith"]),
+            (65, G[";"]): ("REDUCE", G["comp -> arith < arith"]),
+            (65, G["}"]): ("REDUCE", G["comp -> arith < arith"]),
+            (65, G["of"]): ("REDUCE", G["comp -> arith < arith"]),
+            (65, G["else"]): ("REDUCE", G["comp -> arith < arith"]),
+            (65, G["error"]): ("REDUCE", G["comp -> arith < arith"]),
+            (65, G["loop"]): ("REDUCE", G["comp -> arith < arith"]),
+            (65, G["in"]): ("REDUCE", G["comp -> arith < arith"]),
+            (65, G["fi"]): ("REDUCE", G["comp -> arith < arith"]),
+            (65, G[","]): ("REDUCE", G["comp -> arith < arith"]),
+            (65, G["-"]): ("SHIFT", 62),
+            (66, G["isvoid"]): ("SHIFT", 22),
+            (66, G["id"]): ("SHIFT", 26),
+            (66, G["new"]): ("SHIFT", 20),
+            (66, G["true"]): ("SHIFT", 23),
+            (66, G["int"]): ("SHIFT", 31),
+            (66, G["false"]): ("SHIFT", 24),
+            (66, G["~"]): ("SHIFT", 25),
+            (66, G["string"]): ("SHIFT", 32),
             (66, G["("]): ("SHIFT", 11),
-            (66, G["id"]): ("SHIFT", 28),
-            (66, G["string"]): ("SHIFT", 34),
-            (66, G["int"]): ("SHIFT", 33),
-            (66, G["isvoid"]): ("SHIFT", 24),
-            (66, G["false"]): ("SHIFT", 26),
-            (66, G["true"]): ("SHIFT", 25),
-            (66, G["new"]): ("SHIFT", 22),
-            (66, G["~"]): ("SHIFT", 27),
-            (67, G["+"]): ("SHIFT", 39),
-            (67, G["-"]): ("SHIFT", 64),
-            (67, G[";"]): ("REDUCE", G["comp -> arith < arith"]),
-            (67, G[")"]): ("REDUCE", G["comp -> arith < arith"]),
-            (67, G["in"]): ("REDUCE", G["comp -> arith < arith"]),
-            (67, G["else"]): ("REDUCE", G["comp -> arith < arith"]),
-            (67, G["then"]): ("REDUCE", G["comp -> arith < arith"]),
-            (67, G["}"]): ("REDUCE", G["comp -> arith < arith"]),
-            (67, G["of"]): ("REDUCE", G["comp -> arith < arith"]),
-            (67, G["loop"]): ("REDUCE", G["comp -> arith < arith"]),
-            (67, G["error"]): ("REDUCE", G["comp -> arith < arith"]),
-            (67, G["fi"]): ("REDUCE", G["comp -> arith < arith"]),
-            (67, G[","]): ("REDUCE", G["comp -> arith < arith"]),
-            (67, G["pool"]): ("REDUCE", G["comp -> arith < arith"]),
+            (67, G["-"]): ("SHIFT", 62),
+            (67, G["pool"]): ("REDUCE", G["comp -> arith <= arith"]),
+            (67, G["then"]): ("REDUCE", G["comp -> arith <= arith"]),
+            (67, G[")"]): ("REDUCE", G["comp -> arith <= arith"]),
+            (67, G[";"]): ("REDUCE", G["comp -> arith <= arith"]),
+            (67, G["}"]): ("REDUCE", G["comp -> arith <= arith"]),
+            (67, G["of"]): ("REDUCE", G["comp -> arith <= arith"]),
+            (67, G["else"]): ("REDUCE", G["comp -> arith <= arith"]),
+            (67, G["error"]): ("REDUCE", G["comp -> arith <= arith"]),
+            (67, G["loop"]): ("REDUCE", G["comp -> arith <= arith"]),
+            (67, G["in"]): ("REDUCE", G["comp -> arith <= arith"]),
+            (67, G["fi"]): ("REDUCE", G["comp -> arith <= arith"]),
+            (67, G[","]): ("REDUCE", G["comp -> arith <= arith"]),
+            (67, G["+"]): ("SHIFT", 37),
+            (68, G["isvoid"]): ("SHIFT", 22),
+            (68, G["id"]): ("SHIFT", 26),
+            (68, G["new"]): ("SHIFT", 20),
+            (68, G["true"]): ("SHIFT", 23),
+            (68, G["int"]): ("SHIFT", 31),
+            (68, G["false"]): ("SHIFT", 24),
+            (68, G["~"]): ("SHIFT", 25),
+            (68, G["string"]): ("SHIFT", 32),
             (68, G["("]): ("SHIFT", 11),
-            (68, G["id"]): ("SHIFT", 28),
-            (68, G["string"]): ("SHIFT", 34),
-            (68, G["int"]): ("SHIFT", 33),
-            (68, G["isvoid"]): ("SHIFT", 24),
-            (68, G["false"]): ("SHIFT", 26),
-            (68, G["true"]): ("SHIFT", 25),
-            (68, G["new"]): ("SHIFT", 22),
-            (68, G["~"]): ("SHIFT", 27),
-            (69, G["+"]): ("SHIFT", 39),
-            (69, G["-"]): ("SHIFT", 64),
-            (69, G[";"]): ("REDUCE", G["comp -> arith <= arith"]),
-            (69, G[")"]): ("REDUCE", G["comp -> arith <= arith"]),
-            (69, G["in"]): ("REDUCE", G["comp -> arith <= arith"]),
-            (69, G["else"]): ("REDUCE", G["comp -> arith <= arith"]),
-            (69, G["then"]): ("REDUCE", G["comp -> arith <= arith"]),
-            (69, G["}"]): ("REDUCE", G["comp -> arith <= arith"]),
-            (69, G["of"]): ("REDUCE", G["comp -> arith <= arith"]),
-            (69, G["loop"]): ("REDUCE", G["comp -> arith <= arith"]),
-            (69, G["error"]): ("REDUCE", G["comp -> arith <= arith"]),
-            (69, G["fi"]): ("REDUCE", G["comp -> arith <= arith"]),
-            (69, G[","]): ("REDUCE", G["comp -> arith <= arith"]),
-            (69, G["pool"]): ("REDUCE", G["comp -> arith <= arith"]),
-            (70, G["("]): ("SHIFT", 11),
-            (70, G["id"]): ("SHIFT", 28),
-            (70, G["string"]): ("SHIFT", 34),
-            (70, G["int"]): ("SHIFT", 33),
-            (70, G["isvoid"]): ("SHIFT", 24),
-            (70, G["false"]): ("SHIFT", 26),
-            (70, G["true"]): ("SHIFT", 25),
-            (70, G["new"]): ("SHIFT", 22),
-            (70, G["~"]): ("SHIFT", 27),
-            (71, G["+"]): ("SHIFT", 39),
-            (71, G["-"]): ("SHIFT", 64),
-            (71, G[";"]): ("REDUCE", G["comp -> arith = arith"]),
-            (71, G[")"]): ("REDUCE", G["comp -> arith = arith"]),
-            (71, G["in"]): ("REDUCE", G["comp -> arith = arith"]),
-            (71, G["else"]): ("REDUCE", G["comp -> arith = arith"]),
-            (71, G["then"]): ("REDUCE", G["comp -> arith = arith"]),
-            (71, G["}"]): ("REDUCE", G["comp -> arith = arith"]),
-            (71, G["of"]): ("REDUCE", G["comp -> arith = arith"]),
-            (71, G["loop"]): ("REDUCE", G["comp -> arith = arith"]),
-            (71, G["error"]): ("REDUCE", G["comp -> arith = arith"]),
-            (71, G["fi"]): ("REDUCE", G["comp -> arith = arith"]),
-            (71, G[","]): ("REDUCE", G["comp -> arith = arith"]),
-            (71, G["pool"]): ("REDUCE", G["comp -> arith = arith"]),
-            (72, G[";"]): ("REDUCE", G["expr -> not expr"]),
-            (72, G[")"]): ("REDUCE", G["expr -> not expr"]),
-            (72, G["in"]): ("REDUCE", G["expr -> not expr"]),
-            (72, G["else"]): ("REDUCE", G["expr -> not expr"]),
-            (72, G["then"]): ("REDUCE", G["expr -> not expr"]),
-            (72, G["}"]): ("REDUCE", G["expr -> not expr"]),
-            (72, G["of"]): ("REDUCE", G["expr -> not expr"]),
-            (72, G["loop"]): ("REDUCE", G["expr -> not expr"]),
-            (72, G["error"]): ("REDUCE", G["expr -> not expr"]),
-            (72, G["fi"]): ("REDUCE", G["expr -> not expr"]),
-            (72, G[","]): ("REDUCE", G["expr -> not expr"]),
-            (72, G["pool"]): ("REDUCE", G["expr -> not expr"]),
-            (73, G[")"]): ("SHIFT", 74),
-            (74, G[")"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["-"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["in"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["*"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["}"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["/"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["of"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["<"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["fi"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["<="]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["@"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["="]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G[";"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["else"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["then"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["loop"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["error"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G[","]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["pool"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["+"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (74, G["."]): ("REDUCE", G["function-call -> id ( expr-list )"]),
-            (75, G[")"]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G["-"]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G["in"]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G["*"]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G["}"]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G["/"]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G["of"]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G["<"]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G["fi"]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G["<="]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G["="]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G[";"]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G["else"]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G["then"]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G["loop"]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G["error"]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G[","]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G["pool"]): ("REDUCE", G["factor -> ~ factor"]),
-            (75, G["+"]): ("REDUCE", G["factor -> ~ factor"]),
-            (76, G[")"]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G["-"]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G["in"]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G["*"]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G["}"]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G["/"]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G["of"]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G["<"]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G["fi"]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G["<="]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G["="]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G[";"]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G["else"]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G["then"]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G["loop"]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G["error"]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G[","]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G["pool"]): ("REDUCE", G["factor -> isvoid factor"]),
-            (76, G["+"]): ("REDUCE", G["factor -> isvoid factor"]),
-            (77, G["of"]): ("SHIFT", 78),
-            (78, G["id"]): ("SHIFT", 79),
-            (79, G[":"]): ("SHIFT", 80),
-            (80, G["type"]): ("SHIFT", 81),
-            (81, G["=>"]): ("SHIFT", 82),
-            (82, G["id"]): ("SHIFT", 31),
-            (82, G["~"]): ("SHIFT", 27),
-            (82, G["int"]): ("SHIFT", 33),
-            (82, G["case"]): ("SHIFT", 21),
-            (82, G["let"]): ("SHIFT", 14),
-            (82, G["true"]): ("SHIFT", 25),
-            (82, G["{"]): ("SHIFT", 10),
-            (82, G["new"]): ("SHIFT", 22),
-            (82, G["string"]): ("SHIFT", 34),
-            (82, G["false"]): ("SHIFT", 26),
-            (82, G["while"]): ("SHIFT", 13),
-            (82, G["isvoid"]): ("SHIFT", 24),
-            (82, G["not"]): ("SHIFT", 30),
-            (82, G["if"]): ("SHIFT", 12),
-            (82, G["("]): ("SHIFT", 11),
-            (83, G[";"]): ("SHIFT", 84),
-            (83, G["error"]): ("SHIFT", 86),
-            (84, G["id"]): ("SHIFT", 79),
-            (84, G["esac"]): ("REDUCE", G["case-list -> id : type => expr ;"]),
-            (85, G["esac"]): ("REDUCE", G["case-list -> id : type => expr ; case-list"]),
-            (86, G["id"]): ("SHIFT", 79),
-            (86, G["esac"]): ("REDUCE", G["case-list -> id : type => expr error"]),
-            (87, G["esac"]): ("REDUCE", G["case-list -> id : type => expr error case-list"]),
-            (88, G["esac"]): ("SHIFT", 89),
-            (89, G[";"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
-            (89, G[")"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
-            (89, G["in"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
-            (89, G["else"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
-            (89, G["then"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
-            (89, G["}"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
-            (89, G["of"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
-            (89, G["loop"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
-            (89, G["error"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
-            (89, G["fi"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
-            (89, G[","]): ("REDUCE", G["expr -> case expr of case-list esac"]),
-            (89, G["pool"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
-            (90, G[","]): ("SHIFT", 91),
-            (90, G["in"]): ("REDUCE", G["declaration-list -> id : type <- expr"]),
-            (91, G["id"]): ("SHIFT", 15),
-            (92, G["in"]): ("REDUCE", G["declaration-list -> id : type <- expr , declaration-list"]),
-            (93, G["in"]): ("SHIFT", 94),
-            (94, G["new"]): ("SHIFT", 22),
-            (94, G["true"]): ("SHIFT", 25),
-            (94, G["isvoid"]): ("SHIFT", 24),
-            (94, G["while"]): ("SHIFT", 13),
-            (94, G["string"]): ("SHIFT", 34),
-            (94, G["~"]): ("SHIFT", 27),
-            (94, G["not"]): ("SHIFT", 30),
-            (94, G["if"]): ("SHIFT", 12),
-            (94, G["false"]): ("SHIFT", 26),
-            (94, G["let"]): ("SHIFT", 14),
-            (94, G["case"]): ("SHIFT", 21),
-            (94, G["{"]): ("SHIFT", 10),
-            (94, G["id"]): ("SHIFT", 31),
-            (94, G["("]): ("SHIFT", 11),
-            (94, G["int"]): ("SHIFT", 33),
-            (95, G[";"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
-            (95, G[")"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
-            (95, G["in"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
-            (95, G["else"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
-            (95, G["then"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
-            (95, G["}"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
-            (95, G["of"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
-            (95, G["loop"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
-            (95, G["error"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
-            (95, G["fi"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
-            (95, G[","]): ("REDUCE", G["expr -> let declaration-list in expr"]),
-            (95, G["pool"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
-            (96, G["loop"]): ("SHIFT", 97),
-            (97, G["string"]): ("SHIFT", 34),
-            (97, G["false"]): ("SHIFT", 26),
-            (97, G["while"]): ("SHIFT", 13),
-            (97, G["("]): ("SHIFT", 11),
-            (97, G["id"]): ("SHIFT", 31),
-            (97, G["int"]): ("SHIFT", 33),
-            (97, G["not"]): ("SHIFT", 30),
-            (97, G["isvoid"]): ("SHIFT", 24),
-            (97, G["if"]): ("SHIFT", 12),
-            (97, G["new"]): ("SHIFT", 22),
-            (97, G["let"]): ("SHIFT", 14),
-            (97, G["case"]): ("SHIFT", 21),
-            (97, G["true"]): ("SHIFT", 25),
-            (97, G["~"]): ("SHIFT", 27),
-            (97, G["{"]): ("SHIFT", 10),
-            (98, G["pool"]): ("SHIFT", 99),
-            (99, G[";"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
-            (99, G[")"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
-            (99, G["in"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
-            (99, G["else"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
-            (99, G["then"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
-            (99, G["}"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
-            (99, G["of"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
-            (99, G["loop"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
-            (99, G["error"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
-            (99, G["fi"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
-            (99, G[","]): ("REDUCE", G["expr -> while expr loop expr pool"]),
-            (99, G["pool"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
-            (100, G["then"]): ("SHIFT", 101),
-            (101, G["not"]): ("SHIFT", 30),
+            (69, G["pool"]): ("REDUCE", G["comp -> arith = arith"]),
+            (69, G["then"]): ("REDUCE", G["comp -> arith = arith"]),
+            (69, G[")"]): ("REDUCE", G["comp -> arith = arith"]),
+            (69, G[";"]): ("REDUCE", G["comp -> arith = arith"]),
+            (69, G["}"]): ("REDUCE", G["comp -> arith = arith"]),
+            (69, G["of"]): ("REDUCE", G["comp -> arith = arith"]),
+            (69, G["else"]): ("REDUCE", G["comp -> arith = arith"]),
+            (69, G["error"]): ("REDUCE", G["comp -> arith = arith"]),
+            (69, G["loop"]): ("REDUCE", G["comp -> arith = arith"]),
+            (69, G["in"]): ("REDUCE", G["comp -> arith = arith"]),
+            (69, G["fi"]): ("REDUCE", G["comp -> arith = arith"]),
+            (69, G[","]): ("REDUCE", G["comp -> arith = arith"]),
+            (69, G["+"]): ("SHIFT", 37),
+            (69, G["-"]): ("SHIFT", 62),
+            (70, G["pool"]): ("REDUCE", G["expr -> not expr"]),
+            (70, G["then"]): ("REDUCE", G["expr -> not expr"]),
+            (70, G[")"]): ("REDUCE", G["expr -> not expr"]),
+            (70, G[";"]): ("REDUCE", G["expr -> not expr"]),
+            (70, G["}"]): ("REDUCE", G["expr -> not expr"]),
+            (70, G["of"]): ("REDUCE", G["expr -> not expr"]),
+            (70, G["else"]): ("REDUCE", G["expr -> not expr"]),
+            (70, G["error"]): ("REDUCE", G["expr -> not expr"]),
+            (70, G["loop"]): ("REDUCE", G["expr -> not expr"]),
+            (70, G["in"]): ("REDUCE", G["expr -> not expr"]),
+            (70, G["fi"]): ("REDUCE", G["expr -> not expr"]),
+            (70, G[","]): ("REDUCE", G["expr -> not expr"]),
+            (71, G[")"]): ("SHIFT", 72),
+            (72, G["pool"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["<="]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G[")"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["="]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["then"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["+"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["."]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["else"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["in"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["-"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G[","]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["fi"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["*"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["/"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G[";"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["}"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["@"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["<"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["of"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["error"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (72, G["loop"]): ("REDUCE", G["function-call -> id ( expr-list )"]),
+            (73, G["pool"]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G["<="]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G[")"]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G["then"]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G["="]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G["+"]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G["else"]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G["-"]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G["in"]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G[","]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G["fi"]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G["*"]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G["/"]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G[";"]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G["}"]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G["<"]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G["of"]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G["error"]): ("REDUCE", G["factor -> ~ factor"]),
+            (73, G["loop"]): ("REDUCE", G["factor -> ~ factor"]),
+            (74, G["pool"]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G["<="]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G[")"]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G["then"]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G["="]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G["+"]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G["else"]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G["-"]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G["in"]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G[","]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G["fi"]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G["*"]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G["/"]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G[";"]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G["}"]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G["<"]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G["of"]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G["error"]): ("REDUCE", G["factor -> isvoid factor"]),
+            (74, G["loop"]): ("REDUCE", G["factor -> isvoid factor"]),
+            (75, G["of"]): ("SHIFT", 76),
+            (76, G["id"]): ("SHIFT", 77),
+            (77, G[":"]): ("SHIFT", 78),
+            (78, G["type"]): ("SHIFT", 79),
+            (79, G["=>"]): ("SHIFT", 80),
+            (80, G["{"]): ("SHIFT", 10),
+            (80, G["string"]): ("SHIFT", 32),
+            (80, G["false"]): ("SHIFT", 24),
+            (80, G["("]): ("SHIFT", 11),
+            (80, G["case"]): ("SHIFT", 19),
+            (80, G["id"]): ("SHIFT", 29),
+            (80, G["if"]): ("SHIFT", 12),
+            (80, G["not"]): ("SHIFT", 28),
+            (80, G["isvoid"]): ("SHIFT", 22),
+            (80, G["new"]): ("SHIFT", 20),
+            (80, G["int"]): ("SHIFT", 31),
+            (80, G["~"]): ("SHIFT", 25),
+            (80, G["let"]): ("SHIFT", 14),
+            (80, G["while"]): ("SHIFT", 13),
+            (80, G["true"]): ("SHIFT", 23),
+            (81, G[";"]): ("SHIFT", 82),
+            (81, G["error"]): ("SHIFT", 83),
+            (82, G["id"]): ("REDUCE", G["case-list -> id : type => expr ;"]),
+            (82, G["esac"]): ("REDUCE", G["case-list -> id : type => expr ;"]),
+            (83, G["id"]): ("REDUCE", G["case-list -> id : type => expr error"]),
+            (83, G["esac"]): ("REDUCE", G["case-list -> id : type => expr error"]),
+            (84, G["id"]): ("SHIFT", 86),
+            (84, G["esac"]): ("SHIFT", 85),
+            (85, G["pool"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
+            (85, G["then"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
+            (85, G[")"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
+            (85, G[";"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
+            (85, G["}"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
+            (85, G["of"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
+            (85, G["else"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
+            (85, G["error"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
+            (85, G["loop"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
+            (85, G["in"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
+            (85, G["fi"]): ("REDUCE", G["expr -> case expr of case-list esac"]),
+            (85, G[","]): ("REDUCE", G["expr -> case expr of case-list esac"]),
+            (86, G[":"]): ("SHIFT", 87),
+            (87, G["type"]): ("SHIFT", 88),
+            (88, G["=>"]): ("SHIFT", 89),
+            (89, G["{"]): ("SHIFT", 10),
+            (89, G["string"]): ("SHIFT", 32),
+            (89, G["false"]): ("SHIFT", 24),
+            (89, G["("]): ("SHIFT", 11),
+            (89, G["case"]): ("SHIFT", 19),
+            (89, G["id"]): ("SHIFT", 29),
+            (89, G["if"]): ("SHIFT", 12),
+            (89, G["not"]): ("SHIFT", 28),
+            (89, G["isvoid"]): ("SHIFT", 22),
+            (89, G["new"]): ("SHIFT", 20),
+            (89, G["int"]): ("SHIFT", 31),
+            (89, G["~"]): ("SHIFT", 25),
+            (89, G["let"]): ("SHIFT", 14),
+            (89, G["while"]): ("SHIFT", 13),
+            (89, G["true"]): ("SHIFT", 23),
+            (90, G[";"]): ("SHIFT", 91),
+            (90, G["error"]): ("SHIFT", 92),
+            (91, G["id"]): ("REDUCE", G["case-list -> case-list id : type => expr ;"]),
+            (91, G["esac"]): ("REDUCE", G["case-list -> case-list id : type => expr ;"]),
+            (92, G["id"]): ("REDUCE", G["case-list -> case-list id : type => expr error"]),
+            (92, G["esac"]): ("REDUCE", G["case-list -> case-list id : type => expr error"]),
+            (93, G["in"]): ("REDUCE", G["declaration-list -> id : type <- expr"]),
+            (93, G[","]): ("REDUCE", G["declaration-list -> id : type <- expr"]),
+            (94, G[","]): ("SHIFT", 95),
+            (94, G["in"]): ("SHIFT", 101),
+            (95, G["id"]): ("SHIFT", 96),
+            (96, G[":"]): ("SHIFT", 97),
+            (97, G["type"]): ("SHIFT", 98),
+            (98, G["<-"]): ("SHIFT", 99),
+            (98, G["in"]): ("REDUCE", G["declaration-list -> declaration-list , id : type"]),
+            (98, G[","]): ("REDUCE", G["declaration-list -> declaration-list , id : type"]),
+            (99, G["isvoid"]): ("SHIFT", 22),
+            (99, G["true"]): ("SHIFT", 23),
+            (99, G["let"]): ("SHIFT", 14),
+            (99, G["~"]): ("SHIFT", 25),
+            (99, G["false"]): ("SHIFT", 24),
+            (99, G["while"]): ("SHIFT", 13),
+            (99, G["string"]): ("SHIFT", 32),
+            (99, G["("]): ("SHIFT", 11),
+            (99, G["{"]): ("SHIFT", 10),
+            (99, G["id"]): ("SHIFT", 29),
+            (99, G["case"]): ("SHIFT", 19),
+            (99, G["new"]): ("SHIFT", 20),
+            (99, G["int"]): ("SHIFT", 31),
+            (99, G["if"]): ("SHIFT", 12),
+            (99, G["not"]): ("SHIFT", 28),
+            (100, G["in"]): ("REDUCE", G["declaration-list -> declaration-list , id : type <- expr"]),
+            (100, G[","]): ("REDUCE", G["declaration-list -> declaration-list , id : type <- expr"]),
+            (101, G["string"]): ("SHIFT", 32),
+            (101, G["while"]): ("SHIFT", 13),
+            (101, G["("]): ("SHIFT", 11),
+            (101, G["{"]): ("SHIFT", 10),
+            (101, G["id"]): ("SHIFT", 29),
+            (101, G["~"]): ("SHIFT", 25),
+            (101, G["new"]): ("SHIFT", 20),
+            (101, G["case"]): ("SHIFT", 19),
+            (101, G["not"]): ("SHIFT", 28),
+            (101, G["int"]): ("SHIFT", 31),
             (101, G["if"]): ("SHIFT", 12),
-            (101, G["string"]): ("SHIFT", 34),
-            (101, G["isvoid"]): ("SHIFT", 24),
+            (101, G["true"]): ("SHIFT", 23),
+            (101, G["isvoid"]): ("SHIFT", 22),
             (101, G["let"]): ("SHIFT", 14),
-            (101, G["case"]): ("SHIFT", 21),
-            (101, G["false"]): ("SHIFT", 26),
-            (101, G["id"]): ("SHIFT", 31),
-            (101, G["{"]): ("SHIFT", 10),
-            (101, G["~"]): ("SHIFT", 27),
-            (101, G["("]): ("SHIFT", 11),
-            (101, G["int"]): ("SHIFT", 33),
-            (101, G["new"]): ("SHIFT", 22),
-            (101, G["while"]): ("SHIFT", 13),
-            (101, G["true"]): ("SHIFT", 25),
-            (102, G["else"]): ("SHIFT", 103),
-            (103, G["not"]): ("SHIFT", 30),
-            (103, G["if"]): ("SHIFT", 12),
-            (103, G["string"]): ("SHIFT", 34),
-            (103, G["let"]): ("SHIFT", 14),
-            (103, G["case"]): ("SHIFT", 21),
-            (103, G["id"]): ("SHIFT", 31),
-            (103, G["{"]): ("SHIFT", 10),
-            (103, G["isvoid"]): ("SHIFT", 24),
-            (103, G["false"]): ("SHIFT", 26),
-            (103, G["("]): ("SHIFT", 11),
-            (103, G["~"]): ("SHIFT", 27),
-            (103, G["int"]): ("SHIFT", 33),
-            (103, G["while"]): ("SHIFT", 13),
-            (103, G["true"]): ("SHIFT", 25),
-            (103, G["new"]): ("SHIFT", 22),
-            (104, G["fi"]): ("SHIFT", 105),
-            (105, G[";"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
-            (105, G[")"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
-            (105, G["in"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
-            (105, G["else"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
-            (105, G["then"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
-            (105, G["}"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
-            (105, G["of"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
-            (105, G["loop"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
-            (105, G["error"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
-            (105, G["fi"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
-            (105, G[","]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
-            (105, G["pool"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
-            (106, G[")"]): ("SHIFT", 107),
-            (107, G[")"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["-"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["in"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["*"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["}"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["/"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["of"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["<"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["fi"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["<="]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["@"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["="]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G[";"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["else"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["then"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["loop"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["error"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G[","]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["pool"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["+"]): ("REDUCE", G["atom -> ( expr )"]),
-            (107, G["."]): ("REDUCE", G["atom -> ( expr )"]),
-            (108, G["}"]): ("SHIFT", 109),
-            (109, G[";"]): ("REDUCE", G["expr -> { block }"]),
-            (109, G[")"]): ("REDUCE", G["expr -> { block }"]),
-            (109, G["in"]): ("REDUCE", G["expr -> { block }"]),
-            (109, G["else"]): ("REDUCE", G["expr -> { block }"]),
-            (109, G["then"]): ("REDUCE", G["expr -> { block }"]),
-            (109, G["}"]): ("REDUCE", G["expr -> { block }"]),
-            (109, G["of"]): ("REDUCE", G["expr -> { block }"]),
-            (109, G["loop"]): ("REDUCE", G["expr -> { block }"]),
-            (109, G["error"]): ("REDUCE", G["expr -> { block }"]),
-            (109, G["fi"]): ("REDUCE", G["expr -> { block }"]),
-            (109, G[","]): ("REDUCE", G["expr -> { block }"]),
-            (109, G["pool"]): ("REDUCE", G["expr -> { block }"]),
-            (110, G[";"]): ("SHIFT", 111),
-            (110, G["error"]): ("SHIFT", 113),
-            (111, G["}"]): ("REDUCE", G["block -> expr ;"]),
-            (111, G["id"]): ("SHIFT", 31),
-            (111, G["~"]): ("SHIFT", 27),
-            (111, G["int"]): ("SHIFT", 33),
-            (111, G["case"]): ("SHIFT", 21),
-            (111, G["let"]): ("SHIFT", 14),
-            (111, G["true"]): ("SHIFT", 25),
-            (111, G["{"]): ("SHIFT", 10),
-            (111, G["new"]): ("SHIFT", 22),
-            (111, G["string"]): ("SHIFT", 34),
-            (111, G["false"]): ("SHIFT", 26),
-            (111, G["while"]): ("SHIFT", 13),
-            (111, G["isvoid"]): ("SHIFT", 24),
-            (111, G["not"]): ("SHIFT", 30),
-            (111, G["if"]): ("SHIFT", 12),
-            (111, G["("]): ("SHIFT", 11),
-            (112, G["}"]): ("REDUCE", G["block -> expr ; block"]),
-            (113, G["id"]): ("SHIFT", 31),
-            (113, G["~"]): ("SHIFT", 27),
-            (113, G["int"]): ("SHIFT", 33),
-            (113, G["case"]): ("SHIFT", 21),
-            (113, G["let"]): ("SHIFT", 14),
-            (113, G["true"]): ("SHIFT", 25),
-            (113, G["{"]): ("SHIFT", 10),
-            (113, G["new"]): ("SHIFT", 22),
-            (113, G["string"]): ("SHIFT", 34),
-            (113, G["false"]): ("SHIFT", 26),
-            (113, G["while"]): ("SHIFT", 13),
-            (113, G["isvoid"]): ("SHIFT", 24),
-            (113, G["}"]): ("REDUCE", G["block -> expr error"]),
-            (113, G["not"]): ("SHIFT", 30),
-            (113, G["if"]): ("SHIFT", 12),
-            (113, G["("]): ("SHIFT", 11),
-            (114, G["}"]): ("REDUCE", G["block -> expr error block"]),
+            (101, G["false"]): ("SHIFT", 24),
+            (102, G["pool"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
+            (102, G["then"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
+            (102, G[")"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
+            (102, G[";"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
+            (102, G["}"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
+            (102, G["of"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
+            (102, G["else"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
+            (102, G["error"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
+            (102, G["loop"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
+            (102, G["in"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
+            (102, G["fi"]): ("REDUCE", G["expr -> let declaration-list in expr"]),
+            (102, G[","]): ("REDUCE", G["expr -> let declaration-list in expr"]),
+            (103, G["loop"]): ("SHIFT", 104),
+            (104, G["case"]): ("SHIFT", 19),
+            (104, G["id"]): ("SHIFT", 29),
+            (104, G["not"]): ("SHIFT", 28),
+            (104, G["if"]): ("SHIFT", 12),
+            (104, G["isvoid"]): ("SHIFT", 22),
+            (104, G["true"]): ("SHIFT", 23),
+            (104, G["false"]): ("SHIFT", 24),
+            (104, G["string"]): ("SHIFT", 32),
+            (104, G["~"]): ("SHIFT", 25),
+            (104, G["("]): ("SHIFT", 11),
+            (104, G["let"]): ("SHIFT", 14),
+            (104, G["while"]): ("SHIFT", 13),
+            (104, G["{"]): ("SHIFT", 10),
+            (104, G["new"]): ("SHIFT", 20),
+            (104, G["int"]): ("SHIFT", 31),
+            (105, G["pool"]): ("SHIFT", 106),
+            (106, G["pool"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
+            (106, G["then"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
+            (106, G[")"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
+            (106, G[";"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
+            (106, G["}"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
+            (106, G["of"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
+            (106, G["else"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
+            (106, G["error"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
+            (106, G["loop"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
+            (106, G["in"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
+            (106, G["fi"]): ("REDUCE", G["expr -> while expr loop expr pool"]),
+            (106, G[","]): ("REDUCE", G["expr -> while expr loop expr pool"]),
+            (107, G["then"]): ("SHIFT", 108),
+            (108, G["int"]): ("SHIFT", 31),
+            (108, G["while"]): ("SHIFT", 13),
+            (108, G["id"]): ("SHIFT", 29),
+            (108, G["{"]): ("SHIFT", 10),
+            (108, G["case"]): ("SHIFT", 19),
+            (108, G["not"]): ("SHIFT", 28),
+            (108, G["if"]): ("SHIFT", 12),
+            (108, G["isvoid"]): ("SHIFT", 22),
+            (108, G["true"]): ("SHIFT", 23),
+            (108, G["false"]): ("SHIFT", 24),
+            (108, G["string"]): ("SHIFT", 32),
+            (108, G["("]): ("SHIFT", 11),
+            (108, G["~"]): ("SHIFT", 25),
+            (108, G["new"]): ("SHIFT", 20),
+            (108, G["let"]): ("SHIFT", 14),
+            (109, G["else"]): ("SHIFT", 110),
+            (110, G["let"]): ("SHIFT", 14),
+            (110, G["while"]): ("SHIFT", 13),
+            (110, G["~"]): ("SHIFT", 25),
+            (110, G["{"]): ("SHIFT", 10),
+            (110, G["true"]): ("SHIFT", 23),
+            (110, G["case"]): ("SHIFT", 19),
+            (110, G["if"]): ("SHIFT", 12),
+            (110, G["id"]): ("SHIFT", 29),
+            (110, G["not"]): ("SHIFT", 28),
+            (110, G["false"]): ("SHIFT", 24),
+            (110, G["string"]): ("SHIFT", 32),
+            (110, G["("]): ("SHIFT", 11),
+            (110, G["new"]): ("SHIFT", 20),
+            (110, G["int"]): ("SHIFT", 31),
+            (110, G["isvoid"]): ("SHIFT", 22),
+            (111, G["fi"]): ("SHIFT", 112),
+            (112, G["pool"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
+            (112, G["then"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
+            (112, G[")"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
+            (112, G[";"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
+            (112, G["}"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
+            (112, G["of"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
+            (112, G["else"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
+            (112, G["error"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
+            (112, G["loop"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
+            (112, G["in"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
+            (112, G["fi"]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
+            (112, G[","]): ("REDUCE", G["expr -> if expr then expr else expr fi"]),
+            (113, G[")"]): ("SHIFT", 114),
+            (114, G["pool"]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["<="]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G[")"]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["then"]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["="]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["+"]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["."]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["else"]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["in"]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["-"]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G[","]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["fi"]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["*"]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["/"]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G[";"]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["}"]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["@"]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["<"]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["of"]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["error"]): ("REDUCE", G["atom -> ( expr )"]),
+            (114, G["loop"]): ("REDUCE", G["atom -> ( expr )"]),
+            (115, G["{"]): ("SHIFT", 10),
+            (115, G["string"]): ("SHIFT", 32),
+            (115, G["false"]): ("SHIFT", 24),
+            (115, G["("]): ("SHIFT", 11),
+            (115, G["case"]): ("SHIFT", 19),
+            (115, G["id"]): ("SHIFT", 29),
+            (115, G["if"]): ("SHIFT", 12),
+            (115, G["not"]): ("SHIFT", 28),
+            (115, G["isvoid"]): ("SHIFT", 22),
+            (115, G["new"]): ("SHIFT", 20),
             (115, G["}"]): ("SHIFT", 116),
-            (116, G[";"]): ("REDUCE", G["method -> id ( ) : type { expr }"]),
-            (116, G["error"]): ("REDUCE", G["method -> id ( ) : type { expr }"]),
-            (117, G[":"]): ("SHIFT", 118),
-            (118, G["type"]): ("SHIFT", 119),
-            (119, G[","]): ("SHIFT", 120),
-            (119, G[")"]): ("REDUCE", G["param-list -> id : type"]),
-            (120, G["id"]): ("SHIFT", 117),
-            (121, G[")"]): ("REDUCE", G["param-list -> id : type , param-list"]),
-            (122, G[")"]): ("SHIFT", 123),
-            (123, G[":"]): ("SHIFT", 124),
-            (124, G["type"]): ("SHIFT", 125),
-            (125, G["{"]): ("SHIFT", 126),
-            (126, G["not"]): ("SHIFT", 30),
-            (126, G["if"]): ("SHIFT", 12),
-            (126, G["("]): ("SHIFT", 11),
-            (126, G["id"]): ("SHIFT", 31),
-            (126, G["case"]): ("SHIFT", 21),
-            (126, G["let"]): ("SHIFT", 14),
-            (126, G["int"]): ("SHIFT", 33),
-            (126, G["isvoid"]): ("SHIFT", 24),
-            (126, G["{"]): ("SHIFT", 10),
-            (126, G["true"]): ("SHIFT", 25),
-            (126, G["new"]): ("SHIFT", 22),
-            (126, G["~"]): ("SHIFT", 27),
-            (126, G["string"]): ("SHIFT", 34),
-            (126, G["while"]): ("SHIFT", 13),
-            (126, G["false"]): ("SHIFT", 26),
-            (127, G["}"]): ("SHIFT", 128),
-            (128, G[";"]): ("REDUCE", G["method -> id ( param-list ) : type { expr }"]),
-            (128, G["error"]): ("REDUCE", G["method -> id ( param-list ) : type { expr }"]),
-            (129, G["type"]): ("SHIFT", 130),
-            (130, G[";"]): ("REDUCE", G["attribute -> id : type"]),
-            (130, G["error"]): ("REDUCE", G["attribute -> id : type"]),
-            (130, G["<-"]): ("SHIFT", 131),
-            (131, G["id"]): ("SHIFT", 31),
-            (131, G["int"]): ("SHIFT", 33),
-            (131, G["~"]): ("SHIFT", 27),
-            (131, G["let"]): ("SHIFT", 14),
-            (131, G["case"]): ("SHIFT", 21),
-            (131, G["true"]): ("SHIFT", 25),
-            (131, G["new"]): ("SHIFT", 22),
-            (131, G["{"]): ("SHIFT", 10),
-            (131, G["string"]): ("SHIFT", 34),
-            (131, G["false"]): ("SHIFT", 26),
-            (131, G["while"]): ("SHIFT", 13),
-            (131, G["isvoid"]): ("SHIFT", 24),
-            (131, G["not"]): ("SHIFT", 30),
-            (131, G["if"]): ("SHIFT", 12),
-            (131, G["("]): ("SHIFT", 11),
-            (132, G[";"]): ("REDUCE", G["attribute -> id : type <- expr"]),
-            (132, G["error"]): ("REDUCE", G["attribute -> id : type <- expr"]),
+            (115, G["int"]): ("SHIFT", 31),
+            (115, G["~"]): ("SHIFT", 25),
+            (115, G["let"]): ("SHIFT", 14),
+            (115, G["while"]): ("SHIFT", 13),
+            (115, G["true"]): ("SHIFT", 23),
+            (116, G["pool"]): ("REDUCE", G["expr -> { block }"]),
+            (116, G["then"]): ("REDUCE", G["expr -> { block }"]),
+            (116, G[")"]): ("REDUCE", G["expr -> { block }"]),
+            (116, G[";"]): ("REDUCE", G["expr -> { block }"]),
+            (116, G["}"]): ("REDUCE", G["expr -> { block }"]),
+            (116, G["of"]): ("REDUCE", G["expr -> { block }"]),
+            (116, G["else"]): ("REDUCE", G["expr -> { block }"]),
+            (116, G["error"]): ("REDUCE", G["expr -> { block }"]),
+            (116, G["loop"]): ("REDUCE", G["expr -> { block }"]),
+            (116, G["in"]): ("REDUCE", G["expr -> { block }"]),
+            (116, G["fi"]): ("REDUCE", G["expr -> { block }"]),
+            (116, G[","]): ("REDUCE", G["expr -> { block }"]),
+            (117, G[";"]): ("SHIFT", 118),
+            (117, G["error"]): ("SHIFT", 119),
+            (118, G["new"]): ("REDUCE", G["block -> block expr ;"]),
+            (118, G["let"]): ("REDUCE", G["block -> block expr ;"]),
+            (118, G["~"]): ("REDUCE", G["block -> block expr ;"]),
+            (118, G["isvoid"]): ("REDUCE", G["block -> block expr ;"]),
+            (118, G["string"]): ("REDUCE", G["block -> block expr ;"]),
+            (118, G["id"]): ("REDUCE", G["block -> block expr ;"]),
+            (118, G["case"]): ("REDUCE", G["block -> block expr ;"]),
+            (118, G["true"]): ("REDUCE", G["block -> block expr ;"]),
+            (118, G["while"]): ("REDUCE", G["block -> block expr ;"]),
+            (118, G["{"]): ("REDUCE", G["block -> block expr ;"]),
+            (118, G["}"]): ("REDUCE", G["block -> block expr ;"]),
+            (118, G["false"]): ("REDUCE", G["block -> block expr ;"]),
+            (118, G["int"]): ("REDUCE", G["block -> block expr ;"]),
+            (118, G["("]): ("REDUCE", G["block -> block expr ;"]),
+            (118, G["if"]): ("REDUCE", G["block -> block expr ;"]),
+            (118, G["not"]): ("REDUCE", G["block -> block expr ;"]),
+            (119, G["new"]): ("REDUCE", G["block -> block expr error"]),
+            (119, G["let"]): ("REDUCE", G["block -> block expr error"]),
+            (119, G["~"]): ("REDUCE", G["block -> block expr error"]),
+            (119, G["isvoid"]): ("REDUCE", G["block -> block expr error"]),
+            (119, G["string"]): ("REDUCE", G["block -> block expr error"]),
+            (119, G["id"]): ("REDUCE", G["block -> block expr error"]),
+            (119, G["case"]): ("REDUCE", G["block -> block expr error"]),
+            (119, G["true"]): ("REDUCE", G["block -> block expr error"]),
+            (119, G["while"]): ("REDUCE", G["block -> block expr error"]),
+            (119, G["{"]): ("REDUCE", G["block -> block expr error"]),
+            (119, G["}"]): ("REDUCE", G["block -> block expr error"]),
+            (119, G["false"]): ("REDUCE", G["block -> block expr error"]),
+            (119, G["int"]): ("REDUCE", G["block -> block expr error"]),
+            (119, G["("]): ("REDUCE", G["block -> block expr error"]),
+            (119, G["if"]): ("REDUCE", G["block -> block expr error"]),
+            (119, G["not"]): ("REDUCE", G["block -> block expr error"]),
+            (120, G[";"]): ("SHIFT", 121),
+            (120, G["error"]): ("SHIFT", 122),
+            (121, G["new"]): ("REDUCE", G["block -> expr ;"]),
+            (121, G["let"]): ("REDUCE", G["block -> expr ;"]),
+            (121, G["if"]): ("REDUCE", G["block -> expr ;"]),
+            (121, G["~"]): ("REDUCE", G["block -> expr ;"]),
+            (121, G["isvoid"]): ("REDUCE", G["block -> expr ;"]),
+            (121, G["id"]): ("REDUCE", G["block -> expr ;"]),
+            (121, G["case"]): ("REDUCE", G["block -> expr ;"]),
+            (121, G["true"]): ("REDUCE", G["block -> expr ;"]),
+            (121, G["while"]): ("REDUCE", G["block -> expr ;"]),
+            (121, G["{"]): ("REDUCE", G["block -> expr ;"]),
+            (121, G["}"]): ("REDUCE", G["block -> expr ;"]),
+            (121, G["false"]): ("REDUCE", G["block -> expr ;"]),
+            (121, G["int"]): ("REDUCE", G["block -> expr ;"]),
+            (121, G["("]): ("REDUCE", G["block -> expr ;"]),
+            (121, G["string"]): ("REDUCE", G["block -> expr ;"]),
+            (121, G["not"]): ("REDUCE", G["block -> expr ;"]),
+            (122, G["new"]): ("REDUCE", G["block -> expr error"]),
+            (122, G["let"]): ("REDUCE", G["block -> expr error"]),
+            (122, G["if"]): ("REDUCE", G["block -> expr error"]),
+            (122, G["~"]): ("REDUCE", G["block -> expr error"]),
+            (122, G["isvoid"]): ("REDUCE", G["block -> expr error"]),
+            (122, G["id"]): ("REDUCE", G["block -> expr error"]),
+            (122, G["case"]): ("REDUCE", G["block -> expr error"]),
+            (122, G["true"]): ("REDUCE", G["block -> expr error"]),
+            (122, G["while"]): ("REDUCE", G["block -> expr error"]),
+            (122, G["{"]): ("REDUCE", G["block -> expr error"]),
+            (122, G["}"]): ("REDUCE", G["block -> expr error"]),
+            (122, G["false"]): ("REDUCE", G["block -> expr error"]),
+            (122, G["int"]): ("REDUCE", G["block -> expr error"]),
+            (122, G["("]): ("REDUCE", G["block -> expr error"]),
+            (122, G["string"]): ("REDUCE", G["block -> expr error"]),
+            (122, G["not"]): ("REDUCE", G["block -> expr error"]),
+            (123, G["}"]): ("SHIFT", 124),
+            (124, G[";"]): ("REDUCE", G["method -> id ( ) : type { expr }"]),
+            (124, G["error"]): ("REDUCE", G["method -> id ( ) : type { expr }"]),
+            (125, G[":"]): ("SHIFT", 126),
+            (126, G["type"]): ("SHIFT", 127),
+            (127, G[","]): ("REDUCE", G["param-list -> id : type"]),
+            (127, G[")"]): ("REDUCE", G["param-list -> id : type"]),
+            (128, G[","]): ("SHIFT", 135),
+            (128, G[")"]): ("SHIFT", 129),
+            (129, G[":"]): ("SHIFT", 130),
+            (130, G["type"]): ("SHIFT", 131),
+            (131, G["{"]): ("SHIFT", 132),
+            (132, G["isvoid"]): ("SHIFT", 22),
+            (132, G["~"]): ("SHIFT", 25),
+            (132, G["true"]): ("SHIFT", 23),
+            (132, G["let"]): ("SHIFT", 14),
+            (132, G["false"]): ("SHIFT", 24),
+            (132, G["while"]): ("SHIFT", 13),
+            (132, G["string"]): ("SHIFT", 32),
+            (132, G["("]): ("SHIFT", 11),
+            (132, G["{"]): ("SHIFT", 10),
+            (132, G["id"]): ("SHIFT", 29),
+            (132, G["new"]): ("SHIFT", 20),
+            (132, G["case"]): ("SHIFT", 19),
+            (132, G["not"]): ("SHIFT", 28),
+            (132, G["int"]): ("SHIFT", 31),
+            (132, G["if"]): ("SHIFT", 12),
             (133, G["}"]): ("SHIFT", 134),
-            (134, G["$"]): ("REDUCE", G["class-def -> class type { feature-list }"]),
-            (134, G["class"]): ("REDUCE", G["class-def -> class type { feature-list }"]),
-            (135, G["error"]): ("SHIFT", 143),
-            (135, G[";"]): ("SHIFT", 136),
-            (136, G["id"]): ("SHIFT", 4),
-            (136, G["}"]): ("REDUCE", G["feature-list -> e"]),
-            (137, G["}"]): ("REDUCE", G["feature-list -> attribute ; feature-list"]),
-            (138, G["error"]): ("SHIFT", 141),
-            (138, G[";"]): ("SHIFT", 139),
-            (139, G["id"]): ("SHIFT", 4),
-            (139, G["}"]): ("REDUCE", G["feature-list -> e"]),
-            (140, G["}"]): ("REDUCE", G["feature-list -> method ; feature-list"]),
-            (141, G["id"]): ("SHIFT", 4),
-            (141, G["}"]): ("REDUCE", G["feature-list -> e"]),
-            (142, G["}"]): ("REDUCE", G["feature-list -> method error feature-list"]),
-            (143, G["id"]): ("SHIFT", 4),
-            (143, G["}"]): ("REDUCE", G["feature-list -> e"]),
-            (144, G["}"]): ("REDUCE", G["feature-list -> attribute error feature-list"]),
-            (145, G["type"]): ("SHIFT", 146),
-            (146, G["{"]): ("SHIFT", 147),
-            (147, G["id"]): ("SHIFT", 4),
-            (147, G["}"]): ("REDUCE", G["feature-list -> e"]),
-            (148, G["}"]): ("SHIFT", 149),
-            (149, G["$"]): ("REDUCE", G["class-def -> class type inherits type { feature-list }"]),
-            (149, G["class"]): ("REDUCE", G["class-def -> class type inherits type { feature-list }"]),
-            (150, G["$"]): ("OK", None),
-            (151, G["$"]): ("REDUCE", G["program -> class-list"]),
-            (152, G["class"]): ("SHIFT", 1),
-            (152, G["$"]): ("REDUCE", G["class-list -> class-def"]),
-            (153, G["$"]): ("REDUCE", G["class-list -> class-def class-list"]),
+            (134, G[";"]): ("REDUCE", G["method -> id ( param-list ) : type { expr }"]),
+            (134, G["error"]): ("REDUCE", G["method -> id ( param-list ) : type { expr }"]),
+            (135, G["id"]): ("SHIFT", 136),
+            (136, G[":"]): ("SHIFT", 137),
+            (137, G["type"]): ("SHIFT", 138),
+            (138, G[")"]): ("REDUCE", G["param-list -> param-list , id : type"]),
+            (138, G[","]): ("REDUCE", G["param-list -> param-list , id : type"]),
+            (139, G["type"]): ("SHIFT", 140),
+            (140, G[";"]): ("REDUCE", G["attribute -> id : type"]),
+            (140, G["error"]): ("REDUCE", G["attribute -> id : type"]),
+            (140, G["<-"]): ("SHIFT", 141),
+            (141, G["false"]): ("SHIFT", 24),
+            (141, G["string"]): ("SHIFT", 32),
+            (141, G["{"]): ("SHIFT", 10),
+            (141, G["("]): ("SHIFT", 11),
+            (141, G["case"]): ("SHIFT", 19),
+            (141, G["id"]): ("SHIFT", 29),
+            (141, G["if"]): ("SHIFT", 12),
+            (141, G["not"]): ("SHIFT", 28),
+            (141, G["isvoid"]): ("SHIFT", 22),
+            (141, G["new"]): ("SHIFT", 20),
+            (141, G["int"]): ("SHIFT", 31),
+            (141, G["~"]): ("SHIFT", 25),
+            (141, G["let"]): ("SHIFT", 14),
+            (141, G["while"]): ("SHIFT", 13),
+            (141, G["true"]): ("SHIFT", 23),
+            (142, G[";"]): ("REDUCE", G["attribute -> id : type <- expr"]),
+            (142, G["error"]): ("REDUCE", G["attribute -> id : type <- expr"]),
+            (143, G["}"]): ("SHIFT", 144),
+            (144, G["class"]): ("REDUCE", G["class-def -> class type { feature-list }"]),
+            (144, G["$"]): ("REDUCE", G["class-def -> class type { feature-list }"]),
+            (145, G["error"]): ("SHIFT", 153),
+            (145, G[";"]): ("SHIFT", 146),
+            (146, G["id"]): ("SHIFT", 4),
+            (146, G["}"]): ("REDUCE", G["feature-list -> e"]),
+            (147, G["}"]): ("REDUCE", G["feature-list -> attribute ; feature-list"]),
+            (148, G[";"]): ("SHIFT", 149),
+            (148, G["error"]): ("SHIFT", 151),
+            (149, G["id"]): ("SHIFT", 4),
+            (149, G["}"]): ("REDUCE", G["feature-list -> e"]),
+            (150, G["}"]): ("REDUCE", G["feature-list -> method ; feature-list"]),
+            (151, G["id"]): ("SHIFT", 4),
+            (151, G["}"]): ("REDUCE", G["feature-list -> e"]),
+            (152, G["}"]): ("REDUCE", G["feature-list -> method error feature-list"]),
+            (153, G["id"]): ("SHIFT", 4),
+            (153, G["}"]): ("REDUCE", G["feature-list -> e"]),
+            (154, G["}"]): ("REDUCE", G["feature-list -> attribute error feature-list"]),
+            (155, G["type"]): ("SHIFT", 156),
+            (156, G["{"]): ("SHIFT", 157),
+            (157, G["id"]): ("SHIFT", 4),
+            (157, G["}"]): ("REDUCE", G["feature-list -> e"]),
+            (158, G["}"]): ("SHIFT", 159),
+            (159, G["class"]): ("REDUCE", G["class-def -> class type inherits type { feature-list }"]),
+            (159, G["$"]): ("REDUCE", G["class-def -> class type inherits type { feature-list }"]),
+            (160, G["$"]): ("OK", None),
+            (161, G["$"]): ("REDUCE", G["program -> class-list"]),
+            (161, G["class"]): ("SHIFT", 1),
+            (162, G["class"]): ("REDUCE", G["class-list -> class-list class-def"]),
+            (162, G["$"]): ("REDUCE", G["class-list -> class-list class-def"]),
+            (163, G["class"]): ("REDUCE", G["class-list -> class-def"]),
+            (163, G["$"]): ("REDUCE", G["class-list -> class-def"]),
         }
 
     @staticmethod
     def __goto_table():
         return {
-            (0, G["program"]): 150,
-            (0, G["class-list"]): 151,
-            (0, G["class-def"]): 152,
-            (3, G["method"]): 138,
-            (3, G["attribute"]): 135,
-            (3, G["feature-list"]): 133,
-            (5, G["param-list"]): 122,
-            (9, G["atom"]): 43,
-            (9, G["term"]): 53,
-            (9, G["function-call"]): 35,
-            (9, G["arith"]): 38,
-            (9, G["expr"]): 115,
-            (9, G["factor"]): 56,
-            (9, G["comp"]): 37,
-            (10, G["expr"]): 110,
-            (10, G["block"]): 108,
-            (10, G["arith"]): 38,
-            (10, G["factor"]): 56,
-            (10, G["term"]): 53,
-            (10, G["atom"]): 43,
-            (10, G["comp"]): 37,
-            (10, G["function-call"]): 35,
-            (11, G["arith"]): 38,
-            (11, G["term"]): 53,
-            (11, G["expr"]): 106,
-            (11, G["comp"]): 37,
-            (11, G["atom"]): 43,
-            (11, G["factor"]): 56,
-            (11, G["function-call"]): 35,
-            (12, G["atom"]): 43,
-            (12, G["arith"]): 38,
-            (12, G["expr"]): 100,
-            (12, G["term"]): 53,
-            (12, G["function-call"]): 35,
-            (12, G["comp"]): 37,
-            (12, G["factor"]): 56,
-            (13, G["arith"]): 38,
-            (13, G["term"]): 53,
-            (13, G["atom"]): 43,
-            (13, G["comp"]): 37,
-            (13, G["function-call"]): 35,
-            (13, G["expr"]): 96,
-            (13, G["factor"]): 56,
-            (14, G["declaration-list"]): 93,
-            (18, G["declaration-list"]): 19,
-            (20, G["term"]): 53,
-            (20, G["expr"]): 90,
-            (20, G["atom"]): 43,
-            (20, G["arith"]): 38,
-            (20, G["factor"]): 56,
-            (20, G["function-call"]): 35,
-            (20, G["comp"]): 37,
-            (21, G["arith"]): 38,
-            (21, G["factor"]): 56,
-            (21, G["expr"]): 77,
-            (21, G["term"]): 53,
-            (21, G["atom"]): 43,
-            (21, G["comp"]): 37,
-            (21, G["function-call"]): 35,
-            (24, G["atom"]): 43,
-            (24, G["factor"]): 76,
-            (24, G["function-call"]): 35,
-            (27, G["atom"]): 43,
-            (27, G["factor"]): 75,
-            (27, G["function-call"]): 35,
-            (29, G["arith"]): 38,
-            (29, G["expr"]): 50,
-            (29, G["comp"]): 37,
-            (29, G["not-empty-expr-list"]): 49,
-            (29, G["atom"]): 43,
-            (29, G["factor"]): 56,
-            (29, G["term"]): 53,
-            (29, G["function-call"]): 35,
-            (29, G["expr-list"]): 73,
-            (30, G["arith"]): 38,
-            (30, G["factor"]): 56,
-            (30, G["atom"]): 43,
-            (30, G["term"]): 53,
-            (30, G["function-call"]): 35,
-            (30, G["expr"]): 72,
-            (30, G["comp"]): 37,
-            (32, G["arith"]): 38,
-            (32, G["factor"]): 56,
-            (32, G["atom"]): 43,
-            (32, G["term"]): 53,
-            (32, G["function-call"]): 35,
-            (32, G["expr"]): 36,
-            (32, G["comp"]): 37,
-            (39, G["atom"]): 43,
-            (39, G["term"]): 40,
-            (39, G["function-call"]): 35,
-            (39, G["factor"]): 56,
-            (41, G["atom"]): 43,
-            (41, G["factor"]): 42,
-            (41, G["function-call"]): 35,
-            (46, G["arith"]): 38,
-            (46, G["expr"]): 50,
-            (46, G["comp"]): 37,
-            (46, G["not-empty-expr-list"]): 49,
-            (46, G["atom"]): 43,
-            (46, G["factor"]): 56,
-            (46, G["term"]): 53,
-            (46, G["function-call"]): 35,
-            (46, G["expr-list"]): 47,
-            (51, G["arith"]): 38,
-            (51, G["not-empty-expr-list"]): 52,
-            (51, G["expr"]): 50,
-            (51, G["comp"]): 37,
-            (51, G["atom"]): 43,
-            (51, G["factor"]): 56,
-            (51, G["term"]): 53,
-            (51, G["function-call"]): 35,
-            (54, G["atom"]): 43,
-            (54, G["factor"]): 55,
-            (54, G["function-call"]): 35,
-            (61, G["arith"]): 38,
-            (61, G["expr"]): 50,
-            (61, G["comp"]): 37,
-            (61, G["not-empty-expr-list"]): 49,
-            (61, G["atom"]): 43,
-            (61, G["factor"]): 56,
-            (61, G["term"]): 53,
-            (61, G["function-call"]): 35,
-            (61, G["expr-list"]): 62,
-            (64, G["atom"]): 43,
-            (64, G["term"]): 65,
-            (64, G["function-call"]): 35,
-            (64, G["factor"]): 56,
-            (66, G["term"]): 53,
+            (0, G["class-def"]): 163,
+            (0, G["program"]): 160,
+            (0, G["class-list"]): 161,
+            (3, G["attribute"]): 145,
+            (3, G["method"]): 148,
+            (3, G["feature-list"]): 143,
+            (5, G["param-list"]): 128,
+            (9, G["term"]): 50,
+            (9, G["function-call"]): 33,
+            (9, G["arith"]): 36,
+            (9, G["atom"]): 41,
+            (9, G["expr"]): 123,
+            (9, G["factor"]): 53,
+            (9, G["comp"]): 35,
+            (10, G["expr"]): 120,
+            (10, G["arith"]): 36,
+            (10, G["comp"]): 35,
+            (10, G["term"]): 50,
+            (10, G["block"]): 115,
+            (10, G["atom"]): 41,
+            (10, G["function-call"]): 33,
+            (10, G["factor"]): 53,
+            (11, G["comp"]): 35,
+            (11, G["arith"]): 36,
+            (11, G["factor"]): 53,
+            (11, G["function-call"]): 33,
+            (11, G["atom"]): 41,
+            (11, G["term"]): 50,
+            (11, G["expr"]): 113,
+            (12, G["atom"]): 41,
+            (12, G["arith"]): 36,
+            (12, G["term"]): 50,
+            (12, G["factor"]): 53,
+            (12, G["function-call"]): 33,
+            (12, G["comp"]): 35,
+            (12, G["expr"]): 107,
+            (13, G["atom"]): 41,
+            (13, G["term"]): 50,
+            (13, G["factor"]): 53,
+            (13, G["arith"]): 36,
+            (13, G["comp"]): 35,
+            (13, G["expr"]): 103,
+            (13, G["function-call"]): 33,
+            (14, G["declaration-list"]): 94,
+            (18, G["function-call"]): 33,
+            (18, G["expr"]): 93,
+            (18, G["atom"]): 41,
+            (18, G["arith"]): 36,
+            (18, G["term"]): 50,
+            (18, G["factor"]): 53,
+            (18, G["comp"]): 35,
+            (19, G["term"]): 50,
+            (19, G["factor"]): 53,
+            (19, G["arith"]): 36,
+            (19, G["comp"]): 35,
+            (19, G["function-call"]): 33,
+            (19, G["atom"]): 41,
+            (19, G["expr"]): 75,
+            (22, G["atom"]): 41,
+            (22, G["function-call"]): 33,
+            (22, G["factor"]): 74,
+            (25, G["atom"]): 41,
+            (25, G["function-call"]): 33,
+            (25, G["factor"]): 73,
+            (27, G["arith"]): 36,
+            (27, G["expr-list"]): 71,
+            (27, G["function-call"]): 33,
+            (27, G["atom"]): 41,
+            (27, G["term"]): 50,
+            (27, G["comp"]): 35,
+            (27, G["not-empty-expr-list"]): 47,
+            (27, G["expr"]): 54,
+            (27, G["factor"]): 53,
+            (28, G["arith"]): 36,
+            (28, G["atom"]): 41,
+            (28, G["comp"]): 35,
+            (28, G["term"]): 50,
+            (28, G["factor"]): 53,
+            (28, G["function-call"]): 33,
+            (28, G["expr"]): 70,
+            (30, G["arith"]): 36,
+            (30, G["atom"]): 41,
+            (30, G["comp"]): 35,
+            (30, G["term"]): 50,
+            (30, G["factor"]): 53,
+            (30, G["function-call"]): 33,
+            (30, G["expr"]): 34,
+            (37, G["term"]): 38,
+            (37, G["function-call"]): 33,
+            (37, G["atom"]): 41,
+            (37, G["factor"]): 53,
+            (39, G["atom"]): 41,
+            (39, G["function-call"]): 33,
+            (39, G["factor"]): 40,
+            (44, G["arith"]): 36,
+            (44, G["function-call"]): 33,
+            (44, G["atom"]): 41,
+            (44, G["term"]): 50,
+            (44, G["comp"]): 35,
+            (44, G["not-empty-expr-list"]): 47,
+            (44, G["expr"]): 54,
+            (44, G["factor"]): 53,
+            (44, G["expr-list"]): 45,
+            (48, G["expr"]): 49,
+            (48, G["arith"]): 36,
+            (48, G["function-call"]): 33,
+            (48, G["atom"]): 41,
+            (48, G["term"]): 50,
+            (48, G["comp"]): 35,
+            (48, G["factor"]): 53,
+            (51, G["atom"]): 41,
+            (51, G["factor"]): 52,
+            (51, G["function-call"]): 33,
+            (59, G["arith"]): 36,
+            (59, G["function-call"]): 33,
+            (59, G["atom"]): 41,
+            (59, G["term"]): 50,
+            (59, G["comp"]): 35,
+            (59, G["not-empty-expr-list"]): 47,
+            (59, G["expr"]): 54,
+            (59, G["factor"]): 53,
+            (59, G["expr-list"]): 60,
+            (62, G["function-call"]): 33,
+            (62, G["term"]): 63,
+            (62, G["atom"]): 41,
+            (62, G["factor"]): 53,
+            (64, G["atom"]): 41,
+            (64, G["term"]): 50,
+            (64, G["factor"]): 53,
+            (64, G["arith"]): 65,
+            (64, G["function-call"]): 33,
+            (66, G["atom"]): 41,
+            (66, G["term"]): 50,
+            (66, G["factor"]): 53,
             (66, G["arith"]): 67,
-            (66, G["atom"]): 43,
-            (66, G["factor"]): 56,
-            (66, G["function-call"]): 35,
-            (68, G["term"]): 53,
+            (66, G["function-call"]): 33,
+            (68, G["atom"]): 41,
+            (68, G["term"]): 50,
+            (68, G["factor"]): 53,
             (68, G["arith"]): 69,
-            (68, G["atom"]): 43,
-            (68, G["factor"]): 56,
-            (68, G["function-call"]): 35,
-            (70, G["term"]): 53,
-            (70, G["arith"]): 71,
-            (70, G["atom"]): 43,
-            (70, G["factor"]): 56,
-            (70, G["function-call"]): 35,
-            (78, G["case-list"]): 88,
-            (82, G["arith"]): 38,
-            (82, G["factor"]): 56,
-            (82, G["term"]): 53,
-            (82, G["atom"]): 43,
-            (82, G["comp"]): 37,
-            (82, G["expr"]): 83,
-            (82, G["function-call"]): 35,
-            (84, G["case-list"]): 85,
-            (86, G["case-list"]): 87,
-            (91, G["declaration-list"]): 92,
-            (94, G["arith"]): 38,
-            (94, G["expr"]): 95,
-            (94, G["factor"]): 56,
-            (94, G["atom"]): 43,
-            (94, G["term"]): 53,
-            (94, G["function-call"]): 35,
-            (94, G["comp"]): 37,
-            (97, G["term"]): 53,
-            (97, G["atom"]): 43,
-            (97, G["comp"]): 37,
-            (97, G["arith"]): 38,
-            (97, G["function-call"]): 35,
-            (97, G["expr"]): 98,
-            (97, G["factor"]): 56,
-            (101, G["arith"]): 38,
-            (101, G["atom"]): 43,
-            (101, G["factor"]): 56,
-            (101, G["function-call"]): 35,
-            (101, G["term"]): 53,
-            (101, G["comp"]): 37,
+            (68, G["function-call"]): 33,
+            (76, G["case-list"]): 84,
+            (80, G["arith"]): 36,
+            (80, G["expr"]): 81,
+            (80, G["comp"]): 35,
+            (80, G["term"]): 50,
+            (80, G["atom"]): 41,
+            (80, G["function-call"]): 33,
+            (80, G["factor"]): 53,
+            (89, G["arith"]): 36,
+            (89, G["comp"]): 35,
+            (89, G["term"]): 50,
+            (89, G["expr"]): 90,
+            (89, G["atom"]): 41,
+            (89, G["function-call"]): 33,
+            (89, G["factor"]): 53,
+            (99, G["function-call"]): 33,
+            (99, G["atom"]): 41,
+            (99, G["expr"]): 100,
+            (99, G["arith"]): 36,
+            (99, G["term"]): 50,
+            (99, G["factor"]): 53,
+            (99, G["comp"]): 35,
+            (101, G["arith"]): 36,
+            (101, G["atom"]): 41,
+            (101, G["comp"]): 35,
+            (101, G["term"]): 50,
+            (101, G["factor"]): 53,
+            (101, G["function-call"]): 33,
             (101, G["expr"]): 102,
-            (103, G["term"]): 53,
-            (103, G["arith"]): 38,
-            (103, G["expr"]): 104,
-            (103, G["atom"]): 43,
-            (103, G["function-call"]): 35,
-            (103, G["comp"]): 37,
-            (103, G["factor"]): 56,
-            (111, G["expr"]): 110,
-            (111, G["arith"]): 38,
-            (111, G["factor"]): 56,
-            (111, G["block"]): 112,
-            (111, G["term"]): 53,
-            (111, G["atom"]): 43,
-            (111, G["comp"]): 37,
-            (111, G["function-call"]): 35,
-            (113, G["expr"]): 110,
-            (113, G["arith"]): 38,
-            (113, G["factor"]): 56,
-            (113, G["term"]): 53,
-            (113, G["block"]): 114,
-            (113, G["atom"]): 43,
-            (113, G["comp"]): 37,
-            (113, G["function-call"]): 35,
-            (120, G["param-list"]): 121,
-            (126, G["atom"]): 43,
-            (126, G["term"]): 53,
-            (126, G["function-call"]): 35,
-            (126, G["arith"]): 38,
-            (126, G["expr"]): 127,
-            (126, G["factor"]): 56,
-            (126, G["comp"]): 37,
-            (131, G["arith"]): 38,
-            (131, G["factor"]): 56,
-            (131, G["term"]): 53,
-            (131, G["atom"]): 43,
-            (131, G["comp"]): 37,
-            (131, G["expr"]): 132,
-            (131, G["function-call"]): 35,
-            (136, G["method"]): 138,
-            (136, G["attribute"]): 135,
-            (136, G["feature-list"]): 137,
-            (139, G["method"]): 138,
-            (139, G["attribute"]): 135,
-            (139, G["feature-list"]): 140,
-            (141, G["method"]): 138,
-            (141, G["attribute"]): 135,
-            (141, G["feature-list"]): 142,
-            (143, G["method"]): 138,
-            (143, G["attribute"]): 135,
-            (143, G["feature-list"]): 144,
-            (147, G["feature-list"]): 148,
-            (147, G["method"]): 138,
-            (147, G["attribute"]): 135,
-            (152, G["class-list"]): 153,
-            (152, G["class-def"]): 152,
+            (104, G["function-call"]): 33,
+            (104, G["term"]): 50,
+            (104, G["arith"]): 36,
+            (104, G["atom"]): 41,
+            (104, G["expr"]): 105,
+            (104, G["factor"]): 53,
+            (104, G["comp"]): 35,
+            (108, G["arith"]): 36,
+            (108, G["function-call"]): 33,
+            (108, G["atom"]): 41,
+            (108, G["term"]): 50,
+            (108, G["comp"]): 35,
+            (108, G["expr"]): 109,
+            (108, G["factor"]): 53,
+            (110, G["function-call"]): 33,
+            (110, G["arith"]): 36,
+            (110, G["atom"]): 41,
+            (110, G["expr"]): 111,
+            (110, G["term"]): 50,
+            (110, G["comp"]): 35,
+            (110, G["factor"]): 53,
+            (115, G["arith"]): 36,
+            (115, G["comp"]): 35,
+            (115, G["term"]): 50,
+            (115, G["atom"]): 41,
+            (115, G["function-call"]): 33,
+            (115, G["expr"]): 117,
+            (115, G["factor"]): 53,
+            (132, G["term"]): 50,
+            (132, G["expr"]): 133,
+            (132, G["function-call"]): 33,
+            (132, G["arith"]): 36,
+            (132, G["atom"]): 41,
+            (132, G["factor"]): 53,
+            (132, G["comp"]): 35,
+            (141, G["arith"]): 36,
+            (141, G["comp"]): 35,
+            (141, G["term"]): 50,
+            (141, G["atom"]): 41,
+            (141, G["function-call"]): 33,
+            (141, G["factor"]): 53,
+            (141, G["expr"]): 142,
+            (146, G["feature-list"]): 147,
+            (146, G["attribute"]): 145,
+            (146, G["method"]): 148,
+            (149, G["feature-list"]): 150,
+            (149, G["attribute"]): 145,
+            (149, G["method"]): 148,
+            (151, G["feature-list"]): 152,
+            (151, G["attribute"]): 145,
+            (151, G["method"]): 148,
+            (153, G["feature-list"]): 154,
+            (153, G["attribute"]): 145,
+            (153, G["method"]): 148,
+            (157, G["attribute"]): 145,
+            (157, G["method"]): 148,
+            (157, G["feature-list"]): 158,
+            (161, G["class-def"]): 162,
         }
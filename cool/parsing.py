@@ -0,0 +1,547 @@
+"""Parsing helpers built on top of the serialized `CoolLexer` and `CoolParser`.
+
+`OffsetLexer` is a `CoolLexer` whose tokens also carry the `start` and `end` offsets of their lexeme in the source
+text, and `PositionParser` is a `CoolParser` that uses those offsets to record the source span of every node built by
+the grammar actions in a `PositionTable`. With the offsets the `IncrementalParser` can split a program into its
+classes and features and, after an edit of the text, relex and reparse only the feature (or the class) that contains
+the edited region, reusing the rest of the previous AST.
+
+`parse_parallel` splits a program at its top level `class` keywords and lexes and parses groups of classes in a
+process pool, stitching the declarations back into a single `ProgramNode`.
+
+Recording the positions makes the lexer and the parser slower, so the commands only use `OffsetLexer` and
+`PositionParser` when some option reads the positions, otherwise they use the plain `CoolLexer` and `CoolParser`.
+"""
+import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from pyjapt import Token
+from pyjapt.parsing import RuleList, Symbol
+
+import cool.semantics.utils.astnodes as ast
+from cool.grammar import G
+from cool.lexertab import CoolLexer
+from cool.parsertab import CoolParser
+from cool.semantics.utils.positions import ROOT, PositionTable, location
+
+OPENING_TOKENS = ('{', '(', 'case')
+CLOSING_TOKENS = ('}', ')', 'esac')
+
+# Patterns of the pre-scan that looks for the `class` keywords out of strings and comments
+CLASS_SCAN = re.compile(r'"|\(\*|--|\bclass\b')
+NESTED_COMMENT_SCAN = re.compile(r'\(\*|\*\)')
+STRING_SCAN = re.compile(r'\\.|"|\n', re.DOTALL)
+
+# Number of chunks given to each worker of `parse_parallel`, more chunks balance better the load of the workers
+CHUNKS_PER_JOB = 4
+
+
+class OffsetLexer(CoolLexer):
+    def tokenize(self, text: str, stop: Optional[int] = None):
+        stop = len(text) if stop is None else stop
+        self.text = text
+
+        while self.position < stop:
+            match = self.pattern.match(text, pos=self.position)
+
+            if match is None:
+                self.contain_errors = True
+                self.token = Token(text[self.position], None, self.lineno, self.column)
+                self.error_handler(self)
+                continue
+
+            start = self.position
+            lexeme = match.group()
+            token_type = match.lastgroup if match.lastgroup is not None else lexeme
+            self.token = Token(lexeme, token_type, self.lineno, self.column)
+
+            if token_type in self.token_rules:
+                # Rules like strings or comments move the position by them self
+                token = self.token_rules[token_type](self)
+                if token is not None and isinstance(token, Token):
+                    token.start, token.end = start, self.position
+                    yield token
+                continue
+
+            self.position = match.end()
+            self.column += len(lexeme)
+            self.token.start, self.token.end = start, self.position
+            yield self.token
+
+        eof = Token('$', self.eof, self.lineno, self.column)
+        eof.start = eof.end = self.position
+        yield eof
+
+    def __call__(self, text: str, start: int = 0, stop: Optional[int] = None, line: int = 1, column: int = 1):
+        """
+        Tokenize the region [start, stop) of the text, the first token of the region is assumed to be in the given
+        line and column, so the positions of the errors and tokens are the same as if the whole text were tokenized.
+        """
+        self.position, self.lineno, self.column = start, line, column
+        tokens = list(self.tokenize(text, stop))
+        for token in tokens:
+            token.token_type = G[token.token_type]
+        return tokens
+
+
+class PositionParser(CoolParser):
+    """A `CoolParser` that registers every AST node returned by a grammar action in a `PositionTable`, the span of the
+    node goes from the start of the first token to the end of the last token of the reduced production. The tokens
+    must come from an `OffsetLexer`."""
+
+    def __call__(self, tokens: List[Token], positions: Optional[PositionTable] = None):
+        positions = PositionTable() if positions is None else positions
+        inserted_error = False
+        stack: list = [0]  # The order in stack is [init state] + [symbol, rule, state, ...]
+        spans: List[Tuple[int, int]] = []  # The (start, end) offsets of each symbol in the stack
+        cursor = 0
+
+        while True:
+            if cursor >= len(tokens):
+                return
+
+            state = stack[-1]
+            lookahead = tokens[cursor]
+
+            if self.verbose:
+                prev = ' '.join([s.name for s in stack if isinstance(s, Symbol)])
+                post = ' '.join([tokens[i].lex for i in range(cursor, len(tokens))])
+                print(f'{prev} <-> {post}')
+                print()
+
+            if (state, lookahead.token_type) not in self.action:
+                self.contains_errors = True
+
+                if (state, self.grammar.ERROR) in self.action:
+                    if self.verbose:
+                        print(f'Inserted error token {lookahead,}')
+
+                    inserted_error = True
+                    error = Token(lookahead.lex, self.grammar.ERROR, lookahead.line, lookahead.column)
+                    error.start, error.end = lookahead.start, lookahead.end
+                    lookahead = error
+                else:
+                    # If an error insertion fails then the parsing process enter into a panic mode recovery
+                    self.add_error(
+                        lookahead.line,
+                        lookahead.column,
+                        f'{lookahead.line, lookahead.column} - SyntacticError: ERROR at or near "{lookahead.lex}"')
+
+                    while (state, lookahead.token_type) not in self.action:
+                        cursor += 1
+                        if cursor >= len(tokens):
+                            return
+                        lookahead = tokens[cursor]
+
+                    continue
+
+            action, tag = self.action[state, lookahead.token_type]
+
+            if action == self.SHIFT:
+                if self.verbose:
+                    print(f'Shift: {lookahead.lex, tag}')
+
+                if not inserted_error:
+                    stack += [lookahead.token_type, lookahead.lex, tag]
+                    cursor += 1
+                else:
+                    # the rule of an error token is the self token
+                    stack += [lookahead.token_type, lookahead, tag]
+                spans.append((lookahead.start, lookahead.end))
+            elif action == self.REDUCE:
+                if self.verbose:
+                    print(f'Reduce: {repr(tag)}')
+
+                head, body = tag
+
+                rules = RuleList(self, [None] * (len(body) + 1))
+                for i in range(1, len(body) + 1):
+                    state, rules[-i], _ = stack.pop(), stack.pop(), stack.pop()
+
+                if len(body):
+                    start, end = spans[-len(body)][0], spans[-1][1]
+                    del spans[-len(body):]
+                else:
+                    start = end = lookahead.start
+
+                if tag.rule is not None:
+                    rules[0] = tag.rule(rules)
+
+                # Productions like `expr -> comp` return a node that is already registered
+                if isinstance(rules[0], ast.Node) and rules[0] not in positions:
+                    positions.add(rules[0], start, end)
+
+                state = stack[-1]
+                goto = self.goto[state, head]
+                stack += [head, rules[0], goto]
+                spans.append((start, end))
+            elif action == self.OK:
+                program = stack[2]
+                program.positions = positions
+                return program
+            else:
+                raise Exception(f'ParsingError: invalid action {action}')
+
+            inserted_error = False
+
+
+def split_features(tokens: List[Token]) -> Optional[List[Tuple[int, int]]]:
+    """
+    Given the tokens of a class declaration return the (start, end) offsets of each of its features, a feature ends
+    in the first ";" out of any "{}", "()" or "case esac" pair. If the tokens are not a well formed class None is
+    returned.
+    """
+    depth = 0
+    features = []
+    start = None
+    for token in tokens:
+        name = token.token_type.name
+        if name in OPENING_TOKENS:
+            depth += 1
+            if depth == 1:
+                continue
+        elif name in CLOSING_TOKENS:
+            depth -= 1
+            if depth == 0:
+                return features if start is None else None
+
+        if depth == 1:
+            if start is None:
+                start = token.start
+            if name == ';':
+                features.append((start, token.end))
+                start = None
+    return None
+
+
+class ClassSpan:
+    def __init__(self, start: int, end: int, features: Optional[List[Tuple[int, int]]], block: int):
+        self.start: int = start
+        self.end: int = end
+        # The offsets of the features are relative to the start of the class, so a class can be moved without
+        # touching its features
+        self.features: Optional[List[Tuple[int, int]]] = (
+            None if features is None else [(s - start, e - start) for s, e in features])
+        # The blocks of the positions of the class and of each feature, they move with the spans
+        self.block: int = block
+        self.blocks: Optional[List[int]] = None
+
+
+class IncrementalParser:
+    """Parser that keeps the text, the class and feature spans and the AST of the last parsed program, so an edit
+    of the text only relex and reparse the feature or class that contains it. When the edit cannot be handled
+    locally (it crosses a class boundary, it produces errors, etc.) the whole text is parsed again.
+
+    Note that the returned AST shares every unchanged node with the previous one, so the passes that rewrite the
+    AST in place (like the type inference) should not be run over it if the parser will be used again. The nodes of
+    the replaced features and classes are released from the `positions`, so they have no position after the edit."""
+
+    def __init__(self):
+        self.parser = PositionParser()
+        self.text: str = ''
+        self.positions: PositionTable = PositionTable()
+        self.ast: Optional[ast.ProgramNode] = None
+        self.errors: List[str] = []
+        self.spans: List[ClassSpan] = []
+        self.full_parses: int = 0
+
+    def parse(self, text: str) -> Optional[ast.ProgramNode]:
+        self.text = text
+        self.full_parses += 1
+        self.spans = []
+        self.positions = PositionTable(text)
+
+        lexer = OffsetLexer()
+        tokens = lexer(text)
+        if lexer.contain_errors:
+            self.ast, self.errors = None, lexer.errors
+            return None
+
+        program, errors = self._parse_tokens(tokens)
+        self.ast, self.errors = program, errors
+        if errors or program is None:
+            return program
+
+        starts = [i for i, t in enumerate(tokens) if t.token_type.name == 'class'] + [len(tokens) - 1]
+        for declaration, first, last in zip(program.declarations, starts, starts[1:]):
+            features = split_features(tokens[first:last])
+            block = self.positions.new_block(ROOT, tokens[first].start)
+            self.spans.append(self._class_span(declaration, tokens[first].start, tokens[last - 1].end, features, block))
+
+        if len(self.spans) != len(program.declarations):
+            self.spans = []
+        return program
+
+    def edit(self, start: int, end: int, text: str) -> Optional[ast.ProgramNode]:
+        """Replace the region [start, end) of the current text with the given text and return the new AST"""
+        new_text = self.text[:start] + text + self.text[end:]
+        delta = len(text) - (end - start)
+
+        if self.ast is None or self.errors or not self.spans:
+            return self.parse(new_text)
+
+        index = bisect_right([span.start for span in self.spans], start) - 1
+        if index < 0 or end > self.spans[index].end:
+            return self.parse(new_text)
+
+        self.positions.text = new_text
+
+        span = self.spans[index]
+        if not self._reparse_feature(new_text, index, start - span.start, end - span.start, delta):
+            if not self._reparse_class(new_text, index, delta):
+                return self.parse(new_text)
+
+        self.positions.resize(self.ast, delta)
+        for other in self.spans[index + 1:]:
+            other.start += delta
+            other.end += delta
+            self.positions.move_block(other.block, delta)
+        self.text = new_text
+        return self.ast
+
+    def _reparse_feature(self, text: str, index: int, start: int, end: int, delta: int) -> bool:
+        span = self.spans[index]
+        if span.features is None:
+            return False
+
+        position = bisect_right([s for s, _ in span.features], start) - 1
+        if position < 0 or end > span.features[position][1]:
+            return False
+
+        feature_start, feature_end = span.features[position]
+        region = (span.start + feature_start, span.start + feature_end + delta)
+        tokens = self._tokenize(text, *region)
+        if tokens is None:
+            return False
+
+        # The feature is parsed inside a fake class so the parser of the whole program can be used
+        prefix = [Token('class', G['class']), Token('Feature', G['type']), Token('{', G['{'])]
+        suffix = [Token('}', G['}'])]
+        for token in prefix + suffix:
+            token.line, token.column = tokens[0].line, tokens[0].column
+            token.start = token.end = tokens[0].start
+        suffix.append(tokens.pop())
+        positions = self.positions
+        block = positions.new_block(span.block, feature_start)
+        program = self._parse_block(prefix + tokens + suffix, block)
+        if program is None or len(program.declarations[0].features) != 1:
+            if program is not None:
+                positions.release(ast.walk(program))
+            positions.release_block(block)
+            return False
+
+        # The fake class and program are not part of the AST
+        positions.release(program.declarations[0:1] + [program])
+        declaration = self.ast.declarations[index]
+        positions.release(ast.walk(declaration.features[position]))
+        positions.release_block(span.blocks[position])
+        declaration.features[position] = program.declarations[0].features[0]
+        positions.resize(declaration, delta)
+
+        span.end += delta
+        span.features[position] = (feature_start, feature_end + delta)
+        span.blocks[position] = block
+        for i in range(position + 1, len(span.features)):
+            s, e = span.features[i]
+            span.features[i] = (s + delta, e + delta)
+            positions.move_block(span.blocks[i], delta)
+        return True
+
+    def _reparse_class(self, text: str, index: int, delta: int) -> bool:
+        span = self.spans[index]
+        region = (span.start, span.end + delta)
+        tokens = self._tokenize(text, *region)
+        if tokens is None:
+            return False
+
+        positions = self.positions
+        block = positions.new_block(ROOT, span.start)
+        program = self._parse_block(tokens, block)
+        if program is None:
+            positions.release_block(block)
+            return False
+
+        positions.release([program])
+        positions.release(ast.walk(self.ast.declarations[index]))
+        for old in [span.block] + (span.blocks or []):
+            positions.release_block(old)
+        declaration = self.ast.declarations[index] = program.declarations[0]
+        self.spans[index] = self._class_span(declaration, region[0], region[1], split_features(tokens), block)
+        return True
+
+    def _class_span(self, declaration: ast.ClassDeclarationNode, start: int, end: int,
+                    features: Optional[List[Tuple[int, int]]], block: int) -> ClassSpan:
+        """Return the span of a parsed class and move the positions of its nodes to the given block of the class and
+        to a new block for each feature"""
+        if features is not None and len(features) != len(declaration.features):
+            features = None
+        span = ClassSpan(start, end, features, block)
+        if span.features is None:
+            self.positions.rebase(ast.walk(declaration), block)
+            return span
+
+        self.positions.rebase([declaration], block)
+        span.blocks = []
+        for feature, (feature_start, _) in zip(declaration.features, span.features):
+            span.blocks.append(self.positions.new_block(block, feature_start))
+            self.positions.rebase(ast.walk(feature), span.blocks[-1])
+        return span
+
+    def _tokenize(self, text: str, start: int, stop: int) -> Optional[List[Token]]:
+        """Tokenize the region of the text, if the region is not exactly covered by its tokens None is returned"""
+        lexer = OffsetLexer()
+        tokens = lexer(text, start, stop, *location(text, start))
+        if lexer.contain_errors or len(tokens) < 2 or tokens[0].start != start or tokens[-2].end != stop:
+            return None
+        return tokens
+
+    def _parse_block(self, tokens: List[Token], block: int) -> Optional[ast.ProgramNode]:
+        """Parse the tokens of a region adding the positions of their nodes to the block, return the program if it
+        has a single class and no errors, otherwise the added nodes are released and None is returned"""
+        positions = self.positions
+        positions.select_block(block)
+        positions.added = []
+        try:
+            program, errors = self._parse_tokens(tokens)
+        finally:
+            added, positions.added = positions.added, None
+            positions.select_block(ROOT)
+
+        if errors or program is None or len(program.declarations) != 1:
+            positions.release(added)
+            return None
+        return program
+
+    def _parse_tokens(self, tokens: List[Token]) -> Tuple[Optional[ast.ProgramNode], List[str]]:
+        # The parsing tables are expensive to build, so the same parser is reused cleaning its errors on each call
+        self.parser._errors = []
+        self.parser.contains_errors = False
+        program = self.parser(tokens, self.positions)
+        return program, self.parser.errors
+
+
+def split_classes(text: str) -> List[int]:
+    """
+    Return the offsets of the `class` keywords of the text. Strings and (nested) comments are skipped the same way
+    the lexer does, so every offset is the start of a class declaration.
+    """
+    offsets = []
+    pos = 0
+    while True:
+        match = CLASS_SCAN.search(text, pos)
+        if match is None:
+            return offsets
+
+        lexeme, pos = match.group(), match.end()
+        if lexeme == 'class':
+            offsets.append(match.start())
+        elif lexeme == '--':
+            newline = text.find('\n', pos)
+            pos = len(text) if newline < 0 else newline
+        elif lexeme == '(*':
+            depth = 1
+            while depth:
+                match = NESTED_COMMENT_SCAN.search(text, pos)
+                if match is None:
+                    return offsets
+                depth += 1 if match.group() == '(*' else -1
+                pos = match.end()
+        else:
+            while True:
+                match = STRING_SCAN.search(text, pos)
+                if match is None:
+                    return offsets
+                pos = match.end()
+                if match.group() in ('"', '\n'):
+                    break
+
+
+_chunk_parsers: Dict[bool, CoolParser] = {}
+
+
+def parse_chunk(chunk: Tuple[str, int, int, bool]):
+    """
+    Lex and parse a group of classes given as (text, line, column, positions) in a worker process. Return the
+    `ProgramNode` of the group, its `PositionTable` (with offsets relative to the chunk, None if the positions are not
+    recorded), the lexer errors and the parser errors, the errors are (line, column, message) tuples.
+    """
+    text, line, column, record = chunk
+    if record not in _chunk_parsers:
+        _chunk_parsers[record] = PositionParser() if record else CoolParser()
+    parser = _chunk_parsers[record]
+    parser._errors = []
+    parser.contains_errors = False
+
+    lexer = OffsetLexer() if record else CoolLexer()
+    if record:
+        tokens = lexer(text, line=line, column=column)
+    else:
+        lexer.lineno, lexer.column = line, column
+        tokens = lexer(text)
+    if lexer.contain_errors:
+        return None, None, lexer._errors, []
+
+    positions = PositionTable(keep_nodes=True) if record else None
+    program = parser(tokens, positions) if record else parser(tokens)
+    return program, positions, [], parser._errors if parser.contains_errors or program is None else []
+
+
+def parse_parallel(text: str, jobs: int, positions: bool = True) -> Tuple[Optional[ast.ProgramNode], List[str]]:
+    """
+    Parse the program using `jobs` worker processes and return the AST and the errors, with `positions` the AST has
+    the positions of its nodes. If the text has lexical errors the AST is None, as the lexer errors of every chunk
+    are reported no matter the chunk they come from. When some chunk has syntactic errors the whole text is parsed
+    again in this process, the panic mode recovery of the parser may cross a class boundary, so only the sequential
+    parse reports the same errors.
+    """
+    offsets = split_classes(text)
+    if len(offsets) < 2 or jobs < 2:
+        return _parse_sequential(text, positions)
+
+    # Group consecutive classes into chunks of similar size, the first chunk also takes the text before the first
+    # class (usually comments)
+    size = len(text) / (jobs * CHUNKS_PER_JOB)
+    starts = [0]
+    for offset in offsets[1:]:
+        if offset - starts[-1] >= size:
+            starts.append(offset)
+    stops = starts[1:] + [len(text)]
+
+    chunks = [(text[start:stop], *location(text, start), positions) for start, stop in zip(starts, stops)]
+    with ProcessPoolExecutor(min(jobs, len(chunks))) as executor:
+        results = list(executor.map(parse_chunk, chunks))
+
+    lexer_errors = [error for _, _, errors, _ in results for error in errors]
+    if lexer_errors:
+        return None, [message for _, _, message in sorted(lexer_errors)]
+    if any(errors for _, _, _, errors in results):
+        return _parse_sequential(text, positions)
+
+    program = ast.ProgramNode([])
+    for chunk_program, _, _, _ in results:
+        program.declarations += chunk_program.declarations
+    if positions:
+        table = PositionTable(text)
+        for start, (_, chunk_positions, _, _) in zip(starts, results):
+            table.extend(chunk_positions, start)
+        first, last = program.declarations[0], program.declarations[-1]
+        table.add(program, table.span(first)[0], table.span(last)[1])
+        program.positions = table
+    return program, []
+
+
+def _parse_sequential(text: str, positions: bool = True) -> Tuple[Optional[ast.ProgramNode], List[str]]:
+    lexer = OffsetLexer() if positions else CoolLexer()
+    tokens = lexer(text)
+    if lexer.contain_errors:
+        return None, lexer.errors
+
+    if positions:
+        parser = PositionParser()
+        program = parser(tokens, PositionTable(text))
+    else:
+        parser = CoolParser()
+        program = parser(tokens)
+    return program, parser.errors
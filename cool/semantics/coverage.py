@@ -0,0 +1,78 @@
+"""Coverage of the execution of a Cool program.
+
+The `Executor` counts the evaluations of each node of the program in a list indexed by the id of the node in the
+`PositionTable` of the program. The counts of the expressions are mapped to the lines of the source where they start:
+the count of a line is the count of its most evaluated expression, so a line inside a loop shows the iterations of the
+loop and a line whose expressions never ran shows that it is dead code.
+"""
+from typing import Callable, Dict, List, Tuple
+
+import cool.semantics.utils.astnodes as ast
+
+
+class Coverage:
+    """
+    Params
+    ------
+    - program: ProgramNode the executed program, it must have the positions of its nodes (parsed by `PositionParser`
+      with the source text)
+    """
+
+    def __init__(self, program: ast.ProgramNode):
+        if program.positions is None:
+            raise ValueError('The coverage needs the positions of the nodes of the program')
+        self.program = program
+        self.positions = program.positions
+        self.counts: List[int] = [0] * len(self.positions)
+
+    def wrap(self, visit: Callable) -> Callable:
+        """Return a visit function that counts the visited node before calling `visit`"""
+        counts = self.counts
+
+        def counted(node, *args):
+            try:
+                counts[node.nid] += 1
+            except (AttributeError, IndexError):
+                # A node built by the executor, as the call to Main.main, has no position
+                pass
+            return visit(node, *args)
+
+        return counted
+
+    def expressions(self) -> List[Tuple[ast.ExprNode, int, int, int]]:
+        """Return the expressions of the program as (node, line, column, evaluations) sorted by their position"""
+        result = []
+        for node in ast.walk(self.program):
+            if isinstance(node, ast.ExprNode) and node in self.positions:
+                line, column = self.positions.location(node)
+                result.append((node, line, column, self.counts[node.nid]))
+        result.sort(key=lambda item: (item[1], item[2]))
+        return result
+
+    def lines(self) -> Dict[int, int]:
+        """Return the evaluations of each line of the source that starts an expression"""
+        lines: Dict[int, int] = {}
+        for _, line, _, count in self.expressions():
+            lines[line] = max(lines.get(line, 0), count)
+        return lines
+
+    def listing(self) -> str:
+        """
+        Return the source annotated with the evaluations of each line, `#####` marks the lines whose expressions
+        were never evaluated and `-` the lines without expressions
+        """
+        lines = self.lines()
+        result = []
+        for number, text in enumerate(self.positions.text.splitlines(), 1):
+            count = lines.get(number)
+            mark = '-' if count is None else str(count) if count else '#####'
+            result.append(f'{mark:>9}:{number:>5}:{text}')
+        return '\n'.join(result) + '\n'
+
+    def to_dict(self) -> dict:
+        """Return the evaluations of the lines and of the expressions in a form that can be saved as JSON"""
+        return {
+            'lines': {str(line): count for line, count in self.lines().items()},
+            'expressions': [{'kind': type(node).__name__, 'line': line, 'column': column, 'count': count}
+                            for node, line, column, count in self.expressions()],
+        }
@@ -1,63 +1,141 @@
-from typing import Any, Dict
+import mmap
+import re
+import sys
+import time
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 import cool.semantics.utils.astnodes as ast
 import cool.semantics.utils.errors as err
 import cool.semantics.visitor as visitor
+from cool.semantics.coverage import Coverage
+from cool.semantics.profiler import Profiler
 from cool.semantics.utils.scope import Context, Method, Scope, Type, SemanticError
 
 
+# The escapes that the lexer keeps in the lexeme of a string, the other escaped characters are already replaced
+ESCAPES = {'b': '\b', 't': '\t', 'n': '\n', 'f': '\f'}
+ESCAPE_REGEX = re.compile(r'\\([btnf])')
+
+
+def decode_string(lex: str) -> str:
+    """Return the value of the string literal with the given lexeme"""
+    return ESCAPE_REGEX.sub(lambda match: ESCAPES[match.group(1)], lex[1:-1])
+
+
 class ExecutionError(Exception):
     @property
     def text(self):
         return self.args[0]
 
 
-def abort(obj, context):
-    print('Aborting Program')
+class LimitError(ExecutionError):
+    """
+    Error raised when a program exceeds one of its `Limits`
+
+    Params
+    ------
+    - text: str the message of the error
+    - limit: str the name of the exceeded limit: steps, objects, heap, time or depth (the nested calls exceeded the
+      stack of the interpreter)
+    - stats: Dict[str, float] the resources used by the program until the error, as returned by `Executor.stats`
+    """
+
+    def __init__(self, text: str, limit: str, stats: Dict[str, float]):
+        super().__init__(text)
+        self.limit: str = limit
+        self.stats: Dict[str, float] = stats
+
+
+class Limits:
+    """
+    Limits of the resources of a program, None means no limit. Each method call and each iteration of a loop is a
+    step, counting them is cheaper than counting the evaluated nodes and any program that runs forever runs steps
+    forever.
+
+    Params
+    ------
+    - max_steps: int the steps that the program can run
+    - max_objects: int the objects that the program can create with `new` and `copy`
+    - max_heap: int the estimated bytes of the objects and the strings that the program can create. The executor does
+      not know when an object is not used anymore, so it counts the created bytes instead of the live ones
+    - timeout: float the seconds that the program can run
+    - check_interval: int the steps between two reads of the clock to check the timeout
+    """
+
+    def __init__(self, max_steps: Optional[int] = None, max_objects: Optional[int] = None,
+                 max_heap: Optional[int] = None, timeout: Optional[float] = None, check_interval: int = 1000):
+        self.max_steps: Optional[int] = max_steps
+        self.max_objects: Optional[int] = max_objects
+        self.max_heap: Optional[int] = max_heap
+        self.timeout: Optional[float] = timeout
+        self.check_interval: int = check_interval
+
+
+# Estimated bytes of an object and of each of its attributes, for the heap limit
+OBJECT_SIZE = 64
+ATTRIBUTE_SIZE = 16
+
+
+def abort(obj, executor):
+    executor.output.write('Aborting Program\n')
+    executor.output.flush()
     exit()
 
 
-def copy(obj, context):
+def copy(obj, executor):
     x_copy = Instance(obj.type, obj.value if obj.type.name in ('Int', 'String', 'Bool') else None)
     x_copy.attribute_values = obj.attribute_values
+    executor.allocate(OBJECT_SIZE + ATTRIBUTE_SIZE * len(obj.attribute_values)
+                      + (len(obj.value) if obj.type.name == 'String' else 0))
     return x_copy
 
 
-def type_name(obj, context):
-    return Instance(context.get_type('String'), obj.type.name)
+def type_name(obj, executor):
+    return Instance(executor.context.get_type('String'), obj.type.name)
 
 
-def out_string(obj, s, context):
-    print(s.value, end='')
+def out_string(obj, s, executor):
+    executor.output.write(str(s.value))
     return obj
 
 
-def out_int(obj, s, context):
-    print(s.value, end='')
+def out_int(obj, s, executor):
+    executor.output.write(str(s.value))
     return obj
 
 
-def in_string(obj, context):
-    return Instance(context.get_type('Int'), input())
+def in_string(obj, executor):
+    line = executor.input.readline()
+    if line is None:
+        return executor.empty_string
+    executor.allocate(OBJECT_SIZE + len(line), 0)
+    return Instance(executor.context.get_type('String'), line)
 
 
-def in_int(obj, context):
+def in_int(obj, executor):
+    line = executor.input.readline()
     try:
-        return Instance(context.get_type('Int'), int(input()))
-    except ValueError:
+        return executor.int_instance(int(line))
+    except (TypeError, ValueError):
         raise ExecutionError(err.INPUT_INT_ERROR)
 
 
-def length(obj, context):
-    return Instance(context.get_type('Int'), len(obj.value))
+def length(obj, executor):
+    return executor.int_instance(len(obj.value))
 
 
-def concat(obj, s, context):
-    return Instance(context.get_type('String'), obj.value + s.value)
+def concat(obj, s, executor):
+    # The rope shares the pieces of the receiver, so only the new ones are new bytes
+    executor.allocate(OBJECT_SIZE + len(s.value), 0)
+    return Instance(executor.context.get_type('String'), Rope.concat(obj.value, s.value))
 
 
-def substr(obj, i, l, context):
-    return Instance(context.get_type('String'), obj.value[i: i + l])
+def substr(obj, i, l, executor):
+    start, count = i.value, l.value
+    if start < 0 or count < 0 or start + count > len(obj.value):
+        raise ExecutionError(err.SUBSTR_OUT_OF_RANGE % (start, count, len(obj.value)))
+    executor.allocate(OBJECT_SIZE + count, 0)
+    return Instance(executor.context.get_type('String'), obj.value[start: start + count])
 
 
 defaults = {
@@ -74,6 +152,148 @@ defaults = {
 }
 
 
+class Output:
+    """Buffer of the text written by a program, the builtins of IO write to it instead of printing each value.
+
+    Params
+    ------
+    - sink: BinaryIO where the buffer is written, by default the standard output (an `io.BytesIO` keeps the output
+      in memory)
+    - buffer_size: int the buffer is written to the sink when it reaches this number of bytes, 0 writes every value
+    - line_buffered: bool if True the buffer is also written after each newline, by default only when the sink is
+      an interactive terminal
+
+    The buffer is also written before reading the input, on `abort` and at the end of the execution."""
+
+    def __init__(self, sink: Optional[BinaryIO] = None, buffer_size: int = 1 << 16, line_buffered: bool = None):
+        if sink is None:
+            # The text layer of the standard output may have pending text written before the execution
+            sys.stdout.flush()
+            sink = sys.stdout.buffer
+
+        self.sink: BinaryIO = sink
+        self.buffer: bytearray = bytearray()
+        self.buffer_size: int = buffer_size
+        self.line_buffered: bool = sink.isatty() if line_buffered is None else line_buffered
+
+    def write(self, text: str) -> None:
+        self.buffer += text.encode()
+        if len(self.buffer) >= self.buffer_size or (self.line_buffered and '\n' in text):
+            self.flush()
+
+    def flush(self) -> None:
+        if self.buffer:
+            self.sink.write(self.buffer)
+            self.buffer = bytearray()
+        self.sink.flush()
+
+
+class Input:
+    """Reader of the lines of the input of a program, the input is read in chunks of `chunk_size` bytes and split
+    in lines as the builtins of IO ask for them.
+
+    Params
+    ------
+    - source: BinaryIO the input, by default the standard input. Each read returns the bytes already available, so
+      an interactive input is not blocked until a whole chunk is written
+    - chunk_size: int maximum number of bytes of each read
+    - tied: Output flushed before each read of the source, so a prompt written before asking for the input is visible
+    - buffer: bytes or mmap the whole input, already in memory. If it is given there is no source to read
+    """
+
+    def __init__(self, source: Optional[BinaryIO] = None, chunk_size: int = 1 << 16, tied: Optional[Output] = None,
+                 buffer: Union[bytes, mmap.mmap, None] = None):
+        if buffer is None and source is None:
+            source = sys.stdin.buffer
+        self.source: Optional[BinaryIO] = source if buffer is None else None
+        self.chunk_size: int = chunk_size
+        self.tied: Optional[Output] = tied
+        self.buffer: Union[bytes, mmap.mmap] = buffer if buffer is not None else b''
+        self.position: int = 0
+
+    @classmethod
+    def from_file(cls, path) -> 'Input':
+        """Read the input from a file mapped in memory, without copying it to a buffer"""
+        with open(path, 'rb') as file:
+            # An empty file cannot be mapped
+            return cls(buffer=mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if file.seek(0, 2) else b'')
+
+    def readline(self) -> Optional[str]:
+        """Return the next line without its newline, or None at the end of the input"""
+        while True:
+            end = self.buffer.find(b'\n', self.position)
+            if end != -1:
+                line = self.buffer[self.position:end]
+                self.position = end + 1
+                return line.decode()
+
+            chunk = self._read()
+            if not chunk:
+                if self.position >= len(self.buffer):
+                    return None
+                line = self.buffer[self.position:]
+                self.position = len(self.buffer)
+                return line.decode()
+            self.buffer = self.buffer[self.position:] + chunk
+            self.position = 0
+
+    def _read(self) -> bytes:
+        if self.source is None:
+            return b''
+        if self.tied is not None:
+            self.tied.flush()
+        read = getattr(self.source, 'read1', self.source.read)
+        return read(self.chunk_size)
+
+
+class Rope:
+    """Value of a String built by concatenations, the pieces are only joined when the text is needed.
+
+    The ropes built by concatenating to the same rope share their list of pieces, each one uses the first `count`
+    pieces of the list. A concatenation to a rope that uses the whole list appends to it, so the usual loop
+    `s <- s.concat(x)` takes linear time, and one that does not (the list was already extended by another
+    concatenation) copies its pieces. The length is known without joining the pieces, the comparisons, the slices
+    and the conversion to `str` join them once per rope."""
+
+    __slots__ = ('pieces', 'count', 'length', 'text')
+
+    def __init__(self, pieces: List[str], count: int, length: int):
+        self.pieces: List[str] = pieces
+        self.count: int = count
+        self.length: int = length
+        self.text: Optional[str] = None
+
+    @staticmethod
+    def concat(left: Union[str, 'Rope'], right: Union[str, 'Rope']) -> 'Rope':
+        right_pieces = right.pieces[:right.count] if isinstance(right, Rope) else [right]
+
+        if isinstance(left, Rope):
+            pieces = left.pieces if left.count == len(left.pieces) else left.pieces[:left.count]
+        else:
+            pieces = [left]
+        pieces.extend(right_pieces)
+        return Rope(pieces, len(pieces), len(left) + len(right))
+
+    def __str__(self):
+        if self.text is None:
+            self.text = ''.join(self.pieces[:self.count])
+        return self.text
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, item):
+        return str(self)[item]
+
+    def __eq__(self, other):
+        if isinstance(other, (str, Rope)):
+            return self.length == len(other) and str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+
 class Instance:
     def __init__(self, typex: Type, value: Any = None):
         if value is None:
@@ -104,13 +324,92 @@ class VoidInstance(Instance):
         return isinstance(other, VoidInstance)
 
 
-class Executor:
-    def __init__(self, context: Context):
+# The only void value, so `=` (that compares the ids of the objects) is true between two void references
+VOID = VoidInstance()
+
+
+class Executor(visitor.Visitor):
+    def __init__(self, context: Context, output: Optional[Output] = None, input: Optional[Input] = None,
+                 small_ints: Tuple[int, int] = (-128, 1024), profiler: Optional[Profiler] = None,
+                 coverage: Optional[Coverage] = None, limits: Optional[Limits] = None):
         self.context: Context = context
+        self.profiler: Optional[Profiler] = profiler
+        self.coverage: Optional[Coverage] = coverage
+        if coverage is not None:
+            # The dispatcher of this instance is replaced by one that counts the nodes, so the executions without
+            # coverage do not pay for it
+            self.visit = coverage.wrap(self.visit)
+        self.output: Output = output if output is not None else Output()
+        self.input: Input = input if input is not None else Input()
+        if self.input.tied is None:
+            self.input.tied = self.output
         self.current_type: Type = None
         self.current_instance: Instance = None
         self.call_stack: list = []
 
+        # The active method calls, parallel to the call stack: the class that defines the method and the node of the
+        # call, whose position locates the call in the source. A `Sampler` reads it from its own thread
+        self.frames: List[Tuple[str, ast.MethodCallNode]] = []
+
+        # The instances of the literals indexed by their lexeme (the lexemes of the strings keep their quotes, so they
+        # never clash with the others), a literal is decoded once and all its evaluations share the instance. The
+        # values of Int, String and Bool are never modified, so sharing them is safe
+        self.constants: Dict[str, Instance] = {}
+
+        # The results of the operations and the default values reuse the instances of the booleans, of the empty
+        # string and of the integers in the range [small_ints[0], small_ints[1]), `=` compares the values of the
+        # instances of the basic types, so an instance can stand for any occurrence of its value
+        self.true: Instance = Instance(context.get_type('Bool'), True)
+        self.false: Instance = Instance(context.get_type('Bool'), False)
+        self.empty_string: Instance = Instance(context.get_type('String'), '')
+        self.small_ints_start: int = small_ints[0]
+        self.small_ints: List[Instance] = [Instance(context.get_type('Int'), i) for i in range(*small_ints)]
+
+        # The resources used by the program. The limits are checked when the steps reach `next_check`, so a step only
+        # pays an increment and a comparison
+        self.limits: Limits = limits if limits is not None else Limits()
+        self.steps: int = 0
+        self.objects: int = 0
+        self.heap: int = 0
+        self.start: float = time.perf_counter()
+        self.next_check: int = 0
+
+    def stats(self) -> Dict[str, float]:
+        return {'steps': self.steps, 'objects': self.objects, 'heap': self.heap,
+                'time': time.perf_counter() - self.start}
+
+    def check_limits(self) -> None:
+        """Raise a LimitError if the program exceeded its steps or its time and compute the step of the next check"""
+        limits = self.limits
+        if limits.max_steps is not None and self.steps > limits.max_steps:
+            raise LimitError(err.STEP_LIMIT % limits.max_steps, 'steps', self.stats())
+        if limits.timeout is not None and time.perf_counter() - self.start > limits.timeout:
+            raise LimitError(err.TIME_LIMIT % limits.timeout, 'time', self.stats())
+
+        next_check = self.steps + limits.check_interval if limits.timeout is not None else sys.maxsize
+        if limits.max_steps is not None:
+            next_check = min(next_check, limits.max_steps + 1)
+        self.next_check = next_check
+
+    def allocate(self, size: int, objects: int = 1) -> None:
+        """Count the objects and the bytes created by the program and raise a LimitError if they exceed the limits"""
+        self.objects += objects
+        self.heap += size
+        limits = self.limits
+        if limits.max_objects is not None and self.objects > limits.max_objects:
+            raise LimitError(err.OBJECT_LIMIT % limits.max_objects, 'objects', self.stats())
+        if limits.max_heap is not None and self.heap > limits.max_heap:
+            raise LimitError(err.HEAP_LIMIT % limits.max_heap, 'heap', self.stats())
+
+    def bool_instance(self, value: bool) -> Instance:
+        return self.true if value else self.false
+
+    def int_instance(self, value: int) -> Instance:
+        index = value - self.small_ints_start
+        if 0 <= index < len(self.small_ints):
+            return self.small_ints[index]
+        return Instance(self.context.get_type('Int'), value)
+
     @visitor.on('node')
     def visit(self, node, tabs):
         pass
@@ -131,7 +430,16 @@ class Executor:
             raise ExecutionError(err.MAIN_METHOD_NOT_FOUND)
 
         execution_node = ast.MethodCallNode('main', [], ast.InstantiateNode('Main'))
-        self.visit(execution_node, scope)
+        self.start = time.perf_counter()
+        self.check_limits()
+        try:
+            self.visit(execution_node, scope)
+        except RecursionError:
+            # A call of the program nests the visits of the executor, so a runaway recursion ends at the recursion
+            # limit of Python. The calls do not pop the stack when they fail, so it still has the reached depth
+            raise LimitError(err.DEPTH_LIMIT % len(self.call_stack), 'depth', self.stats())
+        finally:
+            self.output.flush()
 
     @visitor.when(ast.ClassDeclarationNode)
     def visit(self, node: ast.ClassDeclarationNode, scope: Scope):
@@ -156,13 +464,17 @@ class Executor:
 
     @visitor.when(ast.LetNode)
     def visit(self, node: ast.LetNode, scope: Scope):
-        default = {'String': '', 'Int': 0, 'Bool': False}
         for _id, _type, _expr in node.declarations:
-
-            instance = self.visit(_expr, scope.create_child()) if _expr is not None else VoidInstance()
-
-            if _expr is None and _type in default:
-                instance = Instance(self.context.get_type(_type), default[_type])
+            if _expr is not None:
+                instance = self.visit(_expr, scope.create_child())
+            elif _type == 'Int':
+                instance = self.int_instance(0)
+            elif _type == 'Bool':
+                instance = self.false
+            elif _type == 'String':
+                instance = self.empty_string
+            else:
+                instance = VOID
 
             scope.define_variable(_id, instance.type).instance = instance
 
@@ -198,8 +510,11 @@ class Executor:
     @visitor.when(ast.WhileNode)
     def visit(self, node: ast.WhileNode, scope: Scope):
         while self.visit(node.condition, scope).value:
+            self.steps += 1
+            if self.steps >= self.next_check:
+                self.check_limits()
             self.visit(node.body, scope.create_child())
-        return VoidInstance()
+        return VOID
 
     @visitor.when(ast.SwitchCaseNode)
     def visit(self, node: ast.SwitchCaseNode, scope: Scope):
@@ -231,42 +546,70 @@ class Executor:
         if isinstance(obj_instance, VoidInstance):
             raise ExecutionError(err.VOID_EXPRESSION)
 
-        if obj_instance.type.conforms_to(self.context.get_type('Object')) and ('Object', node.id) in defaults:
-            args = (obj_instance,) + tuple(self.visit(arg, scope) for arg in node.args) + (self.context,)
-            return defaults['Object', node.id](*args)
-
-        if obj_instance.type.conforms_to(self.context.get_type('IO')) and ('IO', node.id) in defaults:
-            args = (obj_instance,) + tuple(self.visit(arg, scope) for arg in node.args) + (self.context,)
-            return defaults['IO', node.id](*args)
-
-        if obj_instance.type.conforms_to(self.context.get_type('String')) and ('String', node.id) in defaults:
-            args = (obj_instance,) + tuple(self.visit(arg, scope) for arg in node.args) + (self.context,)
-            return defaults['String', node.id](*args)
+        for owner in ('Object', 'IO', 'String'):
+            if obj_instance.type.conforms_to(self.context.get_type(owner)) and (owner, node.id) in defaults:
+                args = (obj_instance,) + tuple(self.visit(arg, scope) for arg in node.args) + (self,)
+                self.frames.append((owner, node))
+                if self.profiler is None:
+                    output = defaults[owner, node.id](*args)
+                else:
+                    self.profiler.enter(f'{owner}.{node.id}')
+                    try:
+                        output = defaults[owner, node.id](*args)
+                    finally:
+                        self.profiler.exit()
+                self.frames.pop()
+                return output
+
+        self.steps += 1
+        if self.steps >= self.next_check:
+            self.check_limits()
 
         new_scope = Scope()
 
-        method = obj_instance.get_method(node.id)
+        method, owner = obj_instance.type.get_method(node.id, get_owner=True)
         new_scope.define_variable('self', obj_instance.type).instance = obj_instance
         for name, typex, arg in zip(method.param_names, method.param_types, node.args):
             new_scope.define_variable(name, typex).instance = self.visit(arg, scope)
 
         self.call_stack.append(self.current_instance)
         self.current_instance = obj_instance
-        output = self.visit(method.expr, new_scope)
+        self.frames.append((owner.name, node))
+        if self.profiler is None:
+            output = self.visit(method.expr, new_scope)
+        else:
+            self.profiler.enter(f'{owner.name}.{node.id}')
+            try:
+                output = self.visit(method.expr, new_scope)
+            finally:
+                self.profiler.exit()
+        self.frames.pop()
         self.current_instance = self.call_stack.pop()
         return output
 
     @visitor.when(ast.IntegerNode)
     def visit(self, node: ast.IntegerNode, scope: Scope):
-        return Instance(self.context.get_type('Int'), int(node.lex))
+        try:
+            return self.constants[node.lex]
+        except KeyError:
+            instance = self.constants[node.lex] = self.int_instance(int(node.lex))
+            return instance
 
     @visitor.when(ast.StringNode)
     def visit(self, node: ast.StringNode, scope: Scope):
-        return Instance(self.context.get_type('String'), str(node.lex[1:-1].replace('\\n', '\n')))
+        try:
+            return self.constants[node.lex]
+        except KeyError:
+            instance = self.constants[node.lex] = Instance(self.context.get_type('String'), decode_string(node.lex))
+            return instance
 
     @visitor.when(ast.BooleanNode)
     def visit(self, node: ast.BooleanNode, scope: Scope):
-        return Instance(self.context.get_type('Bool'), True if node.lex == 'true' else False)
+        try:
+            return self.constants[node.lex]
+        except KeyError:
+            instance = self.constants[node.lex] = self.bool_instance(node.lex == 'true')
+            return instance
 
     @visitor.when(ast.VariableNode)
     def visit(self, node: ast.VariableNode, scope: Scope):
@@ -287,11 +630,15 @@ class Executor:
             default = False
 
         instance = Instance(self.context.get_type(node.lex), default)
+        attributes = instance.type.all_attributes()
+        self.allocate(OBJECT_SIZE + ATTRIBUTE_SIZE * len(attributes))
+        if self.profiler is not None:
+            self.profiler.allocate(instance.type.name)
         self.call_stack.append(self.current_instance)
         self.current_instance = instance
         fake_scope = Scope()
-        for attr, _ in instance.type.all_attributes():
-            attr_instance = self.visit(attr.expr, fake_scope) if attr.expr is not None else VoidInstance()
+        for attr, _ in attributes:
+            attr_instance = self.visit(attr.expr, fake_scope) if attr.expr is not None else VOID
             fake_scope.define_variable(attr.name, attr.type).instance = attr_instance
             self.current_instance.set_attribute_instance(attr.name, attr_instance)
         self.current_instance = self.call_stack.pop()
@@ -300,52 +647,54 @@ class Executor:
     @visitor.when(ast.NegationNode)
     def visit(self, node: ast.NegationNode, scope: Scope):
         value = not self.visit(node.expr, scope).value
-        return Instance(self.context.get_type('Bool'), value)
+        return self.bool_instance(value)
 
     @visitor.when(ast.ComplementNode)
     def visit(self, node: ast.ComplementNode, scope: Scope):
         value = ~ self.visit(node.expr, scope).value
-        return Instance(self.context.get_type('Int'), value)
+        return self.int_instance(value)
 
     @visitor.when(ast.IsVoidNode)
     def visit(self, node: ast.IsVoidNode, scope: Scope):
         value = isinstance(self.visit(node.expr, scope), VoidInstance)
-        return Instance(self.context.get_type('Bool'), value)
+        return self.bool_instance(value)
 
     @visitor.when(ast.PlusNode)
     def visit(self, node: ast.PlusNode, scope: Scope):
         value = self.visit(node.left, scope).value + self.visit(node.right, scope).value
-        return Instance(self.context.get_type('Int'), value)
+        return self.int_instance(value)
 
     @visitor.when(ast.MinusNode)
     def visit(self, node: ast.MinusNode, scope: Scope):
         value = self.visit(node.left, scope).value - self.visit(node.right, scope).value
-        return Instance(self.context.get_type('Int'), value)
+        return self.int_instance(value)
 
     @visitor.when(ast.StarNode)
     def visit(self, node: ast.StarNode, scope: Scope):
         value = self.visit(node.left, scope).value * self.visit(node.right, scope).value
-        return Instance(self.context.get_type('Int'), value)
+        return self.int_instance(value)
 
     @visitor.when(ast.DivNode)
     def visit(self, node: ast.DivNode, scope: Scope):
         try:
-            value = self.visit(node.left, scope).value / self.visit(node.right, scope).value
-            return Instance(self.context.get_type('Int'), value)
+            left, right = self.visit(node.left, scope).value, self.visit(node.right, scope).value
+            # The division of integers truncates towards zero
+            quotient = abs(left) // abs(right)
+            return self.int_instance(quotient if (left < 0) == (right < 0) else -quotient)
         except ZeroDivisionError:
             raise ExecutionError(err.DIVIDE_BY_ZERO)
 
     @visitor.when(ast.LessEqualNode)
     def visit(self, node: ast.LessEqualNode, scope: Scope):
         value = self.visit(node.left, scope).value <= self.visit(node.right, scope).value
-        return Instance(self.context.get_type('Bool'), value)
+        return self.bool_instance(value)
 
     @visitor.when(ast.LessThanNode)
     def visit(self, node: ast.LessThanNode, scope: Scope):
         value = self.visit(node.left, scope).value < self.visit(node.right, scope).value
-        return Instance(self.context.get_type('Bool'), value)
+        return self.bool_instance(value)
 
     @visitor.when(ast.EqualNode)
     def visit(self, node: ast.EqualNode, scope: Scope):
         value = self.visit(node.left, scope).value == self.visit(node.right, scope).value
-        return Instance(self.context.get_type('Bool'), value)
+        return self.bool_instance(value)
@@ -2,7 +2,7 @@ import cool.semantics.utils.astnodes as ast
 import cool.semantics.visitor as visitor
 
 
-class CodeBuilder:
+class CodeBuilder(visitor.Visitor):
     @visitor.on('node')
     def visit(self, node, tabs):
         pass
@@ -100,7 +100,7 @@ class CodeBuilder:
         return '    ' * tabs + f'(new {node.lex})'
 
 
-class Formatter:
+class Formatter(visitor.Visitor):
     @visitor.on('node')
     def visit(self, node, tabs):
         pass
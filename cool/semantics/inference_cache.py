@@ -0,0 +1,162 @@
+"""Cache of the types inferred for the AUTO_TYPE declarations of a program, so inferring again a program where only a
+few methods changed only solves the part of the dependency graph that those methods can reach.
+
+The types can only flow between the features of a program (attributes and methods) through their names: a method
+receives arguments from the methods that call it, an attribute is assigned by the features that use its name, etc.
+So the features are grouped by the names of the user defined features that they declare or use, and the types of
+the AUTO_TYPE declarations of a group only depend on the features of the group and on the class hierarchy. Each
+feature is fingerprinted with its class, the parent of the class and its source text, a group is identified by the
+fingerprints of its features and of the hierarchy and, if a previous run stored the types of the same group, they
+replace the AUTO_TYPE declarations before the semantic analysis, so the inference can leave the group out of the
+dependency graph. The source text of the features is taken from the positions of the program, so it must be parsed
+by `PositionParser`.
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Set, Tuple, Union
+
+import cool.semantics.utils.astnodes as ast
+from cool.semantics.utils.positions import PositionTable
+
+# A declaration that may be AUTO_TYPE: an attribute (index 0), a parameter or the return type (index -1) of a method,
+# or a declaration of a let
+Slot = Tuple[ast.Node, int]
+
+
+def slot_type(slot: Slot) -> str:
+    node, index = slot
+    if isinstance(node, ast.AttrDeclarationNode):
+        return node.type
+    if isinstance(node, ast.MethodDeclarationNode):
+        return node.return_type if index < 0 else node.params[index][1]
+    return node.declarations[index][1]
+
+
+def set_slot_type(slot: Slot, type_name: str) -> None:
+    node, index = slot
+    if isinstance(node, ast.AttrDeclarationNode):
+        node.type = type_name
+    elif isinstance(node, ast.MethodDeclarationNode):
+        if index < 0:
+            node.return_type = type_name
+        else:
+            node.params[index] = (node.params[index][0], type_name)
+    else:
+        _id, _, _expr = node.declarations[index]
+        node.declarations[index] = (_id, type_name, _expr)
+
+
+class Feature:
+    """An attribute or a method of a class with its fingerprint, its AUTO_TYPE declarations and the names it uses"""
+
+    def __init__(self, klass: ast.ClassDeclarationNode, node: Union[ast.AttrDeclarationNode,
+                                                                    ast.MethodDeclarationNode],
+                 positions: PositionTable):
+        self.node = node
+        self.slots: List[Slot] = []
+        self.names: Set[str] = set()
+
+        if isinstance(node, ast.AttrDeclarationNode):
+            self.name = f'attribute {node.id}'
+            if node.type == 'AUTO_TYPE':
+                self.slots.append((node, 0))
+        else:
+            self.name = f'method {node.id}'
+            self.slots.extend((node, i) for i, (_, _type) in enumerate(node.params) if _type == 'AUTO_TYPE')
+            if node.return_type == 'AUTO_TYPE':
+                self.slots.append((node, -1))
+
+        for child in ast.walk(node):
+            if isinstance(child, ast.LetNode):
+                self.slots.extend((child, i) for i, (_, _type, _) in enumerate(child.declarations)
+                                  if _type == 'AUTO_TYPE')
+            elif isinstance(child, ast.MethodCallNode):
+                self.names.add(f'method {child.id}')
+            elif isinstance(child, ast.VariableNode):
+                self.names.add(f'attribute {child.lex}')
+            elif isinstance(child, ast.AssignNode):
+                self.names.add(f'attribute {child.id}')
+
+        start, end = positions.span(node)
+        source = positions.text[start:end]
+        self.fingerprint: str = hashlib.sha1(f'{klass.id} {klass.parent}\0{source}'.encode()).hexdigest()
+
+
+class InferenceCache:
+    """
+    Params
+    ------
+    - path: str the JSON file with the types of the previous runs, it is written by `store`
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        try:
+            self.entries: Dict[str, Dict[str, List[str]]] = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self.entries = {}
+
+        self.groups: Dict[str, List[Feature]] = {}
+
+        # The features of the groups whose types were found in the cache, the inference does not need to visit them
+        self.cached: Set[ast.Node] = set()
+        self.stats: Dict[str, int] = {}
+
+    def apply(self, program: ast.ProgramNode) -> None:
+        """
+        Group the features of the program and replace the AUTO_TYPE declarations of the groups found in the cache
+        with their types. It must be called before the semantic analysis of the program, that must have the positions
+        of its nodes
+        """
+        if program.positions is None:
+            raise ValueError('The inference cache needs the positions of the nodes of the program')
+
+        hierarchy = hashlib.sha1(' '.join(f'{klass.id}:{klass.parent}' for klass in program.declarations).encode())
+        features = [Feature(klass, feature, program.positions) for klass in program.declarations for feature in klass.features]
+        defined = {feature.name for feature in features}
+
+        parent: Dict[str, str] = {name: name for name in defined}
+
+        def find(name: str) -> str:
+            while parent[name] != name:
+                parent[name] = parent[parent[name]]
+                name = parent[name]
+            return name
+
+        for feature in features:
+            for name in feature.names & defined:
+                parent[find(name)] = find(feature.name)
+
+        groups: Dict[str, List[Feature]] = {}
+        for feature in features:
+            groups.setdefault(find(feature.name), []).append(feature)
+
+        self.groups = {}
+        self.cached = set()
+        cached = 0
+        for group in groups.values():
+            if not any(feature.slots for feature in group):
+                continue
+
+            digest = hierarchy.copy()
+            for fingerprint in sorted(feature.fingerprint for feature in group):
+                digest.update(fingerprint.encode())
+            key = digest.hexdigest()
+            self.groups[key] = group
+
+            entry = self.entries.get(key)
+            if entry is not None:
+                cached += 1
+                for feature in group:
+                    self.cached.add(feature.node)
+                    for slot, type_name in zip(feature.slots, entry[feature.fingerprint]):
+                        set_slot_type(slot, type_name)
+
+        self.stats = {'cached_groups': cached, 'inferred_groups': len(self.groups) - cached}
+
+    def store(self) -> None:
+        """Save the types of the groups of the last applied program, it must be called after a successful inference"""
+        self.entries = {key: {feature.fingerprint: [slot_type(slot) for slot in feature.slots] for feature in group}
+                        for key, group in self.groups.items()}
+        self.path.write_text(json.dumps(self.entries))
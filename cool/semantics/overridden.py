@@ -56,7 +56,7 @@ def topological_sorting(program_node: ast.ProgramNode,
     return program_node
 
 
-class OverriddenMethodChecker:
+class OverriddenMethodChecker(visitor.Visitor):
     """This visitor for validate the signature of the overridden methods
 
         Params
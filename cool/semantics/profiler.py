@@ -0,0 +1,146 @@
+"""Profiler of the execution of a Cool program.
+
+The `Executor` notifies the profiler when a method (of a class of the program or a builtin) starts and ends and
+when an object is instantiated. For each method the profiler counts the calls, the inclusive time (from the start to
+the end of the call, counted once for recursive calls), the exclusive time (the inclusive time minus the time of the
+methods called from it) and the objects instantiated in its body. The exclusive time is also accumulated by call
+stack, which gives the collapsed stacks that the flame graph tools take as input.
+
+Measuring every call perturbs the timing of short methods, so the `Sampler` offers a cheaper alternative: a thread
+that copies the stack of active calls of the `Executor` at a fixed interval and counts how many samples found each
+stack, without any work in the interpreter besides keeping that stack.
+"""
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import cool.semantics.utils.astnodes as ast
+from cool.semantics.utils.positions import PositionTable
+
+
+class MethodProfile:
+    __slots__ = ('calls', 'total', 'exclusive', 'allocations')
+
+    def __init__(self):
+        self.calls: int = 0
+        self.total: float = 0.0
+        self.exclusive: float = 0.0
+        self.allocations: int = 0
+
+
+class Profiler:
+    """
+    Params
+    ------
+    - clock: Callable[[], float] the clock used to measure the calls, in seconds
+    """
+
+    # The name of the frame of the code that runs out of any method (the creation of the instance of Main)
+    ROOT = '<program>'
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.methods: Dict[str, MethodProfile] = {}
+        self.classes: Dict[str, int] = {}
+        self.stacks: Dict[Tuple[str, ...], float] = {}
+
+        # The active calls: name, start time and time spent in the methods called from it
+        self.frames: List[List] = []
+        self.active: Dict[str, int] = {}
+
+    def enter(self, name: str) -> None:
+        self.frames.append([name, self.clock(), 0.0])
+        self.active[name] = self.active.get(name, 0) + 1
+
+    def exit(self) -> None:
+        name, start, children = self.frames.pop()
+        elapsed = self.clock() - start
+        self.active[name] -= 1
+
+        profile = self.methods.get(name)
+        if profile is None:
+            profile = self.methods[name] = MethodProfile()
+        profile.calls += 1
+        profile.exclusive += elapsed - children
+        if not self.active[name]:
+            # A recursive call is already in the time of the outermost call
+            profile.total += elapsed
+        if self.frames:
+            self.frames[-1][2] += elapsed
+
+        stack = tuple(frame[0] for frame in self.frames) + (name,)
+        self.stacks[stack] = self.stacks.get(stack, 0.0) + elapsed - children
+
+    def allocate(self, class_name: str) -> None:
+        self.classes[class_name] = self.classes.get(class_name, 0) + 1
+        name = self.frames[-1][0] if self.frames else self.ROOT
+        profile = self.methods.get(name)
+        if profile is None:
+            profile = self.methods[name] = MethodProfile()
+        profile.allocations += 1
+
+    def report(self) -> str:
+        """Return a table of the methods sorted by their exclusive time and a table of the instantiated classes"""
+        width = max([len('method')] + [len(name) for name in self.methods])
+        lines = [f'{"method":<{width}} {"calls":>10} {"total (s)":>12} {"self (s)":>12} {"allocations":>12}']
+        for name, profile in sorted(self.methods.items(), key=lambda item: -item[1].exclusive):
+            lines.append(f'{name:<{width}} {profile.calls:>10} {profile.total:>12.6f} {profile.exclusive:>12.6f} '
+                         f'{profile.allocations:>12}')
+
+        width = max([len('class')] + [len(name) for name in self.classes])
+        lines += ['', f'{"class":<{width}} {"allocations":>12}']
+        for name, count in sorted(self.classes.items(), key=lambda item: -item[1]):
+            lines.append(f'{name:<{width}} {count:>12}')
+        return '\n'.join(lines) + '\n'
+
+    def collapsed_stacks(self) -> str:
+        """Return the exclusive time of each call stack in microseconds, one `caller;...;callee time` per line"""
+        return ''.join(f'{";".join(stack)} {round(elapsed * 1e6)}\n' for stack, elapsed in self.stacks.items())
+
+
+class Sampler:
+    """
+    Params
+    ------
+    - interval: float the seconds between two samples
+    - positions: PositionTable the positions of the program, used to add to each frame the line of the call
+    """
+
+    def __init__(self, interval: float = 0.005, positions: Optional[PositionTable] = None):
+        self.interval = interval
+        self.positions = positions
+        self.samples: Dict[Tuple[Tuple[str, ast.MethodCallNode], ...], int] = {}
+
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, frames: List[Tuple[str, ast.MethodCallNode]]) -> None:
+        """Start sampling the given stack of calls, usually the `frames` of an `Executor`"""
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, args=(frames,), daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, frames: List[Tuple[str, ast.MethodCallNode]]) -> None:
+        samples = self.samples
+        while not self._stopped.wait(self.interval):
+            # Copying the list is atomic under the GIL, so the interpreter can keep pushing and popping frames
+            stack = tuple(frames)
+            samples[stack] = samples.get(stack, 0) + 1
+
+    def frame_name(self, owner: str, node: ast.MethodCallNode) -> str:
+        location = self.positions.location(node) if self.positions is not None else None
+        return f'{owner}.{node.id}' if location is None else f'{owner}.{node.id}:{location[0]}'
+
+    def collapsed_stacks(self) -> str:
+        """Return the samples of each call stack, one `caller;...;callee samples` per line"""
+        stacks: Dict[str, int] = {}
+        for stack, count in self.samples.items():
+            name = ';'.join([Profiler.ROOT] + [self.frame_name(owner, node) for owner, node in stack])
+            stacks[name] = stacks.get(name, 0) + count
+        return ''.join(f'{name} {count}\n' for name, count in stacks.items())
@@ -0,0 +1,69 @@
+"""Reachability of the features of a program from the call to `Main.main` that starts its execution.
+
+A call only knows the name of the method, so every method with that name is reachable from it (class hierarchy
+analysis over the names, without the types of the receivers), and an instantiation of a class makes reachable the
+initializers of its attributes and of the attributes of its ancestors. The classes with a reachable method keep all
+their attributes, since the method can use them. The rest of the features can never run, so `cool run` skips their
+type checking. They are still inferred: a call in a dead method constrains the AUTO_TYPE parameters of the method that
+it calls, so skipping it would change the types inferred for the reachable code and what the program does.
+"""
+from typing import Dict, List, Set, Tuple
+
+import cool.semantics.utils.astnodes as ast
+
+
+def reachable_features(program: ast.ProgramNode) -> Set[ast.DeclarationNode]:
+    """Return the attributes and methods of the program that may be evaluated by its execution"""
+    classes: Dict[str, ast.ClassDeclarationNode] = {klass.id: klass for klass in program.declarations}
+    children: Dict[str, List[str]] = {}
+    methods: Dict[str, List[ast.MethodDeclarationNode]] = {}
+    owners: Dict[ast.MethodDeclarationNode, str] = {}
+    for klass in program.declarations:
+        children.setdefault(klass.parent, []).append(klass.id)
+        for feature in klass.features:
+            if isinstance(feature, ast.MethodDeclarationNode):
+                methods.setdefault(feature.id, []).append(feature)
+                owners[feature] = klass.id
+
+    reachable: Set[ast.DeclarationNode] = set()
+    included: Set[str] = set()
+    called: Set[str] = set()
+    pending: List[Tuple[str, ast.Node]] = []  # expressions to scan and the class where they are
+
+    def include(name: str):
+        # The attributes of the class and of its ancestors are initialized with each instance
+        while name in classes and name not in included:
+            included.add(name)
+            for feature in classes[name].features:
+                if isinstance(feature, ast.AttrDeclarationNode):
+                    reachable.add(feature)
+                    if feature.expr is not None:
+                        pending.append((name, feature.expr))
+            name = classes[name].parent
+
+    def call(name: str):
+        if name not in called:
+            called.add(name)
+            for method in methods.get(name, []):
+                reachable.add(method)
+                include(owners[method])
+                pending.append((owners[method], method.body))
+
+    include('Main')
+    call('main')
+    while pending:
+        owner, expr = pending.pop()
+        for node in ast.walk(expr):
+            if isinstance(node, ast.MethodCallNode):
+                call(node.id)
+            elif isinstance(node, ast.InstantiateNode) and node.lex != 'SELF_TYPE':
+                include(node.lex)
+            elif isinstance(node, ast.InstantiateNode):
+                # The instance may be of the class of the expression or of any class that inherits from it
+                stack = [owner]
+                while stack:
+                    name = stack.pop()
+                    include(name)
+                    stack.extend(children.get(name, []))
+
+    return reachable
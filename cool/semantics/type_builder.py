@@ -6,7 +6,7 @@ import cool.semantics.visitor as visitor
 from cool.semantics.utils.scope import Context, SemanticError, Type, ErrorType
 
 
-class TypeBuilder:
+class TypeBuilder(visitor.Visitor):
     """This visitor collect all the attributes and methods in classes and set the parent to the current class
 
     Params
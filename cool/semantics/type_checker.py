@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Set
 
 import cool.semantics.utils.astnodes as ast
 import cool.semantics.utils.errors as err
@@ -7,10 +7,13 @@ from cool.semantics.utils.scope import (Context, ErrorType, Method, Scope,
                                         SemanticError, Type)
 
 
-class TypeChecker:
-    def __init__(self, context: Context, errors: List[str]):
+class TypeChecker(visitor.Visitor):
+    """Check the types of the program, if the set of `reachable` features is given the others are not checked"""
+
+    def __init__(self, context: Context, errors: List[str], reachable: Optional[Set[ast.DeclarationNode]] = None):
         self.context: Context = context
         self.errors: List[str] = errors
+        self.reachable: Optional[Set[ast.DeclarationNode]] = reachable
         self.current_type: Type = None
         self.current_method: Method = None
 
@@ -32,8 +35,9 @@ class TypeChecker:
     def visit(self, node: ast.ClassDeclarationNode, scope: Scope):
         self.current_type = self.context.get_type(node.id)
 
-        attrs = [feature for feature in node.features if isinstance(feature, ast.AttrDeclarationNode)]
-        methods = [feature for feature in node.features if isinstance(feature, ast.MethodDeclarationNode)]
+        features = [feature for feature in node.features if self.reachable is None or feature in self.reachable]
+        attrs = [feature for feature in features if isinstance(feature, ast.AttrDeclarationNode)]
+        methods = [feature for feature in features if isinstance(feature, ast.MethodDeclarationNode)]
 
         for attr, attr_owner in self.current_type.all_attributes():
             if attr_owner != self.current_type:
@@ -5,7 +5,7 @@ import cool.semantics.visitor as visitor
 from cool.semantics.utils.scope import Context, SemanticError
 
 
-class TypeCollector:
+class TypeCollector(visitor.Visitor):
     """Visitor to collect the class in the program, and the basic classes as Object, Int, String, IO and Bool
 
     Params
@@ -4,11 +4,14 @@ DependencyGraph where we can create nodes as an structure called DependencyNode
 <x,y> where x and y are dependency nodes means that the type of node y is inferred by the type of node x,
 so for solve the type of y we need first to infer the type of x. For this operation we need some basic nodes that
 only contains the type of the node called AtomNode and in the digraph formation an AtomNode is never inferred from
-another node. The DependencyGraph consist in a dictionary[node, adjacency list] this adjacency has a declaration
-order and this is fundamental for the inference solution algorithm. If we have a case {x : [y, z]} where x, y,
-z are nodes then the algorithm will determinate the type of y and all it dependencies before to start with z (a
-simple DFS). The order in the adjacency list is the same appearance order in the program. At the end of the algorithm
-all nodes that cannot solve it type will be tagged as `Object`.
+another node. The DependencyGraph consist in a dictionary[node, adjacency list] and the solution is the least
+fixpoint over the lattice of types ordered by conformance: the type of a node is the join of the types of the nodes
+that reach it, so a variable assigned an `Int` and a `String` is an `Object`. A call whose receiver is inferred cannot
+be connected with the parameters and the return type of the method until the type of the receiver is known, so it is
+deferred and the solver connects it when the receiver gets a type, and again each time that type grows. Some edges are
+only hints (the type of the other branch of a conditional, the declared type of a parameter that receives the node,
+etc.) and they are used only for the nodes that are not reached by any other edge. At the end of the algorithm all nodes
+that cannot solve it type will be tagged as `Object`.
 
 DependencyNode hierarchy
     AtomNode
@@ -31,11 +34,19 @@ DependencyNode hierarchy
         - type : Node type
         - method : Reference to the method of the class
 
+    CallNode
+        - type : Node type
+        - receiver : Node of the object whose method is called
+        - method_name : Name of the called method
+        - args : Nodes of the arguments of the call
+
 All nodes has an implementation of the method update that handle how to update the type by it's dependencies
 """
+import time
 from abc import ABC
-from collections import OrderedDict, deque
-from typing import Dict, List, Optional, Set, Tuple, Deque
+from collections import OrderedDict
+from heapq import heappop, heappush
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import cool.semantics.utils.astnodes as ast
 import cool.semantics.utils.errors as err
@@ -53,10 +64,6 @@ class DependencyNode:
     def __repr__(self):
         return str(self)
 
-    @property
-    def is_ready(self):
-        return True
-
 
 class AtomNode(DependencyNode):
     def __init__(self, atom_type: Type):
@@ -121,10 +128,6 @@ class ReturnTypeNode(DependencyNode):
 class BranchedNode(DependencyNode, ABC):
     branches: List[DependencyNode] = []
 
-    @property
-    def is_ready(self) -> bool:
-        return all(x.type.name != 'AUTO_TYPE' for x in self.branches)
-
 
 class ConditionalNode(BranchedNode):
     def __init__(self, conditional_type, then_branch, else_branch):
@@ -150,64 +153,454 @@ class CaseOfNode(BranchedNode):
         return f'CaseOfNode({self.type.name})'
 
 
+class CallNode(DependencyNode):
+    def __init__(self, call_type: Type, receiver: DependencyNode, method_name: str, args: List[DependencyNode]):
+        self.type: Type = call_type
+        self.receiver: DependencyNode = receiver
+        self.method_name: str = method_name
+        self.args: List[DependencyNode] = args
+        self.receiver_type: Optional[Type] = None
+
+    def update(self, _type: Type) -> None:
+        self.type = _type
+
+    def __str__(self):
+        return f'Call({self.method_name}, {self.type.name})'
+
+
 class DependencyGraph:
-    def __init__(self):
+    """
+    Params
+    ------
+    - resolve_call: Callable[[CallNode, Type], None] called with each deferred call once the type of its receiver is
+      known, it must add to the graph the edges between the call and the called method
+    """
+
+    def __init__(self, resolve_call: Optional[Callable[[CallNode, Type], None]] = None):
         self.dependencies: Dict[DependencyNode, List[DependencyNode]] = OrderedDict()
+        self.hints: Dict[DependencyNode, List[DependencyNode]] = OrderedDict()
+        self.calls: List[CallNode] = []
+        self.resolve_call = resolve_call
+        self.stats: Dict[str, int] = {}
+
+        # The edges added by the resolution of a call while the graph is solved, as (node, other, hint)
+        self._added: Optional[List[Tuple[DependencyNode, DependencyNode, bool]]] = None
 
     def add_node(self, node: DependencyNode):
         if node not in self.dependencies:
             self.dependencies[node] = []
 
-    def add_edge(self, node: DependencyNode, other: DependencyNode):
+    def add_edge(self, node: DependencyNode, other: DependencyNode, hint: bool = False):
+        """
+        Add the edge node -> other. A hint edge only gives its type to `other` if no other edge does, it is used for
+        the types that are expected by the context of an expression instead of produced by it (the type of the other
+        branch of a conditional, the declared type of a parameter, etc.)
+        """
+        edges = self.hints if hint else self.dependencies
         try:
-            self.dependencies[node].append(other)
+            edges[node].append(other)
         except KeyError:
-            self.dependencies[node] = [other]
+            edges[node] = [other]
+        self.add_node(node)
         self.add_node(other)
+        if self._added is not None:
+            self._added.append((node, other, hint))
 
-    def update_dependencies(self, default_type: Type = None):
-        queue: Deque[DependencyNode] = deque(node for node in self.dependencies if isinstance(node, AtomNode))
-        visited: Set[DependencyNode] = set(queue)
+    def add_call(self, call: CallNode):
+        """Defer the call until the type of its receiver is known"""
+        self.calls.append(call)
+        self.add_node(call.receiver)
+        self.add_node(call)
 
-        while queue:
-            node = queue.popleft()
+    def update_dependencies(self, default_type: Type = None):
+        """
+        Solve the graph over the lattice of types ordered by conformance. The type of a node is the join of the types
+        of its solved predecessors (and of its branches for the branched nodes, once all of them are solved) and the
+        nodes with a declared type are the sources of the graph and never change.
+
+        Every node of a cycle ends with the same type, so the strongly connected components of the nodes to infer
+        are collapsed into a single value and the condensed graph is solved in topological order with a priority
+        queue: a component is processed again only if one of its inputs changes, which happens at most `height`
+        times. When the queue is empty the unsolved components with a solved hint take the join of their hints and
+        the propagation continues, the nodes that remain unsolved take the default type.
+        """
+        self._fixpoint(self._components, 'components', self._join_all, default_type)
+
+    def unify(self, default_type: Type = None):
+        """
+        Solve the graph unifying the nodes joined by edges in both directions (a variable and the expression assigned
+        to it, a parameter and its argument, etc.) with a union-find, the other edges are subtype constraints between
+        the classes of nodes: the type of a class is the join of the types that reach it. The hints of a class that
+        receives no type are upper bounds, so it takes the most specific of them (their meet when they are in the same
+        branch of the hierarchy), which leaves fewer nodes with the default type.
+        """
+        self._fixpoint(self._classes, 'classes', self._meet, default_type)
+
+    def _fixpoint(self, partition, partition_name: str, combine_hints, default_type: Optional[Type]):
+        """
+        Solve the graph with the groups of nodes given by `partition`, the deferred calls are resolved by the solver
+        as soon as their receiver gets a type. The nodes are updated at the end with their solved types.
+        """
+        nodes, index, edges, watchers = self._prepare()
+        groups = partition(nodes, edges, watchers)
+        types, iterations, resolved = self._solve(nodes, index, edges, watchers, groups, combine_hints)
+
+        for node, _type in zip(nodes, types):
+            if _type is not None:
+                node.update(_type)
+            elif default_type is not None:
+                node.update(default_type)
+
+        self.stats = {
+            'iterations': iterations,
+            'nodes': len(self.dependencies),
+            'edges': sum(len(adjacency) for adjacency in self.dependencies.values()),
+            'hints': sum(len(adjacency) for adjacency in self.hints.values()),
+            'solved': len(self.dependencies) - sum(1 for _type in types if _type is None),
+            partition_name: len(groups),
+            'calls': len(self.calls),
+            'resolved_calls': resolved,
+        }
 
-            if not node.is_ready:
+    @staticmethod
+    def _components(nodes: List[DependencyNode], edges: List[List[int]], watchers: List[List[int]]) -> List[List[int]]:
+        """The strongly connected components of the nodes, in topological order"""
+        # The nodes of a cycle of edges share their type, but a branched node only takes the type of its branches once
+        # all of them are solved, so the edges from the branches are only used to sort the components: the
+        # components of the whole graph are split by the cycles of edges. Tarjan returns the components in reverse
+        # topological order
+        components = []
+        for members in reversed(strongly_connected_components([e + w for e, w in zip(edges, watchers)])):
+            if not any(isinstance(nodes[i], BranchedNode) for i in members):
+                components.append(members)
                 continue
+            local = {i: k for k, i in enumerate(members)}
+            for split in reversed(strongly_connected_components(
+                    [[local[j] for j in edges[i] if j in local] for i in members])):
+                components.append([members[k] for k in split])
+        return components
+
+    @staticmethod
+    def _classes(nodes: List[DependencyNode], edges: List[List[int]], watchers: List[List[int]]) -> List[List[int]]:
+        """The classes of the nodes joined by edges in both directions"""
+        parent = list(range(len(nodes)))
+
+        def find(i: int) -> int:
+            root = i
+            while parent[root] != root:
+                root = parent[root]
+            while parent[i] != root:
+                parent[i], i = root, parent[i]
+            return root
+
+        # A node may have many successors, so the reverse edges are looked up in sets instead of the adjacency lists
+        successors = [set(adjacency) for adjacency in edges]
+        for i, adjacency in enumerate(edges):
+            for j in adjacency:
+                if i in successors[j]:
+                    ri, rj = find(i), find(j)
+                    if ri != rj:
+                        parent[max(ri, rj)] = min(ri, rj)
+
+        classes: Dict[int, List[int]] = OrderedDict()
+        for i in range(len(nodes)):
+            classes.setdefault(find(i), []).append(i)
+        return list(classes.values())
+
+    def _prepare(self) -> Tuple[List[DependencyNode], Dict[DependencyNode, int], List[List[int]], List[List[int]]]:
+        """
+        Return the nodes to infer (the ones with AUTO_TYPE), their indexes, the edges between them and the branched
+        nodes that watch each of them
+        """
+        # Undefined variables produce None instead of a node, they have no type to give or receive
+        for edges in (self.dependencies, self.hints):
+            edges.pop(None, None)
+            for adjacency in edges.values():
+                adjacency[:] = [adj for adj in adjacency if adj is not None]
+
+        nodes = [node for node in self.dependencies if node.type.name == 'AUTO_TYPE']
+        index = {node: i for i, node in enumerate(nodes)}
+        edges = [[index[adj] for adj in self.dependencies[node] if adj in index] for node in nodes]
+        watchers: List[List[int]] = [[] for _ in nodes]
+        for i, node in enumerate(nodes):
+            if isinstance(node, BranchedNode):
+                for branch in node.branches:
+                    if branch in index:
+                        watchers[index[branch]].append(i)
+        return nodes, index, edges, watchers
+
+    def _solve(self, nodes: List[DependencyNode], index: Dict[DependencyNode, int], edges: List[List[int]],
+               watchers: List[List[int]], groups: List[List[int]],
+               combine_hints) -> Tuple[List[Optional[Type]], int, int]:
+        """
+        Propagate the types between the groups of nodes that share their type, the groups are processed in the
+        given order with a priority queue. Only the nodes to infer are in the groups, the nodes with a declared
+        type are the seeds. When the queue is empty each unsolved group with solved hints takes the combination of
+        their types and the propagation continues.
+
+        A deferred call is resolved when the group of its receiver is processed with a new value (the edges to the
+        method of a previous value stay, that method overrides the new one so they share the signature). The edges
+        of the resolution are added to the lists of the solver, the new nodes to infer get a group of their own,
+        and their targets are raised with the current values, so the propagation continues from them instead of
+        starting again. Return the type of each node (None if it is not solved), the number of groups processed
+        and the number of resolved calls.
+        """
+        group = [0] * len(nodes)
+        for g, members in enumerate(groups):
+            for i in members:
+                group[i] = g
+
+        values: List[Optional[Type]] = [None] * len(groups)
+        queue: List[int] = []
+        queued: Set[int] = set()
+        iterations = resolved = 0
+
+        # The deferred calls waiting for the type of each node
+        waiting: Dict[int, List[CallNode]] = {}
+
+        def raise_value(g: int, _type: Type):
+            current = values[g]
+            if current is not None:
+                _type = self._join(current, _type)
+                if _type is current:
+                    return
+            values[g] = _type
+            if g not in queued:
+                queued.add(g)
+                heappush(queue, g)
+
+        def solved_type(node: DependencyNode) -> Optional[Type]:
+            # The nodes out of the groups have a declared type (the atoms of the branches are not always in the graph)
+            return values[group[index[node]]] if node in index else node.type
+
+        def add_node(node: DependencyNode):
+            if node not in index and node.type.name == 'AUTO_TYPE':
+                index[node] = len(nodes)
+                nodes.append(node)
+                edges.append([])
+                watchers.append([])
+                group.append(len(groups))
+                groups.append([index[node]])
+                values.append(None)
+
+        def resolve(call: CallNode, receiver_type: Type):
+            nonlocal resolved
+            resolved += 1
+            call.receiver_type = receiver_type
+            self._added = []
+            try:
+                self.resolve_call(call, receiver_type)
+                added = self._added
+            finally:
+                self._added = None
+
+            for node, other, hint in added:
+                add_node(node)
+                add_node(other)
+                if not hint and other in index:
+                    if node in index:
+                        edges[index[node]].append(index[other])
+                    _type = solved_type(node)
+                    if _type is not None:
+                        raise_value(group[index[other]], _type)
+
+        if self.resolve_call is not None:
+            for call in self.calls:
+                if call.receiver in index:
+                    waiting.setdefault(index[call.receiver], []).append(call)
+                elif call.receiver_type is not call.receiver.type:
+                    resolve(call, call.receiver.type)
+
+        for node, adjacency in self.dependencies.items():
+            if node not in index:
+                for adj in adjacency:
+                    if adj in index:
+                        raise_value(group[index[adj]], node.type)
+
+        for node in nodes:
+            if isinstance(node, BranchedNode) and all(branch not in index for branch in node.branches):
+                raise_value(group[index[node]], Type.multi_join([branch.type for branch in node.branches]))
+
+        while True:
+            while queue:
+                g = heappop(queue)
+                queued.discard(g)
+                iterations += 1
+                value = values[g]
+
+                for i in groups[g]:
+                    for call in waiting.get(i, ()):
+                        if call.receiver_type is not value:
+                            resolve(call, value)
+
+                    for j in edges[i]:
+                        if group[j] != g:
+                            raise_value(group[j], value)
+
+                    for j in watchers[i]:
+                        branch_types = [solved_type(branch) for branch in nodes[j].branches]
+                        if all(t is not None for t in branch_types):
+                            raise_value(group[j], Type.multi_join(branch_types))
+
+            hinted: Dict[int, List[Type]] = OrderedDict()
+            for node, targets in self.hints.items():
+                _type = solved_type(node)
+                if _type is not None:
+                    for adj in targets:
+                        if adj in index and values[group[index[adj]]] is None:
+                            hinted.setdefault(group[index[adj]], []).append(_type)
+            for g, types in hinted.items():
+                raise_value(g, combine_hints(types))
+            if not queue:
+                break
+
+        return [values[group[i]] for i in range(len(nodes))], iterations, resolved
+
+    @staticmethod
+    def _meet(types: List[Type]) -> Type:
+        """The most specific of the types if it conforms to all the others, otherwise their join"""
+        for _type in types:
+            if all(_type.conforms_to(other) for other in types):
+                return _type
+        return DependencyGraph._join_all(types)
 
-            for adj in self.dependencies[node]:
-                if adj not in visited:
-                    adj.update(node.type)
-                    visited.add(adj)
-                    if not isinstance(adj, BranchedNode):
-                        queue.append(adj)
+    @staticmethod
+    def _join(current: Type, other: Type) -> Type:
+        # Types out of the hierarchy (as the ErrorType) have no common ancestor with the others
+        joined = current.join(other)
+        return current if joined is None else joined
 
+    @staticmethod
+    def _join_all(types: List[Type]) -> Type:
+        result = types[0]
+        for _type in types[1:]:
+            result = DependencyGraph._join(result, _type)
+        return result
+
+    def to_dict(self, timings: Optional[Dict[str, float]] = None) -> dict:
+        """
+        Return the graph as a JSON serializable dict with its stats, the given timings, the nodes (with their kind and
+        their current type) and the edges, whose kind is 'dependency', 'hint', 'branch' (from a branch to its
+        conditional or case) or 'receiver' (from the receiver of a deferred call to the call)
+        """
+        ids: Dict[DependencyNode, int] = {}
         for node in self.dependencies:
-            if isinstance(node, BranchedNode) and node.is_ready:
-                node.update(Type.multi_join([x.type for x in node.branches]))
-
-        queue = deque(node for node in self.dependencies
-                      if isinstance(node, BranchedNode) and node.type.name != 'AUTO_TYPE')
-        visited.update(queue)
-        while queue:
-            node = queue.popleft()
-            for adj in self.dependencies[node]:
-                if adj not in visited:
-                    adj.update(node.type)
-                    visited.add(adj)
-                    queue.append(adj)
-
-        if default_type is not None:
-            for node in self.dependencies:
-                if node not in visited:
-                    node.update(default_type)
+            ids[node] = len(ids)
+
+        def node_id(n: DependencyNode) -> int:
+            if n not in ids:
+                ids[n] = len(ids)
+            return ids[n]
+
+        edges = []
+        for kind, adjacencies in (('dependency', self.dependencies), ('hint', self.hints)):
+            for node, adjacency in adjacencies.items():
+                edges.extend({'source': node_id(node), 'target': node_id(adj), 'kind': kind} for adj in adjacency)
+        for node in list(self.dependencies):
+            if isinstance(node, BranchedNode):
+                edges.extend({'source': node_id(branch), 'target': node_id(node), 'kind': 'branch'}
+                             for branch in node.branches if branch is not None)
+        for call in self.calls:
+            edges.append({'source': node_id(call.receiver), 'target': node_id(call), 'kind': 'receiver'})
+
+        return {
+            'stats': self.stats,
+            'timings': timings or {},
+            'nodes': [{'id': i, 'kind': type(node).__name__, 'label': str(node), 'type': node.type.name}
+                      for node, i in ids.items()],
+            'edges': edges,
+        }
+
+    def to_dot(self, timings: Optional[Dict[str, float]] = None) -> str:
+        """Return the graph in the DOT language of Graphviz, the hints are dashed and the branches dotted"""
+        data = self.to_dict(timings)
+        styles = {'dependency': '', 'hint': ' [style=dashed]', 'branch': ' [style=dotted]', 'receiver': ' [color=blue]'}
+        label = ', '.join([f'{key}: {value}' for key, value in data['stats'].items()] +
+                          [f'{key}: {value:.6f} s' for key, value in data['timings'].items()])
+
+        lines = ['digraph inference {', f'    label="{label}";']
+        for node in data['nodes']:
+            node_label = node['label'].replace('"', '\\"')
+            lines.append(f'    n{node["id"]} [label="{node_label}"];')
+        for edge in data['edges']:
+            lines.append(f'    n{edge["source"]} -> n{edge["target"]}{styles[edge["kind"]]};')
+        lines.append('}')
+        return '\n'.join(lines) + '\n'
 
     def __str__(self):
         return '{\n\t' + '\n\t'.join(f'{key}: {value}' for key, value in self.dependencies.items()) + '\n}'
 
 
-class InferenceChecker:
-    def __init__(self, context, errors):
+INFERENCE_ENGINES = ('graph', 'unification')
+
+
+def strongly_connected_components(successors: List[List[int]], roots: Optional[List[int]] = None) -> List[List[int]]:
+    """
+    Return the strongly connected components of the graph with nodes 0..n-1 and the given adjacency lists, in reverse
+    topological order (Tarjan's algorithm with an explicit stack, the graphs of big programs are too deep for the
+    recursion limit). If `roots` is given only the nodes reachable from them are returned.
+    """
+    indexes: List[int] = [-1] * len(successors)
+    lowlinks: List[int] = [0] * len(successors)
+    on_stack: List[bool] = [False] * len(successors)
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(len(successors)) if roots is None else roots:
+        if indexes[root] != -1:
+            continue
+
+        indexes[root] = lowlinks[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(successors[root]))]
+        while work:
+            v, adjacency = work[-1]
+            for w in adjacency:
+                if indexes[w] == -1:
+                    indexes[w] = lowlinks[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, iter(successors[w])))
+                    break
+                if on_stack[w] and indexes[w] < lowlinks[v]:
+                    lowlinks[v] = indexes[w]
+            else:
+                work.pop()
+                if lowlinks[v] == indexes[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component.append(w)
+                        if w == v:
+                            break
+                    components.append(component)
+                if work:
+                    u = work[-1][0]
+                    if lowlinks[v] < lowlinks[u]:
+                        lowlinks[u] = lowlinks[v]
+
+    return components
+
+
+class InferenceChecker(visitor.Visitor):
+    """
+    Build the dependency graph of the program and solve it with the given engine: 'graph' collapses the cycles of the
+    graph and propagates the types through them (`DependencyGraph.update_dependencies`), 'unification' unifies the
+    nodes related by equalities and solves the subtype constraints between them (`DependencyGraph.unify`).
+
+    The `cached` features (usually `InferenceCache.cached`) already have the types of a previous run in their
+    declarations and no other feature shares types with them, so they are left out of the graph.
+    """
+
+    def __init__(self, context, errors, engine: str = 'graph', cached: Optional[Set[ast.Node]] = None):
+        if engine not in INFERENCE_ENGINES:
+            raise ValueError(f'Unknown inference engine "{engine}", expected one of {", ".join(INFERENCE_ENGINES)}')
+
         self.context: Context = context
         self.errors: List[str] = errors
         self.current_type: Optional[Type] = None
@@ -216,7 +609,17 @@ class InferenceChecker:
         self.variables: Dict[VariableInfo, VariableInfoNode] = {}
         self.attributes = self.build_attributes_reference(context)
         self.methods = self.build_methods_reference(context)
-        self.graph = DependencyGraph()
+        self.graph = DependencyGraph(self.resolve_call)
+        self.engine: str = engine
+        self.cached: Set[ast.Node] = cached if cached is not None else set()
+
+        # Seconds spent building the graph, solving it and substituting the inferred types in the AST
+        self.timings: Dict[str, float] = {}
+
+        # The declarations whose AUTO_TYPE must be replaced by the inferred type once the graph is solved. They are
+        # recorded in the order of the old substitution pass (each declaration after the expressions it contains),
+        # so the inference errors keep their order
+        self.substitutions: List[tuple] = []
 
     @staticmethod
     def build_attributes_reference(context: Context) -> Dict[Tuple[str, str], AttributeNode]:
@@ -249,20 +652,28 @@ class InferenceChecker:
         if scope is None:
             scope = Scope()
 
+        start = time.perf_counter()
         for item in node.declarations:
             self.visit(item, scope.create_child())
+        built = time.perf_counter()
+
+        if self.engine == 'unification':
+            self.graph.unify(default_type=self.context.get_type('Object'))
+        else:
+            self.graph.update_dependencies(default_type=self.context.get_type('Object'))
+        solved = time.perf_counter()
 
-        # print(self.graph, '\n')
-        self.graph.update_dependencies(default_type=self.context.get_type('Object'))
-        # print(self.graph, '\n')
-        InferenceTypeSubstitute(self.context, self.errors).visit(node, scope)
+        for substitute, *args in self.substitutions:
+            substitute(*args)
+        self.timings = {'build': built - start, 'solve': solved - built, 'substitution': time.perf_counter() - solved}
 
     @visitor.when(ast.ClassDeclarationNode)
     def visit(self, node: ast.ClassDeclarationNode, scope: Scope):
         self.current_type = self.context.get_type(node.id)
 
-        attrs = [feature for feature in node.features if isinstance(feature, ast.AttrDeclarationNode)]
-        methods = [feature for feature in node.features if isinstance(feature, ast.MethodDeclarationNode)]
+        features = [feature for feature in node.features if feature not in self.cached]
+        attrs = [feature for feature in features if isinstance(feature, ast.AttrDeclarationNode)]
+        methods = [feature for feature in features if isinstance(feature, ast.MethodDeclarationNode)]
 
         for attr in attrs:
             self.visit(attr, scope)
@@ -294,6 +705,8 @@ class InferenceChecker:
             self.graph.add_edge(var_info_node, attr_node)
             self.graph.add_edge(attr_node, var_info_node)
 
+        self.substitutions.append((self.substitute_attribute, node, scope))
+
     @visitor.when(ast.MethodDeclarationNode)
     def visit(self, node: ast.MethodDeclarationNode, scope: Scope):
         self.current_method = self.current_type.get_method(node.id)
@@ -322,6 +735,8 @@ class InferenceChecker:
                 self.graph.add_edge(param_var_info_node, parameter_node)
                 self.graph.add_edge(parameter_node, param_var_info_node)
 
+        self.substitutions.append((self.substitute_parameters, node, scope))
+
         # Solve the body of the method
         body_node = self.visit(node.body, scope)
 
@@ -330,9 +745,11 @@ class InferenceChecker:
             return_type_node = self.methods[self.current_type.name, self.current_method.name][1]
             self.graph.add_edge(body_node, return_type_node)
 
+        self.substitutions.append((self.substitute_return_type, node, self.current_method))
+
     @visitor.when(ast.LetNode)
     def visit(self, node: ast.LetNode, scope: Scope):
-        for _id, _type, _expr in node.declarations:
+        for i, (_id, _type, _expr) in enumerate(node.declarations):
             try:
                 # Define and get the var_info
                 var_info = scope.define_variable(_id, self.context.get_type(_type))
@@ -351,7 +768,9 @@ class InferenceChecker:
                 else:
                     self.graph.add_node(var_info_node)
             elif expr_node is not None and expr_node.type.name == 'AUTO_TYPE':
-                self.graph.add_edge(var_info_node, expr_node)
+                self.graph.add_edge(var_info_node, expr_node, hint=True)
+
+            self.substitutions.append((self.substitute_declaration, node, i, scope))
 
         return self.visit(node.expr, scope.create_child())
 
@@ -398,14 +817,14 @@ class InferenceChecker:
 
         conditional_node = ConditionalNode(self.context.get_type('AUTO_TYPE'), then_node, else_node)
         if isinstance(then_node, AtomNode) and not isinstance(else_node, AtomNode):
-            self.graph.add_edge(then_node, else_node)
+            self.graph.add_edge(then_node, else_node, hint=True)
         elif not isinstance(then_node, AtomNode) and isinstance(else_node, AtomNode):
-            self.graph.add_edge(else_node, then_node)
+            self.graph.add_edge(else_node, then_node, hint=True)
         else:
-            self.graph.add_edge(then_node, else_node)
-            self.graph.add_edge(else_node, then_node)
-            self.graph.add_edge(conditional_node, then_node)
-            self.graph.add_edge(conditional_node, else_node)
+            self.graph.add_edge(then_node, else_node, hint=True)
+            self.graph.add_edge(else_node, then_node, hint=True)
+            self.graph.add_edge(conditional_node, then_node, hint=True)
+            self.graph.add_edge(conditional_node, else_node, hint=True)
 
         return conditional_node
 
@@ -438,7 +857,7 @@ class InferenceChecker:
             if defined_nodes:
                 t = Type.multi_join([x.type for x in defined_nodes])
                 for x in not_defined_nodes:
-                    self.graph.add_edge(AtomNode(t), x)
+                    self.graph.add_edge(AtomNode(t), x, hint=True)
             case_of_node = CaseOfNode(self.context.get_type('AUTO_TYPE'), case_nodes)
             self.graph.add_node(case_of_node)
             return case_of_node
@@ -449,35 +868,18 @@ class InferenceChecker:
         if node.obj is None:
             node.obj = ast.VariableNode('self')
         obj_node = self.visit(node.obj, scope)
+        arg_nodes = [self.visit(arg, scope) for arg in node.args]
+
+        if isinstance(obj_node, AtomNode):
+            result_node = self.connect_call(obj_node.type, node.id, arg_nodes)
+            if result_node is not None:
+                return result_node
+        elif obj_node is not None:
+            # The method is unknown until the type of the receiver is inferred
+            call_node = CallNode(self.context.get_type('AUTO_TYPE'), obj_node, node.id, arg_nodes)
+            self.graph.add_call(call_node)
+            return call_node
 
-        if isinstance(obj_node, AtomNode) and obj_node.type.contains_method(node.id):
-            method, owner = obj_node.type.get_method(node.id, get_owner=True)
-            param_nodes, return_node = self.methods[owner.name, method.name]
-            for i, arg in enumerate(node.args):
-                arg_node = self.visit(arg, scope)
-
-                if arg_node is None:
-                    # Possible error
-                    continue
-
-                if isinstance(arg_node, AtomNode):
-                    if param_nodes[i].type.name == 'AUTO_TYPE':
-                        self.graph.add_edge(arg_node, param_nodes[i])
-                    else:
-                        continue
-                else:
-                    if param_nodes[i].type.name != 'AUTO_TYPE':
-                        self.graph.add_edge(param_nodes[i], arg_node)
-                    else:
-                        self.graph.add_edge(param_nodes[i], arg_node)
-                        self.graph.add_edge(arg_node, param_nodes[i])
-
-            if return_node.type.name == 'AUTO_TYPE':
-                return return_node
-            return AtomNode(return_node.type if return_node.type.name != 'SELF_TYPE' else obj_node.type)
-
-        for arg in node.args:
-            self.visit(arg, scope)
         return AtomNode(self.context.get_type('Object'))
 
     @visitor.when(ast.IntegerNode)
@@ -567,132 +969,71 @@ class InferenceChecker:
 
         return AtomNode(return_type)
 
+    def connect_call(self, receiver_type: Type, method_name: str,
+                     arg_nodes: List[Optional[DependencyNode]]) -> Optional[DependencyNode]:
+        """
+        Add the edges between the arguments of a call and the parameters of the method of the receiver type and
+        return the node of the result of the call, or None if the receiver type has no such method
+        """
+        if not receiver_type.contains_method(method_name):
+            return None
 
-class InferenceTypeSubstitute:
-    def __init__(self, context: Context, errors: List[str]):
-        self.context: Context = context
-        self.errors: List[str] = errors
-        self.current_type: Optional[Type] = None
-        self.current_method: Optional[Method] = None
-
-    @visitor.on('node')
-    def visit(self, node, tabs):
-        pass
-
-    @visitor.when(ast.ProgramNode)
-    def visit(self, node: ast.ProgramNode, scope: Scope):
-        for i, elem in enumerate(node.declarations):
-            self.visit(elem, scope.children[i])
-        return scope
-
-    @visitor.when(ast.ClassDeclarationNode)
-    def visit(self, node: ast.ClassDeclarationNode, scope: Scope):
-        self.current_type = self.context.get_type(node.id)
-
-        attrs = [feature for feature in node.features if isinstance(feature, ast.AttrDeclarationNode)]
-        methods = [feature for feature in node.features if isinstance(feature, ast.MethodDeclarationNode)]
-
-        i = 0
-        for attr in attrs:
-            if attr.expr is not None:
-                attr.index = i
-                i += 1
-            self.visit(attr, scope)
-
-        for i, method in enumerate(methods, i):
-            self.visit(method, scope.children[i])
+        method, owner = receiver_type.get_method(method_name, get_owner=True)
+        param_nodes, return_node = self.methods[owner.name, method.name]
+        for param_node, arg_node in zip(param_nodes, arg_nodes):
+            if arg_node is None:
+                # Possible error
+                continue
 
-    @visitor.when(ast.AttrDeclarationNode)
-    def visit(self, node: ast.AttrDeclarationNode, scope: Scope):
+            if isinstance(arg_node, AtomNode):
+                if param_node.type.name == 'AUTO_TYPE':
+                    self.graph.add_edge(arg_node, param_node)
+            else:
+                if param_node.type.name != 'AUTO_TYPE':
+                    self.graph.add_edge(param_node, arg_node, hint=True)
+                else:
+                    self.graph.add_edge(param_node, arg_node)
+                    self.graph.add_edge(arg_node, param_node)
+
+        if return_node.type.name == 'AUTO_TYPE':
+            return return_node
+        return AtomNode(return_node.type if return_node.type.name != 'SELF_TYPE' else receiver_type)
+
+    def resolve_call(self, call: CallNode, receiver_type: Type):
+        result_node = self.connect_call(receiver_type, call.method_name, call.args)
+        if result_node is not None:
+            # The call is the result of the method, as if the receiver had been declared with its type
+            self.graph.add_edge(result_node, call)
+            if not isinstance(result_node, AtomNode):
+                self.graph.add_edge(call, result_node)
+
+    def substitute_attribute(self, node: ast.AttrDeclarationNode, scope: Scope):
         attr_type = self.context.get_type(node.type)
         var_info = scope.find_variable(node.id)
 
-        if node.expr is not None:
-            self.visit(node.expr, scope.children[node.index])
-
         if attr_type == self.context.get_type('AUTO_TYPE'):
             if var_info.type == self.context.get_type('AUTO_TYPE'):
                 self.errors.append(err.INFERENCE_ERROR_ATTRIBUTE % node.id)
             node.type = var_info.type.name
 
-    @visitor.when(ast.MethodDeclarationNode)
-    def visit(self, node: ast.MethodDeclarationNode, scope: Scope):
-        self.current_method = self.current_type.get_method(node.id)
-        return_type = self.context.get_type(node.return_type)
-
+    def substitute_parameters(self, node: ast.MethodDeclarationNode, scope: Scope):
         for i, (name, expr_body_type) in enumerate(node.params):
             variable_info = scope.find_variable(name)
             if variable_info.type == self.context.get_type('AUTO_TYPE'):
                 self.errors.append(err.INFERENCE_ERROR_ATTRIBUTE % name)
             node.params[i] = (name, variable_info.type.name)
 
-        self.visit(node.body, scope)
-
-        if return_type == self.context.get_type('AUTO_TYPE'):
-            if self.current_method.return_type == self.context.get_type('AUTO_TYPE'):
+    def substitute_return_type(self, node: ast.MethodDeclarationNode, method: Method):
+        if self.context.get_type(node.return_type) == self.context.get_type('AUTO_TYPE'):
+            if method.return_type == self.context.get_type('AUTO_TYPE'):
                 self.errors.append(err.INFERENCE_ERROR_ATTRIBUTE % node.id)
-            node.return_type = self.current_method.return_type.name
-
-    @visitor.when(ast.LetNode)
-    def visit(self, node: ast.LetNode, scope: Scope):
-        child_index = 0
-        for i, (_id, _type, _expr) in enumerate(node.declarations):
-            variable_info = scope.find_variable(_id)
+            node.return_type = method.return_type.name
 
-            if _expr is not None:
-                self.visit(_expr, scope.children[child_index])
-                child_index += 1
+    def substitute_declaration(self, node: ast.LetNode, index: int, scope: Scope):
+        _id, _type, _expr = node.declarations[index]
+        variable_info = scope.find_variable(_id)
 
-            if _type == 'AUTO_TYPE':
-                if variable_info.type == self.context.get_type('AUTO_TYPE'):
-                    self.errors.append(err.INFERENCE_ERROR_ATTRIBUTE % _id)
-                node.declarations[i] = (_id, variable_info.type.name, _expr)
-
-        self.visit(node.expr, scope.children[child_index])
-
-    @visitor.when(ast.AssignNode)
-    def visit(self, node: ast.AssignNode, scope: Scope):
-        self.visit(node.expr, scope.children[0])
-
-    @visitor.when(ast.BlockNode)
-    def visit(self, node: ast.BlockNode, scope: Scope):
-        child_scope = scope.children[0]
-        for i, expr in enumerate(node.expressions):
-            self.visit(expr, child_scope)
-
-    @visitor.when(ast.ConditionalNode)
-    def visit(self, node: ast.ConditionalNode, scope: Scope):
-        self.visit(node.if_expr, scope)
-        self.visit(node.then_expr, scope.children[0])
-        self.visit(node.else_expr, scope.children[1])
-
-    @visitor.when(ast.WhileNode)
-    def visit(self, node: ast.WhileNode, scope: Scope):
-        self.visit(node.condition, scope)
-        self.visit(node.body, scope.children[0])
-
-    @visitor.when(ast.SwitchCaseNode)
-    def visit(self, node: ast.SwitchCaseNode, scope: Scope):
-        self.visit(node.expr, scope)
-        for i, (_id, _type, _expr) in enumerate(node.cases):
-            self.visit(_expr, scope.children[i])
-
-    @visitor.when(ast.MethodCallNode)
-    def visit(self, node: ast.MethodCallNode, scope: Scope):
-        self.visit(node.obj, scope)
-
-        for arg in node.args:
-            self.visit(arg, scope)
-
-    @visitor.when(ast.AtomicNode)
-    def visit(self, node: ast.AtomicNode, scope: Scope):
-        pass
-
-    @visitor.when(ast.UnaryNode)
-    def visit(self, node: ast.UnaryNode, scope: Scope):
-        self.visit(node.expr, scope)
-
-    @visitor.when(ast.BinaryNode)
-    def visit(self, node: ast.BinaryNode, scope: Scope):
-        self.visit(node.left, scope)
-        self.visit(node.right, scope)
+        if _type == 'AUTO_TYPE':
+            if variable_info.type == self.context.get_type('AUTO_TYPE'):
+                self.errors.append(err.INFERENCE_ERROR_ATTRIBUTE % _id)
+            node.declarations[index] = (_id, variable_info.type.name, _expr)
@@ -1,22 +1,43 @@
-from typing import List, Union, Tuple, Optional
+from typing import Dict, Iterator, List, Union, Tuple, Optional
 
 Feature = Union['MethodDeclarationNode', 'AttrDeclarationNode']
 
+# The node classes indexed by their `kind`
+NODE_CLASSES: List[type] = []
+
 
 class Node:
-    pass
+    # All the nodes use __slots__, our biggest programs produce millions of nodes and a per instance __dict__ is the
+    # main cost of each of them. `nid` is the id of the node in the PositionTable of the program.
+    __slots__ = ('nid',)
+
+    # Every node class has a distinct integer `kind`, the visitors use it to index their tables of targets
+    kind: int = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.kind = len(NODE_CLASSES)
+        NODE_CLASSES.append(cls)
+
+
+NODE_CLASSES.append(Node)
 
 
 class ProgramNode(Node):
+    __slots__ = ('declarations', 'positions')
+
     def __init__(self, declarations):
         self.declarations: List[ClassDeclarationNode] = declarations
+        self.positions = None  # PositionTable with the source positions of the nodes, set by the parser
 
 
 class DeclarationNode(Node):
-    pass
+    __slots__ = ()
 
 
 class ClassDeclarationNode(DeclarationNode):
+    __slots__ = ('id', 'parent', 'features')
+
     def __init__(self, idx, features, parent=None):
         self.id: str = idx
         self.parent: str = parent
@@ -24,6 +45,8 @@ class ClassDeclarationNode(DeclarationNode):
 
 
 class MethodDeclarationNode(DeclarationNode):
+    __slots__ = ('id', 'params', 'return_type', 'body')
+
     def __init__(self, idx, params, return_type, body):
         self.id: str = idx
         self.params: List[Tuple[str, str]] = params
@@ -32,6 +55,8 @@ class MethodDeclarationNode(DeclarationNode):
 
 
 class AttrDeclarationNode(DeclarationNode):
+    __slots__ = ('id', 'type', 'expr')
+
     def __init__(self, idx, typex, expr=None):
         self.id: str = idx
         self.type: str = typex
@@ -39,26 +64,34 @@ class AttrDeclarationNode(DeclarationNode):
 
 
 class ExprNode(Node):
-    pass
+    __slots__ = ()
 
 
 class ParenthesisExpr(ExprNode):
+    __slots__ = ('expr',)
+
     def __init__(self, expr):
         self.expr = expr
 
 
 class BlockNode(ExprNode):
+    __slots__ = ('expressions',)
+
     def __init__(self, expressions):
         self.expressions: List[ExprNode] = expressions
 
 
 class LetNode(ExprNode):
+    __slots__ = ('declarations', 'expr')
+
     def __init__(self, declarations, expr):
         self.declarations: List[Tuple[str, str, Optional[ExprNode]]] = declarations
         self.expr: ExprNode = expr
 
 
 class SwitchCaseNode(ExprNode):
+    __slots__ = ('expr', 'cases')
+
     def __init__(self, expr, cases):
         self.expr: ExprNode = expr
         self.cases: List[Tuple[str, str, ExprNode]] = cases
@@ -72,12 +105,16 @@ class SwitchCaseNode(ExprNode):
 
 
 class AssignNode(ExprNode):
+    __slots__ = ('id', 'expr')
+
     def __init__(self, idx, expr):
         self.id: str = idx
         self.expr: ExprNode = expr
 
 
 class ConditionalNode(ExprNode):
+    __slots__ = ('if_expr', 'then_expr', 'else_expr')
+
     def __init__(self, ifx, then, elsex):
         self.if_expr: ExprNode = ifx
         self.then_expr: ExprNode = then
@@ -85,12 +122,16 @@ class ConditionalNode(ExprNode):
 
 
 class WhileNode(ExprNode):
+    __slots__ = ('condition', 'body')
+
     def __init__(self, condition, body):
         self.condition: ExprNode = condition
         self.body: ExprNode = body
 
 
 class MethodCallNode(ExprNode):
+    __slots__ = ('obj', 'id', 'args', 'type')
+
     def __init__(self, idx, args, obj=None, typex=None):
         self.obj: ExprNode = obj
         self.id: str = idx
@@ -99,77 +140,112 @@ class MethodCallNode(ExprNode):
 
 
 class AtomicNode(ExprNode):
+    __slots__ = ('lex',)
+
     def __init__(self, lex):
         self.lex: str = lex
 
 
 class UnaryNode(ExprNode):
+    __slots__ = ('expr',)
+
     def __init__(self, expr):
         self.expr: ExprNode = expr
 
 
 class BinaryNode(ExprNode):
-    def __init__(self, left, operation, right):
+    # The operator is the same for every instance of a class, so it is stored in the class
+    __slots__ = ('left', 'right')
+    operation: str
+
+    def __init__(self, left, right):
         self.left: ExprNode = left
-        self.operation: str = operation
         self.right: ExprNode = right
 
 
 class VariableNode(AtomicNode):
-    pass
+    __slots__ = ()
 
 
 class InstantiateNode(AtomicNode):
-    pass
+    __slots__ = ()
 
 
 class IntegerNode(AtomicNode):
-    pass
+    __slots__ = ()
 
 
 class StringNode(AtomicNode):
-    pass
+    __slots__ = ()
 
 
 class BooleanNode(AtomicNode):
-    pass
+    __slots__ = ()
 
 
 class NegationNode(UnaryNode):
-    pass
+    __slots__ = ()
 
 
 class ComplementNode(UnaryNode):
-    pass
+    __slots__ = ()
 
 
 class IsVoidNode(UnaryNode):
-    pass
+    __slots__ = ()
 
 
 class PlusNode(BinaryNode):
-    pass
+    __slots__ = ()
+    operation = '+'
 
 
 class MinusNode(BinaryNode):
-    pass
+    __slots__ = ()
+    operation = '-'
 
 
 class StarNode(BinaryNode):
-    pass
+    __slots__ = ()
+    operation = '*'
 
 
 class DivNode(BinaryNode):
-    pass
+    __slots__ = ()
+    operation = '/'
 
 
 class LessThanNode(BinaryNode):
-    pass
+    __slots__ = ()
+    operation = '<'
 
 
 class LessEqualNode(BinaryNode):
-    pass
+    __slots__ = ()
+    operation = '<='
 
 
 class EqualNode(BinaryNode):
-    pass
+    __slots__ = ()
+    operation = '='
+
+
+def walk(node: Node) -> Iterator[Node]:
+    """Yield the node and all the nodes below it in preorder, the children are found in the slots of the node"""
+    stack = [node]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, Node):
+            yield value
+            fields = _FIELDS.get(type(value))
+            if fields is None:
+                fields = _FIELDS[type(value)] = [field for cls in reversed(type(value).__mro__)
+                                                 for field in getattr(cls, '__slots__', ())
+                                                 if field not in ('nid', 'positions')]
+            stack.extend(getattr(value, field, None) for field in reversed(fields))
+        elif isinstance(value, (list, tuple)):
+            stack.extend(reversed(value))
+
+
+# The fields with the children of each node class, filled by `walk`
+_FIELDS: Dict[type, List[str]] = {}
@@ -28,3 +28,9 @@ MAIN_CLASS_NOT_FOUND = 'MainClassNotFound: no Main class in program.'
 MAIN_METHOD_NOT_FOUND = 'MainMethodNotFound: no main method in class Main.'
 VOID_EXPRESSION = 'VoidReferenceError: Object reference not set to an instance of an object.'
 CASE_OF_ERROR = 'CaseOfError: No branch matches wit de dynamic type of the case expression.'
+SUBSTR_OUT_OF_RANGE = 'IndexError: Substring (%d, %d) out of range of a string of length %d.'
+STEP_LIMIT = 'LimitError: The program exceeded the limit of %d steps.'
+OBJECT_LIMIT = 'LimitError: The program exceeded the limit of %d objects.'
+HEAP_LIMIT = 'LimitError: The program exceeded the limit of %d bytes of heap.'
+TIME_LIMIT = 'LimitError: The program exceeded the limit of %g seconds.'
+DEPTH_LIMIT = 'LimitError: The program exceeded the depth of the stack with %d nested calls.'
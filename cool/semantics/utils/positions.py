@@ -0,0 +1,171 @@
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import cool.semantics.utils.astnodes as ast
+
+# The block of the offsets that are relative to the start of the text
+ROOT = 0
+
+
+def location(text: str, offset: int) -> Tuple[int, int]:
+    """Return the (line, column) that the lexer assigns to the given offset of the text"""
+    line_start = text.rfind('\n', 0, offset) + 1
+    prefix = text[line_start:offset]
+    return text.count('\n', 0, offset) + 1, len(prefix) + 3 * prefix.count('\t') + 1
+
+
+class PositionTable:
+    """Side table with the source positions of the nodes of an AST.
+
+    Every registered node receives an integer id (`node.nid`) and the start and end offsets of the node in the source
+    text are stored in parallel arrays indexed by that id, so keeping the positions of a big AST costs a few machine
+    integers per node instead of extra objects.
+
+    The offsets of a node are relative to the start of its block. A block starts at an offset of its parent block and
+    the `ROOT` block at the start of the text, the `IncrementalParser` gives a block to each class and to each of
+    their features, so an edit of the text only moves the blocks that follow it instead of every node. The ids of the
+    nodes of a discarded subtree are released and given to the next registered nodes, so the table does not grow
+    with the edits.
+
+    Params
+    ------
+    - text: str the source text, used to translate offsets into (line, column) pairs
+    - keep_nodes: bool if True the table also keeps the registered nodes in the `nodes` list, so it can be appended
+      to another table with `extend`"""
+
+    def __init__(self, text: str = '', keep_nodes: bool = False):
+        self.text: str = text
+        self.starts: array = array('I')
+        self.ends: array = array('I')
+        self.blocks: array = array('I')
+        self.nodes: Optional[List[Optional[ast.Node]]] = [] if keep_nodes else None
+        self.free: List[int] = []
+
+        # The start of each block relative to the start of its parent block, and the parent of each block
+        self.bases: List[int] = [0]
+        self.parents: List[int] = [ROOT]
+        self.free_blocks: List[int] = []
+
+        # The block of the nodes being added and its offset in the text
+        self.block: int = ROOT
+        self.block_start: int = 0
+
+        # The nodes added while it is not None, so the nodes of a parse that is discarded can be released
+        self.added: Optional[List[ast.Node]] = None
+
+    def add(self, node: ast.Node, start: int, end: int) -> int:
+        """Register the node with its offsets in the text, in the current block"""
+        start, end = start - self.block_start, end - self.block_start
+        if self.free:
+            nid = node.nid = self.free.pop()
+            self.starts[nid], self.ends[nid], self.blocks[nid] = start, end, self.block
+            if self.nodes is not None:
+                self.nodes[nid] = node
+        else:
+            nid = node.nid = len(self.starts)
+            self.starts.append(start)
+            self.ends.append(end)
+            self.blocks.append(self.block)
+            if self.nodes is not None:
+                self.nodes.append(node)
+        if self.added is not None:
+            self.added.append(node)
+        return nid
+
+    def release(self, nodes: Iterable[ast.Node]) -> None:
+        """Remove the nodes from the table (usually `ast.walk` of a discarded subtree), their ids are reused"""
+        size = len(self.starts)
+        for node in nodes:
+            nid = getattr(node, 'nid', None)
+            if nid is not None and nid < size:
+                self.free.append(nid)
+                if self.nodes is not None:
+                    self.nodes[nid] = None
+                node.nid = None
+
+    def extend(self, other: 'PositionTable', offset: int = 0) -> None:
+        """
+        Append the positions of other table, that must keep its nodes, moving them `offset` characters. The nodes of
+        the other table are renumbered and added to the root block, so after the call they belong to this table.
+        """
+        base = len(self.starts)
+        for node in other.nodes:
+            if node is not None:
+                node.nid += base
+        starts = [other.block_offset(block) + offset for block in range(len(other.bases))]
+        self.starts.extend(start + starts[block] for start, block in zip(other.starts, other.blocks))
+        self.ends.extend(end + starts[block] for end, block in zip(other.ends, other.blocks))
+        self.blocks.extend(array('I', [ROOT]) * len(other.starts))
+        self.free.extend(nid + base for nid in other.free)
+        if self.nodes is not None:
+            self.nodes.extend(other.nodes)
+
+    def __contains__(self, node: ast.Node) -> bool:
+        nid = getattr(node, 'nid', None)
+        return nid is not None and nid < len(self.starts)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def span(self, node: ast.Node) -> Optional[Tuple[int, int]]:
+        if node not in self:
+            return None
+        nid = node.nid
+        start = self.block_offset(self.blocks[nid])
+        return self.starts[nid] + start, self.ends[nid] + start
+
+    def location(self, node: ast.Node) -> Optional[Tuple[int, int]]:
+        """Return the (line, column) of the start of the node, columns are counted as the lexer does"""
+        span = self.span(node)
+        return None if span is None else location(self.text, span[0])
+
+    def new_block(self, parent: int, base: int) -> int:
+        """Return a new block that starts `base` characters after the start of its parent block"""
+        if self.free_blocks:
+            block = self.free_blocks.pop()
+            self.bases[block], self.parents[block] = base, parent
+        else:
+            block = len(self.bases)
+            self.bases.append(base)
+            self.parents.append(parent)
+        return block
+
+    def release_block(self, block: int) -> None:
+        """Release a block without nodes, its id is reused"""
+        self.free_blocks.append(block)
+
+    def select_block(self, block: int) -> None:
+        """Add the next nodes to the given block, their offsets are still given in the text"""
+        self.block, self.block_start = block, self.block_offset(block)
+
+    def move_block(self, block: int, delta: int) -> None:
+        """Move the block and its nodes, and the blocks inside it, `delta` characters"""
+        self.bases[block] += delta
+
+    def block_offset(self, block: int) -> int:
+        """Return the offset of the start of the block in the text"""
+        offset = 0
+        while block != ROOT:
+            offset += self.bases[block]
+            block = self.parents[block]
+        return offset
+
+    def rebase(self, nodes: Iterable[ast.Node], block: int) -> None:
+        """Move the nodes to the given block keeping their offsets in the text"""
+        start = self.block_offset(block)
+        deltas: Dict[int, int] = {}
+        starts, ends, blocks = self.starts, self.ends, self.blocks
+        for node in nodes:
+            nid = node.nid
+            old = blocks[nid]
+            if old != block:
+                delta = deltas.get(old)
+                if delta is None:
+                    delta = deltas[old] = self.block_offset(old) - start
+                starts[nid] += delta
+                ends[nid] += delta
+                blocks[nid] = block
+
+    def resize(self, node: ast.Node, delta: int) -> None:
+        """Move the end of the node `delta` characters, after an edit of the text inside of it"""
+        self.ends[node.nid] += delta
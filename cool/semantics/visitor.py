@@ -20,65 +20,123 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-import inspect
+"""Visitor pattern by dispatching on the class of a parameter.
 
-__all__ = ['on', 'when']
+A visitor class inherits from `Visitor`, declares its visit method decorated with `on` and its targets decorated with
+`when`, all of them with the same name:
+
+    class Printer(Visitor):
+        @on('node')
+        def visit(self, node):
+            pass
+
+        @when(ast.ProgramNode)
+        def visit(self, node):
+            ...
+
+When the class is created the targets are collected into a table indexed by the `kind` of the node classes, so a
+call is a list index plus a direct call. The target of a class is the one registered for the nearest class of its MRO,
+and the function decorated with `on` is called for the parameters that are not nodes or have no target. Every target
+is also available as a method named after the visit method and the node class, e.g. `visit_ProgramNode`.
+"""
+from typing import Callable, Dict, List
+
+from cool.semantics.utils.astnodes import NODE_CLASSES, Node
+
+__all__ = ['on', 'when', 'Visitor']
 
 
 def on(param_name):
     def f(fn):
-        dispatcher = Dispatcher(param_name, fn)
-        return dispatcher
+        return Dispatcher(param_name, fn)
 
     return f
 
 
 def when(param_type):
     def f(fn):
-        frame = inspect.currentframe().f_back
-        func_name = fn.func_name if 'func_name' in dir(fn) else fn.__name__
-        dispatcher = frame.f_locals[func_name]
-        if not isinstance(dispatcher, Dispatcher):
-            dispatcher = dispatcher.dispatcher
-        dispatcher.add_target(param_type, fn)
+        return Target(param_type, fn)
 
-        def ff(*args, **kw):
-            return dispatcher(*args, **kw)
+    return f
 
-        ff.dispatcher = dispatcher
-        return ff
 
-    return f
+class Target:
+    __slots__ = ('param_type', 'fn')
+
+    def __init__(self, param_type, fn):
+        self.param_type: type = param_type
+        self.fn: Callable = fn
 
 
-class Dispatcher(object):
+class Dispatcher:
     def __init__(self, param_name, fn):
-        frame = inspect.currentframe().f_back.f_back
-        self.top_level = frame.f_locals == frame.f_globals
-        self.param_index = self.__argspec(fn).args.index(param_name)
-        self.param_name = param_name
-        self.targets = {}
-
-    def __call__(self, *args, **kw):
-        typ = args[self.param_index].__class__
-        d = self.targets.get(typ)
-        if d is not None:
-            return d(*args, **kw)
-        else:
-            t = self.targets
-            ks = t.keys()
-            ans = [t[k](*args, **kw) for k in ks if issubclass(typ, k)]
-            if len(ans) == 1:
-                return ans.pop()
-            return ans
+        self.param_index: int = fn.__code__.co_varnames.index(param_name)
+        self.default: Callable = fn
+        self.targets: Dict[type, Callable] = {}
 
     def add_target(self, typ, target):
         self.targets[typ] = target
 
-    @staticmethod
-    def __argspec(fn):
-        # Support for Python 3 type hints requires inspect.getfullargspec
-        if hasattr(inspect, 'getfullargspec'):
-            return inspect.getfullargspec(fn)
+    def resolve(self, typ) -> Callable:
+        for base in typ.__mro__:
+            if base in self.targets:
+                return self.targets[base]
+        return self.default
+
+    def build(self, name: str) -> Callable:
+        """Return the function that dispatches the calls to the targets"""
+        index = self.param_index
+        table: List[Callable] = [self.resolve(cls) for cls in NODE_CLASSES]
+
+        def dispatch(*args, **kw):
+            try:
+                target = table[args[index].kind]
+            except (AttributeError, IndexError):
+                target = self.miss(type(args[index]), table)
+            return target(*args, **kw)
+
+        dispatch.__name__ = name
+        dispatch.__qualname__ = self.default.__qualname__
+        dispatch.__doc__ = self.default.__doc__
+        dispatch.dispatcher = self
+        return dispatch
+
+    def miss(self, typ, table: List[Callable]) -> Callable:
+        if not issubclass(typ, Node):
+            return self.default
+        # The node class was defined after the visitor
+        table.extend(self.resolve(cls) for cls in NODE_CLASSES[len(table):])
+        return table[typ.kind]
+
+
+class VisitorNamespace(dict):
+    """Namespace of the body of a visitor class, the targets are added to the dispatcher with the same name instead
+    of replacing it"""
+
+    def __setitem__(self, key, value):
+        if isinstance(value, Target):
+            dispatcher = self.get(key)
+            if not isinstance(dispatcher, Dispatcher):
+                raise TypeError(f'The target "{key}" of {value.param_type.__name__} is not preceded by an `on` method')
+            dispatcher.add_target(value.param_type, value.fn)
         else:
-            return inspect.getargspec(fn)
+            super().__setitem__(key, value)
+
+
+class VisitorMeta(type):
+    @classmethod
+    def __prepare__(mcs, name, bases, **kwargs):
+        return VisitorNamespace()
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        attributes = dict(namespace)
+        for key, value in namespace.items():
+            if isinstance(value, Dispatcher):
+                attributes[key] = value.build(key)
+                for typ, target in value.targets.items():
+                    attributes.setdefault(f'{key}_{typ.__name__}', target)
+        return super().__new__(mcs, name, bases, attributes)
+
+
+class Visitor(metaclass=VisitorMeta):
+    pass
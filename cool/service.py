@@ -0,0 +1,241 @@
+"""Execution of many Cool programs in warm worker processes.
+
+Each `python -m cool run` pays the start of the interpreter, the imports, the construction of the grammar and of the
+parser tables before running the program. A `WorkerPool` keeps processes that already paid it and sends them jobs, a
+job is a dict with the `source` of the program, its `stdin` and optionally the limits of the execution (`max_steps`,
+`max_objects`, `max_heap` and `timeout`), `prune` (False type checks the features that are not reachable from
+`Main.main`, as `run --no-prune`) and an `id` that is copied to the result. The result has the `stdout` and the
+`stderr` of the program, its exit `status`, the `timings` of each phase and the `stats` of the execution.
+
+Every worker runs one job at a time with a new context, scope and executor, so a job only shares with the following
+ones the parser and the imported modules. A job that kills its worker, or that does not finish before the
+`kill_timeout` of the pool, only loses its own result and the worker is replaced.
+
+`serve` answers the jobs sent to a socket, one JSON object per line, and `cool batch` runs the jobs of a JSONL file.
+"""
+import io
+import json
+import multiprocessing
+import os
+import queue
+import signal
+import socketserver
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, TextIO, Tuple, Union
+
+from cool import check_semantics, CoolLexer, CoolParser
+from cool.semantics.execution import ExecutionError, Executor, Input, LimitError, Limits, Output
+from cool.semantics.utils.scope import Context, Scope
+
+# Exit status of a job
+SUCCESS = 0
+COMPILATION_ERROR = 1
+EXECUTION_ERROR = 2
+LIMIT_EXCEEDED = 3
+CRASH = 4
+
+LIMITS = ('max_steps', 'max_objects', 'max_heap', 'timeout')
+
+# The workers start from a server process with the modules already imported, instead of forking the threads of the pool
+_context = multiprocessing.get_context('forkserver' if 'forkserver' in multiprocessing.get_all_start_methods()
+                                       else 'spawn')
+if _context.get_start_method() == 'forkserver':
+    _context.set_forkserver_preload(['cool.service'])
+
+_job_parser: Optional[CoolParser] = None
+
+
+def run_job(job: dict) -> dict:
+    """Parse, check and execute the program of the job and return its result"""
+    global _job_parser
+    if _job_parser is None:
+        _job_parser = CoolParser()
+    parser = _job_parser
+    parser._errors = []
+    parser.contains_errors = False
+
+    start = time.perf_counter()
+    timings: Dict[str, float] = {}
+    stats: Dict[str, float] = {}
+    stderr = []
+    sink = io.BytesIO()
+    status = SUCCESS
+    try:
+        text = job['source']
+        lexer = CoolLexer()
+        tokens = lexer(text)
+        program = None if lexer.contain_errors else parser(tokens)
+        timings['parse'] = time.perf_counter() - start
+        if lexer.contain_errors or parser.contains_errors or program is None:
+            stderr += lexer.errors if lexer.contain_errors else parser.errors
+            status = COMPILATION_ERROR
+        else:
+            program, _, context, errors = check_semantics(program, Scope(), Context(), [],
+                                                          reachable_only=job.get('prune', True))
+            timings['check'] = time.perf_counter() - start - timings['parse']
+            if errors:
+                stderr += errors
+                status = COMPILATION_ERROR
+            else:
+                executor = Executor(context, Output(sink), Input(io.BytesIO(job.get('stdin', '').encode())),
+                                    limits=Limits(*(job.get(name) for name in LIMITS)))
+                try:
+                    executor.visit(program, Scope())
+                except LimitError as e:
+                    stderr.append(e.text)
+                    status = LIMIT_EXCEEDED
+                except ExecutionError as e:
+                    stderr.append(e.text)
+                    status = EXECUTION_ERROR
+                except SystemExit:
+                    # Object.abort ends the program
+                    status = EXECUTION_ERROR
+                finally:
+                    stats = executor.stats()
+                    timings['execute'] = stats['time']
+    except Exception as e:
+        stderr.append(f'{type(e).__name__}: {e}')
+        status = CRASH
+    timings['total'] = time.perf_counter() - start
+
+    return {'id': job.get('id'), 'status': status, 'stdout': sink.getvalue().decode('utf-8', 'replace'),
+            'stderr': ''.join(f'{line}\n' for line in stderr), 'timings': timings, 'stats': stats}
+
+
+def _work(connection) -> None:
+    # The pool stops the workers, an interrupt of the terminal only stops the main process
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Build the parser before the first job
+    global _job_parser
+    _job_parser = CoolParser()
+    while True:
+        try:
+            job = connection.recv()
+        except EOFError:
+            return
+        connection.send(run_job(job))
+
+
+class Worker:
+    def __init__(self):
+        self.connection, child = _context.Pipe()
+        self.process = _context.Process(target=_work, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+
+    def run(self, job: dict, timeout: Optional[float]) -> Optional[dict]:
+        """Return the result of the job, or None if the worker died or did not answer before the timeout"""
+        try:
+            self.connection.send(job)
+            if self.connection.poll(timeout):
+                return self.connection.recv()
+        except (EOFError, OSError):
+            pass
+        return None
+
+    def close(self, kill: bool = False) -> None:
+        """Stop the worker after its current job, or right away if `kill` is True"""
+        if kill:
+            self.process.kill()
+        # The worker ends when it reads the end of the pipe
+        self.connection.close()
+        self.process.join()
+
+
+class WorkerPool:
+    """
+    Params
+    ------
+    - workers: int the number of worker processes
+    - limits: Dict[str, float] the limits of the jobs that do not give them
+    - kill_timeout: float the seconds that a job can take before its worker is killed, None waits forever. The
+      `timeout` of the job is checked by the executor and this one also stops the jobs that are out of the loops
+      and calls of the program
+    """
+
+    def __init__(self, workers: int, limits: Optional[Dict[str, float]] = None, kill_timeout: Optional[float] = None):
+        self.limits: Dict[str, float] = {name: value for name, value in (limits or {}).items() if value is not None}
+        self.kill_timeout: Optional[float] = kill_timeout
+        self.workers: int = workers
+        self.idle: queue.Queue = queue.Queue()
+        for _ in range(workers):
+            self.idle.put(Worker())
+
+    def run(self, job: dict) -> dict:
+        """Run the job in an idle worker, waiting for one if all are busy. It can be called from several threads"""
+        job = {**self.limits, **job}
+        start = time.perf_counter()
+        worker = self.idle.get()
+        try:
+            result = worker.run(job, self.kill_timeout)
+            if result is None:
+                worker.close(kill=True)
+                worker = Worker()
+                result = {'id': job.get('id'), 'status': CRASH, 'stdout': '', 'timings': {}, 'stats': {},
+                          'stderr': 'WorkerError: The worker running the job died or did not finish in time.\n'}
+        finally:
+            self.idle.put(worker)
+        result['timings']['wall'] = time.perf_counter() - start
+        return result
+
+    def close(self) -> None:
+        while not self.idle.empty():
+            self.idle.get().close()
+
+    def __enter__(self) -> 'WorkerPool':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def run_line(pool: WorkerPool, line: Union[str, bytes]) -> dict:
+    try:
+        return pool.run(json.loads(line))
+    except (ValueError, TypeError) as e:
+        return {'error': f'Invalid job: {e}'}
+
+
+def batch(pool: WorkerPool, jobs: TextIO, results: TextIO) -> None:
+    """Run the jobs of a JSONL stream in all the workers of the pool and write their results in the same order"""
+    with ThreadPoolExecutor(pool.workers) as executor:
+        for result in executor.map(lambda line: run_line(pool, line), (line for line in jobs if line.strip())):
+            results.write(json.dumps(result) + '\n')
+
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if line.strip():
+                self.wfile.write(json.dumps(run_line(self.server.pool, line)).encode() + b'\n')
+                self.wfile.flush()
+
+
+def serve(pool: WorkerPool, address: Union[str, Tuple[str, int]]) -> None:
+    """Answer the jobs sent to a Unix socket (if the address is a path) or to a TCP socket until interrupted, each
+    connection sends jobs and receives their results in the same order, one JSON object per line"""
+    if isinstance(address, str):
+        # The socket of a server that crashed stays in its path and makes the bind fail
+        _remove_socket(address)
+        server = socketserver.ThreadingUnixStreamServer(address, _JobHandler)
+    else:
+        server = socketserver.ThreadingTCPServer(address, _JobHandler)
+    server.daemon_threads = True
+    server.pool = pool
+    try:
+        with server:
+            server.serve_forever()
+    finally:
+        if isinstance(address, str):
+            _remove_socket(address)
+
+
+def _remove_socket(path: str) -> None:
+    """Remove the file of a Unix socket, the path is left alone if it is not a socket"""
+    try:
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            os.unlink(path)
+    except FileNotFoundError:
+        pass
@@ -1,9 +1,20 @@
+import io
+import json
 from pathlib import Path
 from typing import List, Tuple
 
 from cool import check_semantics, CoolLexer, CoolParser
+from cool.parsing import IncrementalParser, OffsetLexer, PositionParser, parse_parallel
 from cool.semantics import CodeBuilder
+from cool.semantics.coverage import Coverage
+from cool.semantics.execution import Executor, Input, LimitError, Limits, Output, Rope
+from cool.semantics.inference_cache import InferenceCache
+from cool.semantics.profiler import Profiler, Sampler
+from cool.semantics.reachability import reachable_features
+from cool.semantics.utils.astnodes import LetNode, VariableNode, walk
+from cool.semantics.utils.positions import PositionTable
 from cool.semantics.utils.scope import Context, Scope
+from cool.service import COMPILATION_ERROR, CRASH, LIMIT_EXCEEDED, SUCCESS, WorkerPool
 
 
 def tokenize(code):
@@ -61,6 +72,16 @@ def test_inference():
         assert not errors and CodeBuilder().visit(ast, 0) == result
 
 
+def test_inference_unification():
+    programs, results = get_programs('inference')
+
+    for program, result in zip(programs, results):
+        tokens, _ = tokenize(program)
+        ast, _ = parse(tokens)
+        ast, _, _, errors = check_semantics(ast, Scope(), Context(), [], engine='unification')
+        assert not errors and CodeBuilder().visit(ast, 0) == result
+
+
 def test_semantic():
     programs, results = get_programs('semantic')
 
@@ -71,4 +92,330 @@ def test_semantic():
         assert (parser.contains_errors or errors) and '\n'.join(parser.errors + errors) == result
 
 
+def test_incremental_parser():
+    programs, _ = get_programs('inference')
+
+    for program in programs:
+        parser = IncrementalParser()
+        parser.parse(program)
+
+        offset = program.rindex(';')
+        parser.edit(offset, offset, ';\n    extra: Int <- 1')
+        parser.edit(offset, offset + len(';\n    extra: Int'), ';\n    extra: String')
+
+        tokens, _ = tokenize(parser.text)
+        ast, _ = parse(tokens)
+        assert parser.full_parses == 1 and CodeBuilder().visit(parser.ast, 0) == CodeBuilder().visit(ast, 0)
+
+        # The positions are the ones of a new parse and the nodes of the replaced features left the table
+        ast = PositionParser()(OffsetLexer()(parser.text), PositionTable(parser.text))
+        nodes = list(walk(parser.ast))
+        assert [parser.positions.span(node) for node in nodes] == [ast.positions.span(node) for node in walk(ast)]
+        assert len(parser.positions) - len(parser.positions.free) == len(nodes)
+
+
+def test_positions():
+    code = 'class Main {\n    main(): Int {\n        1 + 2\n    };\n}\n'
+    ast = PositionParser()(OffsetLexer()(code), PositionTable(code))
+    method = ast.declarations[0].features[0]
+    plus = method.body
+
+    assert ast.positions.location(ast.declarations[0]) == (1, 1)
+    assert ast.positions.location(method) == (2, 5)
+    assert ast.positions.location(plus) == (3, 9)
+    assert code[slice(*ast.positions.span(plus))] == '1 + 2'
+
+    parser = IncrementalParser()
+    parser.parse(code)
+    parser.edit(0, 0, '\n')
+    plus = parser.ast.declarations[0].features[0].body
+    assert parser.positions.location(plus) == (4, 9)
+
+
+def test_parallel_parser():
+    programs, _ = get_programs('inference')
+    code = '\n'.join(programs)
+
+    ast, errors = parse_parallel(code, 2)
+    tokens, _ = tokenize(code)
+    expected, parser = parse(tokens)
+    assert errors == parser.errors == [] and CodeBuilder().visit(ast, 0) == CodeBuilder().visit(expected, 0)
+    ast, errors = parse_parallel(code, 2, positions=False)
+    assert not errors and ast.positions is None and CodeBuilder().visit(ast, 0) == CodeBuilder().visit(expected, 0)
+
+    code = code + '\nclass Broken {\n    x: Int <- "unterminated;\n};\n(* "class *)\nclass A { x: Int <- 1 };\n'
+    tokens, lexer = tokenize(code)
+    assert parse_parallel(code, 2) == (None, lexer.errors)
+
+
+def test_inference_fixpoint():
+    code = ('class Main {\n    main(): Object {\n        let x: AUTO_TYPE <- 1, y: AUTO_TYPE in {\n'
+            '            x <- "a";\n            y <- x;\n        }\n    };\n}\n')
+    tokens, _ = tokenize(code)
+    ast, _ = parse(tokens)
+    ast, _, _, errors = check_semantics(ast, Scope(), Context(), [])
+    let = ast.declarations[0].features[0].body
+
+    assert not errors and [_type for _, _type, _ in let.declarations] == ['Object', 'Object']
+
+
+def test_inference_deferred_calls():
+    code = ('class A {\n    f(): Int { 1 };\n}\nclass Main {\n    a: AUTO_TYPE <- new A;\n'
+            '    main(): AUTO_TYPE { a.f() };\n}\n')
+    for engine in ('graph', 'unification'):
+        tokens, _ = tokenize(code)
+        ast, _ = parse(tokens)
+        ast, _, _, errors = check_semantics(ast, Scope(), Context(), [], engine=engine)
+
+        assert not errors and ast.declarations[1].features[1].return_type == 'Int'
+
+    # The receiver of x.f is B until the type of m.make() reaches x, then the call goes to A.f
+    code = ('class A {\n    f(x: AUTO_TYPE): AUTO_TYPE { x };\n}\n'
+            'class B inherits A {\n    f(x: AUTO_TYPE): AUTO_TYPE { x + 1 };\n}\n'
+            'class M {\n    make(): A { new B };\n}\n'
+            'class Main {\n    main(): Object {\n'
+            '        let m: AUTO_TYPE <- new M, x: AUTO_TYPE <- new B in { x <- m.make(); x.f(1); }\n    };\n}\n')
+    for engine in ('graph', 'unification'):
+        tokens, _ = tokenize(code)
+        ast, _ = parse(tokens)
+        ast, _, _, errors = check_semantics(ast, Scope(), Context(), [], engine=engine)
+
+        f = ast.declarations[0].features[0]
+        assert not errors and (f.params, f.return_type) == ([('x', 'Int')], 'Int')
+
+
+def test_inference_cache(tmp_path):
+    programs, results = get_programs('inference')
+    code, result = programs[2], results[2]
+
+    nodes = []
+    for cached_groups in (0, 2):
+        ast = PositionParser()(OffsetLexer()(code), PositionTable(code))
+        stats = {}
+        ast, _, _, errors = check_semantics(ast, Scope(), Context(), [], stats, cache=InferenceCache(tmp_path / 'c'))
+        assert not errors and CodeBuilder().visit(ast, 0) == result and stats['cached_groups'] == cached_groups
+        nodes.append(stats['nodes'])
+
+    # The cached groups are left out of the inference graph
+    assert nodes[1] < nodes[0]
+
+
+def test_inference_graph_dump(tmp_path):
+    programs, _ = get_programs('inference')
+
+    for name in ('graph.json', 'graph.dot'):
+        tokens, _ = tokenize(programs[9])
+        ast, _ = parse(tokens)
+        check_semantics(ast, Scope(), Context(), [], dump_graph=tmp_path / name)
+
+    graph = json.loads((tmp_path / 'graph.json').read_text())
+    assert set(graph['timings']) == {'build', 'solve', 'substitution'}
+    assert {'kind': 'ConditionalNode', 'type': 'Mammal'} in [{k: n[k] for k in ('kind', 'type')} for n in graph['nodes']]
+    assert (tmp_path / 'graph.dot').read_text().count(' -> ') == len(graph['edges'])
+
+
+def test_reachable_features():
+    code = ('class Main {\n    a: A <- new A;\n    main(): Int { a.f() };\n    unused(): Int { (new B).g() };\n}\n'
+            'class A {\n    x: Int <- 1;\n    f(): Int { x };\n    g(): Int { "not checked" };\n}\n'
+            'class B inherits A {\n    y: Int;\n    g(): Int { y };\n}\n')
+    tokens, _ = tokenize(code)
+    ast, _ = parse(tokens)
+    reachable = reachable_features(ast)
+
+    assert sorted(feature.id for feature in reachable) == ['a', 'f', 'main', 'x']
+    assert not check_semantics(ast, Scope(), Context(), [], reachable_only=True)[3]
+
+    # The call in the dead method makes v an Object, so it starts void as without pruning
+    code = ('class Main inherits IO {\n    g(y: AUTO_TYPE, c: Bool): Object {\n'
+            '        let v: AUTO_TYPE in {\n            if c then v <- y else 0 fi;\n'
+            '            out_string(if isvoid v then "void" else "0" fi);\n        }\n'
+            '    };\n    main(): Object { g(3, false) };\n    dead(): Object { g("a", true) };\n}\n')
+    for reachable_only in (True, False):
+        tokens, _ = tokenize(code)
+        ast, _ = parse(tokens)
+        ast, _, context, errors = check_semantics(ast, Scope(), Context(), [], reachable_only=reachable_only)
+        sink = io.BytesIO()
+        Executor(context, Output(sink)).visit(ast, Scope())
+        assert not errors and sink.getvalue() == b'void'
+
+
+def test_buffered_output():
+    code = ('class Main inherits IO {\n    main(): Object {\n        let i: Int <- 0 in\n'
+            '            while i < 3 loop { out_int(i); out_string("\\n"); i <- i + 1; } pool\n    };\n}\n')
+    tokens, _ = tokenize(code)
+    ast, _ = parse(tokens)
+    ast, _, context, errors = check_semantics(ast, Scope(), Context(), [])
+
+    sink = io.BytesIO()
+    output = Output(sink, buffer_size=4)
+    executor = Executor(context, output)
+    executor.output.write('x')
+    assert sink.getvalue() == b'' and output.buffer == bytearray(b'x')
+
+    executor.visit(ast, Scope())
+    assert not errors and sink.getvalue() == b'x0\n1\n2\n' and not output.buffer
+
+
+def test_buffered_input(tmp_path):
+    code = ('class Main inherits IO {\n    main(): Object {\n'
+            '        { out_string(in_string().concat("!")); out_int(in_int() + in_int()); }\n    };\n}\n')
+    tokens, _ = tokenize(code)
+    ast, _ = parse(tokens)
+    ast, _, context, errors = check_semantics(ast, Scope(), Context(), [])
+
+    (tmp_path / 'input.txt').write_bytes(b'hello\n1\n2')
+    for reader in (Input(io.BytesIO(b'hello\n1\n2'), chunk_size=2), Input.from_file(tmp_path / 'input.txt')):
+        sink = io.BytesIO()
+        Executor(context, Output(sink), reader).visit(ast, Scope())
+        assert not errors and sink.getvalue() == b'hello!3' and reader.readline() is None
+
+
+def test_rope():
+    a = Rope.concat('ab', 'c')
+    b = Rope.concat(a, 'd')
+    c = Rope.concat(a, 'e')
+    d = Rope.concat(b, c)
+
+    assert a.pieces is b.pieces and c.pieces is not a.pieces
+    assert [str(x) for x in (a, b, c, d)] == ['abc', 'abcd', 'abce', 'abcdabce']
+    assert len(d) == 8 and d[2:5] == 'cda' and d == 'abcdabce' and 'abcd' == b and a != c
+
+
+def test_literal_constants():
+    code = ('class Main inherits IO {\n    main(): Object {\n        let i: Int <- 0 in\n'
+            '            while i < 2 loop { out_string("a\\tb\\n"); i <- i + 1; } pool\n    };\n}\n')
+    tokens, _ = tokenize(code)
+    ast, _ = parse(tokens)
+    ast, _, context, errors = check_semantics(ast, Scope(), Context(), [])
+
+    sink = io.BytesIO()
+    executor = Executor(context, Output(sink))
+    executor.visit(ast, Scope())
+    assert not errors and sink.getvalue() == b'a\tb\na\tb\n'
+    assert sorted(executor.constants) == ['"a\\tb\\n"', '0', '1', '2']
+
+
+def test_shared_instances():
+    code = ('class Main inherits IO {\n    a: Object;\n    b: Main;\n    main(): Object {\n'
+            '        { if a = b then out_string("void ") else 0 fi; out_int(7 / 2); out_int((0 - 7) / 2); }\n'
+            '    };\n}\n')
+    tokens, _ = tokenize(code)
+    ast, _ = parse(tokens)
+    ast, _, context, errors = check_semantics(ast, Scope(), Context(), [])
+
+    sink = io.BytesIO()
+    executor = Executor(context, Output(sink), small_ints=(-4, 4))
+    executor.visit(ast, Scope())
+    assert not errors and sink.getvalue() == b'void 3-3'
+    assert executor.int_instance(3) is executor.int_instance(1 + 2) and executor.int_instance(4).value == 4
+    assert executor.bool_instance(1 < 2) is executor.true
+
+    defaults = [executor.visit(LetNode([('x', _type, None)], VariableNode('x')), Scope())
+                for _type in ('Int', 'Bool', 'String')]
+    assert all(a is b for a, b in zip(defaults, [executor.int_instance(0), executor.false, executor.empty_string]))
+
+
+def test_profiler():
+    code = ('class Main inherits IO {\n    main(): Object { { new A; f(2); } };\n'
+            '    f(n: Int): Object { if n = 0 then out_int(0) else f(n - 1) fi };\n}\nclass A {};\n')
+    tokens, _ = tokenize(code)
+    ast, _ = parse(tokens)
+    ast, _, context, errors = check_semantics(ast, Scope(), Context(), [])
+
+    ticks = iter(range(100))
+    profiler = Profiler(clock=lambda: next(ticks))
+    Executor(context, Output(io.BytesIO()), profiler=profiler).visit(ast, Scope())
+
+    f = profiler.methods['Main.f']
+    assert not errors and (f.calls, f.total, f.exclusive) == (3, 7, 6) and profiler.methods['Main.main'].allocations == 1
+    assert profiler.classes == {'Main': 1, 'A': 1}
+    assert profiler.collapsed_stacks().splitlines()[0] == 'Main.main;Main.f;Main.f;Main.f;IO.out_int 1000000'
+
+
+def test_sampler():
+    code = ('class Main inherits IO {\n    main(): Object {\n        out_int(spin(20000))\n    };\n'
+            '    spin(n: Int): Int { { while 0 < n loop n <- n - 1 pool; n; } };\n}\n')
+    ast = PositionParser()(OffsetLexer()(code), PositionTable(code))
+    ast, _, context, errors = check_semantics(ast, Scope(), Context(), [])
+
+    sampler = Sampler(0.001, ast.positions)
+    executor = Executor(context, Output(io.BytesIO()))
+    sampler.start(executor.frames)
+    try:
+        executor.visit(ast, Scope())
+    finally:
+        sampler.stop()
+
+    stacks = dict(line.rsplit(' ', 1) for line in sampler.collapsed_stacks().splitlines())
+    assert not errors and not executor.frames
+    assert max(stacks, key=lambda stack: int(stacks[stack])) == '<program>;Main.main;Main.spin:3'
+
+
+def test_coverage():
+    code = ('class Main inherits IO {\n    main(): Object {\n        let i: Int <- 0 in\n'
+            '            while i < 3 loop\n                i <- i + 1\n            pool\n    };\n\n'
+            '    unused(): Object {\n        out_int(0)\n    };\n}\n')
+    ast = PositionParser()(OffsetLexer()(code), PositionTable(code))
+    ast, _, context, errors = check_semantics(ast, Scope(), Context(), [])
+
+    coverage = Coverage(ast)
+    Executor(context, Output(io.BytesIO()), coverage=coverage).visit(ast, Scope())
+
+    assert not errors and coverage.lines() == {3: 1, 4: 4, 5: 3, 10: 0}
+    assert coverage.listing().splitlines()[3:5] == ['        4:    4:            while i < 3 loop',
+                                                    '        3:    5:                i <- i + 1']
+    assert '#####:   10:        out_int(0)' in coverage.listing()
+    assert json.loads(json.dumps(coverage.to_dict()))['lines']['4'] == 4
+
+
+def test_limits():
+    code = ('class Main {\n    s: String <- "ab";\n'
+            '    main(): Object { while true loop { s <- s.concat("ab"); new Main; } pool };\n}\n')
+    tokens, _ = tokenize(code)
+    ast, _ = parse(tokens)
+    ast, _, context, errors = check_semantics(ast, Scope(), Context(), [])
+    assert not errors
+
+    # A concat only charges the bytes that it appends, so the heap grows linearly with the steps
+    for limits, limit, stats in [(Limits(max_steps=100), 'steps', {'steps': 101, 'objects': 100, 'heap': 14534}),
+                                 (Limits(max_objects=10), 'objects', {'steps': 11, 'objects': 11}),
+                                 (Limits(max_heap=1000), 'heap', {'steps': 8, 'heap': 1022})]:
+        try:
+            Executor(context, Output(io.BytesIO()), limits=limits).visit(ast, Scope())
+            assert False
+        except LimitError as e:
+            assert e.limit == limit and {key: e.stats[key] for key in stats} == stats
+
+    try:
+        Executor(context, Output(io.BytesIO()), limits=Limits(timeout=0.05, check_interval=1)).visit(ast, Scope())
+        assert False
+    except LimitError as e:
+        assert e.limit == 'time' and e.stats['time'] > 0.05
+
+    code = 'class Main {\n    f(n: Int): Int { f(n + 1) };\n    main(): Object { f(0) };\n}\n'
+    tokens, _ = tokenize(code)
+    ast, _ = parse(tokens)
+    ast, _, context, errors = check_semantics(ast, Scope(), Context(), [])
+    try:
+        Executor(context, Output(io.BytesIO()), limits=Limits(max_steps=1000000)).visit(ast, Scope())
+        assert False
+    except LimitError as e:
+        assert not errors and e.limit == 'depth' and e.stats['steps'] > 1
+
+
+def test_worker_pool():
+    echo = 'class Main inherits IO {\n    main(): Object { out_int(in_int() + 1) };\n}\n'
+    loop = 'class Main {\n    main(): Object { while true loop 0 pool };\n}\n'
+    with WorkerPool(1, {'max_steps': 1000}, kill_timeout=1) as pool:
+        results = [pool.run({'id': 'echo', 'source': echo, 'stdin': '41\n'}),
+                   pool.run({'source': echo.replace('+ 1', '+ true')}),
+                   pool.run({'source': loop}),
+                   pool.run({'source': loop, 'max_steps': None}),
+                   pool.run({'source': echo, 'stdin': '1\n'})]
+
+    assert [result['status'] for result in results] == [SUCCESS, COMPILATION_ERROR, LIMIT_EXCEEDED, CRASH, SUCCESS]
+    assert results[0]['id'] == 'echo' and results[0]['stdout'] == '42' and results[-1]['stdout'] == '2'
+    assert results[1]['stderr'].startswith('OperationError') and results[2]['stats']['steps'] == 1001
+
+
 test_inference()